@@ -9,39 +9,82 @@ Uso:
     python main.py                    # Executa pipeline completo
     python main.py --stage ingest     # Executa apenas ingestão
     python main.py --date 2024-01-15  # Executa para data específica
+    python main.py --date 2024-01-01 --end-date 2024-01-15  # Backfill de um intervalo
     python main.py --help             # Mostra ajuda
 """
 
 import argparse
+import functools
+import logging
+import re
 import sys
-from datetime import date, datetime
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
-# Adicionar src ao path para imports
-sys.path.append(str(Path(__file__).parent / "src"))
-
 from src.utils.logging_config import setup_logging, get_logger
-from src.ingest.exchange_api import DataIngester
+from src.pipeline.dag import Task, DAGPipeline, EXECUTOR_PROCESS, EXECUTOR_THREAD
+
+# Padrões pré-compilados para validação de argumentos
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_CCY_RE = re.compile(r'[A-Za-z]{3}')
 
 
-def parse_arguments():
+class _FastParser(argparse.ArgumentParser):
     """
-    Processa argumentos da linha de comando
+    ArgumentParser que reutiliza o formatter usado na validação de argumentos
     
-    Returns:
-        Namespace com argumentos processados
+    No Python 3.14+ cada add_argument cria dois formatters só para validar
+    help/metavar (com detecção de cores via variáveis de ambiente). Como esse
+    formatter não acumula estado, uma única instância basta. Em versões
+    anteriores o método não existe e a classe se comporta como a original.
     """
-    parser = argparse.ArgumentParser(
-        description='Pipeline de Cotações Cambiais com Python + LLM',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+    
+    _cached_formatter = None
+    
+    def _get_validation_formatter(self):
+        if self._cached_formatter is None:
+            self._cached_formatter = self._get_formatter()
+        return self._cached_formatter
+
+
+# Exemplos exibidos apenas no --help
+_EPILOG = """
 Exemplos de uso:
   python main.py                           # Pipeline completo para hoje
   python main.py --stage ingest            # Apenas ingestão
   python main.py --date 2024-01-15         # Data específica
+  python main.py --date 2024-01-01 --end-date 2024-01-15  # Intervalo de datas
   python main.py --currency EUR            # Moeda base diferente
   python main.py --log-level DEBUG         # Mais detalhes nos logs
         """
+
+
+def _help_requested(argv):
+    """
+    Indica se a linha de comando pede a ajuda (-h/--help)
+    """
+    return any(arg in ('-h', '--help') for arg in argv)
+
+
+def parse_arguments(argv=None):
+    """
+    Processa argumentos da linha de comando
+    
+    Args:
+        argv: Lista de argumentos (default: sys.argv[1:])
+    
+    Returns:
+        Namespace com argumentos processados
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    parser = _FastParser(
+        description='Pipeline de Cotações Cambiais com Python + LLM',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG if _help_requested(argv) else None
     )
     
     parser.add_argument(
@@ -57,6 +100,19 @@ Exemplos de uso:
         help='Data para processamento (formato: YYYY-MM-DD). Default: hoje'
     )
     
+    parser.add_argument(
+        '--end-date',
+        type=str,
+        help='Data final para processar um intervalo a partir de --date (formato: YYYY-MM-DD)'
+    )
+    
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=8,
+        help='Número de threads para estágios de I/O em backfills (default: 8)'
+    )
+    
     parser.add_argument(
         '--currency',
         type=str,
@@ -91,7 +147,31 @@ Exemplos de uso:
         help='Continuar pipeline mesmo se LLM falhar'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--force-llm',
+        action='store_true',
+        help='Regenerar insights LLM mesmo se o contexto não mudou'
+    )
+    
+    return parser.parse_args(argv)
+
+
+def _parse_iso_date(value):
+    """
+    Converte uma string YYYY-MM-DD em date
+    
+    Args:
+        value: Data em texto
+        
+    Returns:
+        date ou None se o formato/data for inválido
+    """
+    if not _DATE_RE.fullmatch(value):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
 
 
 def validate_arguments(args):
@@ -105,14 +185,27 @@ def validate_arguments(args):
         ValueError: Se argumentos forem inválidos
     """
     # Validar data se fornecida
+    start_date = None
     if args.date:
-        try:
-            datetime.strptime(args.date, '%Y-%m-%d')
-        except ValueError:
+        start_date = _parse_iso_date(args.date)
+        if start_date is None:
             raise ValueError(f"Data inválida: {args.date}. Use formato YYYY-MM-DD")
     
+    # Validar data final do intervalo
+    if args.end_date:
+        if not args.date:
+            raise ValueError("--end-date requer --date como data inicial")
+        end_date = _parse_iso_date(args.end_date)
+        if end_date is None:
+            raise ValueError(f"Data final inválida: {args.end_date}. Use formato YYYY-MM-DD")
+        if end_date < start_date:
+            raise ValueError("--end-date deve ser igual ou posterior a --date")
+    
+    if args.max_workers < 1:
+        raise ValueError("--max-workers deve ser maior que zero")
+    
     # Validar moeda
-    if len(args.currency) != 3 or not args.currency.isalpha():
+    if not _CCY_RE.fullmatch(args.currency):
         raise ValueError(f"Código de moeda inválido: {args.currency}. Use formato de 3 letras (ex: USD)")
     
     # Validar caminho de output
@@ -120,27 +213,103 @@ def validate_arguments(args):
         raise ValueError("Caminho de output não pode estar vazio")
 
 
+@dataclass(frozen=True)
+class Paths:
+    """
+    Caminhos usados pelos estágios, resolvidos uma vez por execução
+    """
+    __slots__ = ('raw', 'silver', 'gold', 'logs', 'reports')
+    
+    raw: Path
+    silver: Path
+    gold: Path
+    logs: Path
+    reports: Path
+    
+    def __reduce__(self):
+        # Necessário para enviar a instância (frozen + __slots__) a outros processos
+        return (Paths, (self.raw, self.silver, self.gold, self.logs, self.reports))
+    
+    @classmethod
+    def from_output_path(cls, output_path):
+        """
+        Monta os caminhos a partir do diretório base de dados
+        
+        Args:
+            output_path: Caminho base (--output-path)
+            
+        Returns:
+            Paths: Caminhos das camadas e de logs/relatórios
+        """
+        base_path = Path(output_path)
+        return cls(
+            raw=base_path / 'raw',
+            silver=base_path / 'silver',
+            gold=base_path / 'gold',
+            logs=Path('logs'),
+            reports=Path('outputs/reports')
+        )
+
+
+# Configuração já aplicada por setup_environment (evita handlers de log duplicados)
+_env_ready_for = None
+
+
 def setup_environment(args):
     """
     Configura ambiente de execução
     
+    Define args.paths; chamadas repetidas com a mesma configuração não
+    refazem o restante.
+    
     Args:
         args: Argumentos processados
     """
-    # Configurar logging
+    global _env_ready_for
+    
+    args.paths = Paths.from_output_path(args.output_path)
+    
+    env_key = (args.log_level, args.log_format, args.output_path)
+    if _env_ready_for == env_key:
+        return
+    
+    # Configurar logging (também cria o diretório 'logs')
     setup_logging(
         log_level=args.log_level,
         log_format=args.log_format,
-        log_file_path='logs'
+        log_file_path=str(args.paths.logs)
     )
     
-    # Criar diretórios necessários
-    base_path = Path(args.output_path)
-    for subdir in ['raw', 'silver', 'gold']:
-        (base_path / subdir).mkdir(parents=True, exist_ok=True)
+    # Criar diretórios necessários em uma única passada
+    dirs = {args.paths.raw, args.paths.silver, args.paths.gold, args.paths.reports}
+    for directory in dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+    
+    _env_ready_for = env_key
+
+
+class StageError(RuntimeError):
+    """
+    Falha reportada por um estágio (relatório com status diferente de 'success')
+    """
+
+
+@functools.lru_cache(maxsize=4)
+def _get_ingester(raw_path):
+    """
+    Retorna um DataIngester por diretório raw, reutilizado entre datas
+    
+    Mantém a mesma sessão HTTP (e suas conexões) em backfills.
+    
+    Args:
+        raw_path: Caminho da camada raw
+        
+    Returns:
+        DataIngester: Instância compartilhada
+    """
+    from src.ingest.exchange_api import DataIngester
     
-    Path('logs').mkdir(exist_ok=True)
-    Path('outputs/reports').mkdir(parents=True, exist_ok=True)
+    return DataIngester(raw_data_path=raw_path)
 
 
 def run_ingest_stage(args, logger):
@@ -156,13 +325,14 @@ def run_ingest_stage(args, logger):
     """
     logger.info("=== INICIANDO ETAPA DE INGESTÃO ===")
     
+    from requests import RequestException
+    
     try:
-        # Determinar data alvo
-        target_date = date.fromisoformat(args.date) if args.date else date.today()
+        # Data alvo resolvida uma única vez em main()
+        target_date = args.target_date
         
-        # Inicializar ingester
-        raw_path = Path(args.output_path) / 'raw'
-        ingester = DataIngester(raw_data_path=str(raw_path))
+        # Obter ingester (reutilizado entre datas do mesmo diretório)
+        ingester = _get_ingester(str(args.paths.raw))
         
         # Coletar e salvar dados
         output_file = ingester.collect_and_save_daily_rates(
@@ -170,16 +340,17 @@ def run_ingest_stage(args, logger):
             target_date=target_date
         )
         
-        logger.info(
-            "Etapa de ingestão concluída com sucesso",
-            output_file=output_file,
-            target_date=target_date.isoformat(),
-            base_currency=args.currency.upper()
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Etapa de ingestão concluída com sucesso",
+                output_file=output_file,
+                target_date=target_date.isoformat(),
+                base_currency=args.currency.upper()
+            )
         
         return output_file
         
-    except Exception as e:
+    except (RequestException, ValueError, OSError) as e:
         logger.error(
             "Falha na etapa de ingestão",
             error=str(e),
@@ -207,30 +378,28 @@ def run_transform_stage(args, logger, input_file=None):
     try:
         from src.transform.data_processor import DataTransformer
         
-        # Determinar data alvo
-        target_date = date.fromisoformat(args.date) if args.date else date.today()
+        # Data alvo resolvida uma única vez em main()
+        target_date = args.target_date
         
         # Inicializar transformer
-        raw_path = Path(args.output_path) / 'raw'
-        silver_path = Path(args.output_path) / 'silver'
-        
         transformer = DataTransformer(
-            raw_data_path=str(raw_path),
-            silver_data_path=str(silver_path)
+            raw_data_path=str(args.paths.raw),
+            silver_data_path=str(args.paths.silver)
         )
         
         # Processar transformação
         report = transformer.process_date(target_date)
         
         if report['status'] == 'success':
-            logger.info(
-                "Etapa de transformação concluída com sucesso",
-                output_file=report['output']['silver_file'],
-                target_date=target_date.isoformat(),
-                final_records=report['output']['final_records'],
-                quality_score=report['quality']['overall_quality_score'],
-                execution_time=report['execution_time_seconds']
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Etapa de transformação concluída com sucesso",
+                    output_file=report['output']['silver_file'],
+                    target_date=target_date.isoformat(),
+                    final_records=report['output']['final_records'],
+                    quality_score=report['quality']['overall_quality_score'],
+                    execution_time=report['execution_time_seconds']
+                )
             
             return report['output']['silver_file']
         else:
@@ -239,9 +408,9 @@ def run_transform_stage(args, logger, input_file=None):
                 error=report['error'],
                 target_date=target_date.isoformat()
             )
-            raise Exception(f"Transformação falhou: {report['error']}")
+            raise StageError(f"Transformação falhou: {report['error']}")
         
-    except Exception as e:
+    except (StageError, ValueError, KeyError, OSError) as e:
         logger.error(
             "Erro na etapa de transformação",
             error=str(e),
@@ -268,41 +437,39 @@ def run_load_stage(args, logger, input_file=None):
     try:
         from src.load.gold_processor import GoldLayerProcessor
         
-        # Determinar data alvo
-        target_date = date.fromisoformat(args.date) if args.date else date.today()
+        # Data alvo resolvida uma única vez em main()
+        target_date = args.target_date
         
         # Inicializar processor
-        silver_path = Path(args.output_path) / 'silver'
-        gold_path = Path(args.output_path) / 'gold'
-        
         processor = GoldLayerProcessor(
-            silver_path=str(silver_path),
-            gold_path=str(gold_path)
+            silver_path=str(args.paths.silver),
+            gold_path=str(args.paths.gold)
         )
         
         # Processar Gold Layer (30 dias de histórico)
         report = processor.process_gold_layer(target_date, days_back=30)
         
         if report['status'] == 'success':
-            logger.info(
-                "Etapa de carga concluída com sucesso",
-                target_date=target_date.isoformat(),
-                files_created=report['output']['total_files'],
-                currencies_analyzed=report['processing']['currencies_analyzed'],
-                execution_time=report['execution_time_seconds']
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Etapa de carga concluída com sucesso",
+                    target_date=target_date.isoformat(),
+                    files_created=report['output']['total_files'],
+                    currencies_analyzed=report['processing']['currencies_analyzed'],
+                    execution_time=report['execution_time_seconds']
+                )
             
-            # Mostrar insights principais
-            overview = report['insights']['market_overview']
+                # Mostrar insights principais
+                overview = report['insights']['market_overview']
             
-            logger.info(
-                "Insights principais",
-                currencies_analyzed=overview['total_currencies'],
-                days_analyzed=overview['days_analyzed'],
-                min_rate=f"{overview['rate_statistics']['min_rate']:.4f}",
-                max_rate=f"{overview['rate_statistics']['max_rate']:.4f}",
-                data_quality=overview['market_sentiment']['data_quality']
-            )
+                logger.info(
+                    "Insights principais",
+                    currencies_analyzed=overview['total_currencies'],
+                    days_analyzed=overview['days_analyzed'],
+                    min_rate=f"{overview['rate_statistics']['min_rate']:.4f}",
+                    max_rate=f"{overview['rate_statistics']['max_rate']:.4f}",
+                    data_quality=overview['market_sentiment']['data_quality']
+                )
             
             return report['output']['files_created']['consolidated']
         else:
@@ -311,9 +478,9 @@ def run_load_stage(args, logger, input_file=None):
                 error=report['error'],
                 target_date=target_date.isoformat()
             )
-            raise Exception(f"Carga falhou: {report['error']}")
+            raise StageError(f"Carga falhou: {report['error']}")
         
-    except Exception as e:
+    except (StageError, ValueError, KeyError, OSError) as e:
         logger.error(
             "Erro na etapa de carga",
             error=str(e),
@@ -340,39 +507,37 @@ def run_llm_stage(args, logger, input_file=None):
     try:
         from src.llm.insight_generator import InsightGenerator
         
-        # Determinar data alvo
-        target_date = date.fromisoformat(args.date) if args.date else date.today()
+        # Data alvo resolvida uma única vez em main()
+        target_date = args.target_date
         
         # Inicializar generator
-        gold_path = Path(args.output_path) / 'gold'
-        outputs_path = Path('outputs/reports')
-        
         generator = InsightGenerator(
-            gold_path=str(gold_path),
-            outputs_path=str(outputs_path)
+            gold_path=str(args.paths.gold),
+            outputs_path=str(args.paths.reports)
         )
         
         # Processar insights
-        report = generator.process_insights(target_date)
+        report = generator.process_insights(target_date, force=args.force_llm)
         
         if report['status'] == 'success':
-            logger.info(
-                "Etapa de insights LLM concluída com sucesso",
-                target_date=target_date.isoformat(),
-                files_created=report['output']['total_files'],
-                model_used=report['insights_preview']['model_used'],
-                execution_time=report['execution_time_seconds']
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Etapa de insights LLM concluída com sucesso",
+                    target_date=target_date.isoformat(),
+                    files_created=report['output']['total_files'],
+                    model_used=report['insights_preview']['model_used'],
+                    execution_time=report['execution_time_seconds']
+                )
             
-            # Mostrar preview dos insights
-            logger.info(
-                "Preview do resumo executivo",
-                preview=report['insights_preview']['summary_preview']
-            )
+                # Mostrar preview dos insights
+                logger.info(
+                    "Preview do resumo executivo",
+                    preview=report['insights_preview']['summary_preview']
+                )
             
-            # Listar arquivos criados
-            for file_type, file_path in report['output']['files_created'].items():
-                logger.info(f"Relatório {file_type} criado: {file_path}")
+                # Listar arquivos criados
+                for file_type, file_path in report['output']['files_created'].items():
+                    logger.info(f"Relatório {file_type} criado: {file_path}")
             
             return report['output']['files_created'].get('json_report')
             
@@ -387,7 +552,7 @@ def run_llm_stage(args, logger, input_file=None):
                 logger.warning("Continuando pipeline apesar do erro LLM (--skip-llm-on-error)")
                 return None
             else:
-                raise Exception(f"Insights LLM falhou: {report['error']}")
+                raise StageError(f"Insights LLM falhou: {report['error']}")
         
     except ImportError as e:
         logger.error(
@@ -402,7 +567,7 @@ def run_llm_stage(args, logger, input_file=None):
         else:
             raise
             
-    except Exception as e:
+    except (StageError, ValueError, KeyError, OSError) as e:
         logger.error(
             "Erro na etapa de insights LLM",
             error=str(e),
@@ -417,15 +582,130 @@ def run_llm_stage(args, logger, input_file=None):
             raise
 
 
+# Tabela de estágios em ordem de execução; cada estágio de uma data depende do anterior
+STAGES = (
+    ('ingest', run_ingest_stage),
+    ('transform', run_transform_stage),
+    ('load', run_load_stage),
+    ('llm', run_llm_stage),
+)
+_STAGE_RUNNERS = dict(STAGES)
+
+
+def expand_target_dates(args):
+    """
+    Expande --date/--end-date na lista de datas a processar
+    
+    Args:
+        args: Argumentos processados
+        
+    Returns:
+        List[date]: Datas em ordem crescente
+    """
+    start_date = args.target_date
+    end_date = date.fromisoformat(args.end_date) if args.end_date else start_date
+    
+    return [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+
+
+def run_stage_for_date(stage, args, input_file=None, *window_outputs):
+    """
+    Executa um estágio para a data definida em args.date
+    
+    Função de módulo (serializável) para poder rodar em outro processo.
+    
+    Args:
+        stage: Nome do estágio ('ingest', 'transform', 'load' ou 'llm')
+        args: Argumentos processados, com args.date apontando para a data alvo
+        input_file: Saída do estágio anterior (opcional)
+        window_outputs: Saídas das transformações de datas anteriores das quais
+            o estágio depende (só ordenam a execução; não são usadas)
+        
+    Returns:
+        Saída do estágio
+    """
+    runner = _STAGE_RUNNERS.get(stage)
+    if runner is None:
+        raise ValueError(f"Estágio desconhecido: {stage}")
+    
+    logger = get_logger("main")
+    
+    # Ingestão é o primeiro estágio e não recebe arquivo de entrada
+    if stage == 'ingest':
+        return runner(args, logger)
+    return runner(args, logger, input_file)
+
+
+def build_pipeline_tasks(args, target_dates):
+    """
+    Monta as tarefas do DAG: para cada data, ingest → transform → load → llm
+    
+    Ingestão e transformação de datas diferentes não dependem entre si, então a
+    ingestão do dia N+1 pode rodar enquanto o dia N ainda está em transformação.
+    Já o load[d] lê a janela de 30 dias do Silver: ele também depende de todo
+    transform[d'] com d' < d, para nunca ler um arquivo ausente ou pela metade.
+    
+    Args:
+        args: Argumentos processados
+        target_dates: Datas a processar
+        
+    Returns:
+        Tuple[List[Task], List[str]]: Tarefas e nome da última tarefa de cada data
+    """
+    stages = [name for name, _ in STAGES] if args.stage == 'all' else [args.stage]
+    
+    # Processos só compensam quando há várias datas para transformar em paralelo
+    transform_executor = EXECUTOR_PROCESS if len(target_dates) > 1 else EXECUTOR_THREAD
+    
+    tasks = []
+    final_tasks = []
+    
+    # Transformações de cada data, para as dependências da janela do load
+    transform_names = {
+        d: f"transform[{d.isoformat()}]" for d in target_dates
+    } if 'transform' in stages else {}
+    
+    for target_date in target_dates:
+        date_args = argparse.Namespace(**{
+            **vars(args),
+            'date': target_date.isoformat(),
+            'target_date': target_date
+        })
+        previous = None
+        
+        for stage in stages:
+            name = f"{stage}[{target_date.isoformat()}]"
+            deps = (previous,) if previous else ()
+            if stage == 'load':
+                deps += tuple(transform_names[d] for d in sorted(transform_names) if d < target_date)
+            tasks.append(Task(
+                name=name,
+                fn=run_stage_for_date,
+                deps=deps,
+                args=(stage, date_args),
+                executor=transform_executor if stage == 'transform' else EXECUTOR_THREAD
+            ))
+            previous = name
+        
+        final_tasks.append(previous)
+    
+    return tasks, final_tasks
+
+
 def main():
     """
     Função principal do pipeline
     """
+    start_ns = time.perf_counter_ns()
+    
     try:
         # Processar argumentos
         args = parse_arguments()
         validate_arguments(args)
         
+        # Resolver a data alvo uma vez (evita divergência se a execução cruzar a meia-noite)
+        args.target_date = date.fromisoformat(args.date) if args.date else date.today()
+        
         # Configurar ambiente
         setup_environment(args)
         
@@ -437,32 +717,25 @@ def main():
             "=== INICIANDO PIPELINE DE COTAÇÕES CAMBIAIS ===",
             stage=args.stage,
             date=args.date or "hoje",
+            end_date=args.end_date,
             currency=args.currency,
             log_level=args.log_level,
             timestamp=datetime.now().isoformat()
         )
         
-        # Variáveis para rastrear arquivos entre estágios
-        output_file = None
-        
-        # Executar estágios baseado na seleção
-        if args.stage in ['ingest', 'all']:
-            output_file = run_ingest_stage(args, logger)
-        
-        if args.stage in ['transform', 'all']:
-            output_file = run_transform_stage(args, logger, output_file)
-        
-        if args.stage in ['load', 'all']:
-            output_file = run_load_stage(args, logger, output_file)
+        # Montar e executar o DAG de estágios (uma cadeia por data)
+        target_dates = expand_target_dates(args)
+        tasks, final_tasks = build_pipeline_tasks(args, target_dates)
         
-        if args.stage in ['llm', 'all']:
-            output_file = run_llm_stage(args, logger, output_file)
+        results = DAGPipeline(tasks, max_workers=args.max_workers).run()
+        output_file = results[final_tasks[-1]]
         
         # Log de conclusão
         logger.info(
             "=== PIPELINE CONCLUÍDO COM SUCESSO ===",
             stage=args.stage,
-            execution_time=(datetime.now()).isoformat(),
+            dates_processed=len(target_dates),
+            elapsed_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             final_output=output_file
         )
         
@@ -8,9 +8,15 @@ coleta de dados da Exchange Rate API.
 Classes principais:
 - ExchangeRateAPIClient: Cliente para interagir com a API
 - DataIngester: Orquestrador da ingestão e armazenamento
+- RateCache: Cache SQLite das respostas por (moeda base, data)
+- CircuitBreaker: Rejeição imediata de chamadas durante indisponibilidade da API
+- HTTP2Session: Sessão HTTP/2 opcional (httpx) com interface do requests
 """
 
 from .exchange_api import ExchangeRateAPIClient, DataIngester
+from .rate_cache import RateCache
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .http2_session import HTTP2Session
 
 __version__ = "1.0.0"
-__all__ = ["ExchangeRateAPIClient", "DataIngester"]
\ No newline at end of file
+__all__ = ["ExchangeRateAPIClient", "DataIngester", "RateCache", "CircuitBreaker", "CircuitOpenError", "HTTP2Session"]
\ No newline at end of file
@@ -0,0 +1,134 @@
+"""
+Circuit Breaker da Exchange Rate API
+Pipeline de Cotações Cambiais - MBA Data Engineering
+
+Este módulo é responsável por:
+1. Contar falhas consecutivas de comunicação com a API
+2. Abrir o circuito após o limite, rejeitando chamadas imediatamente
+3. Liberar uma chamada de teste (half-open) após o tempo de espera
+4. Manter um breaker por URL base, isolando backends diferentes
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+import requests
+import structlog
+
+logger = structlog.get_logger()
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(requests.RequestException):
+    """
+    Chamada rejeitada porque o circuito está aberto
+    """
+
+
+class CircuitBreaker:
+    """
+    Máquina de estados CLOSED → OPEN → HALF_OPEN
+
+    Atributos:
+        failure_threshold: Falhas consecutivas que abrem o circuito
+        reset_timeout: Segundos em OPEN antes de liberar uma chamada de teste
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        """
+        Inicializa o breaker fechado
+
+        Args:
+            failure_threshold: Falhas consecutivas que abrem o circuito
+            reset_timeout: Tempo (segundos) até a próxima chamada de teste
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        Estado atual do circuito
+        """
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Indica se uma chamada pode ser feita agora
+
+        Em OPEN, após reset_timeout, passa para HALF_OPEN e libera uma única
+        chamada de teste; as demais continuam rejeitadas até o resultado dela.
+
+        Returns:
+            True se a chamada pode prosseguir
+        """
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return True
+
+            if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = STATE_HALF_OPEN
+                logger.info("Circuit breaker em half-open, liberando chamada de teste")
+                return True
+
+            return False
+
+    def record_success(self) -> None:
+        """
+        Registra chamada bem-sucedida e fecha o circuito
+        """
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                logger.info("Circuit breaker fechado após chamada bem-sucedida")
+            self._state = STATE_CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """
+        Registra falha; abre o circuito no limite ou se a chamada de teste falhar
+        """
+        with self._lock:
+            self._failures += 1
+
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != STATE_OPEN:
+                    logger.warning(
+                        "Circuit breaker aberto",
+                        consecutive_failures=self._failures,
+                        reset_timeout=self.reset_timeout
+                    )
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+
+
+# Um breaker por URL base: a falha de um backend não bloqueia os outros
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(base_url: str, failure_threshold: int = 5, reset_timeout: float = 60.0) -> CircuitBreaker:
+    """
+    Obtém o breaker compartilhado da URL base (criando se necessário)
+
+    Args:
+        base_url: URL base da API
+        failure_threshold: Usado apenas na criação
+        reset_timeout: Usado apenas na criação
+
+    Returns:
+        CircuitBreaker associado à URL
+    """
+    with _breakers_lock:
+        breaker: Optional[CircuitBreaker] = _breakers.get(base_url)
+        if breaker is None:
+            breaker = CircuitBreaker(failure_threshold, reset_timeout)
+            _breakers[base_url] = breaker
+        return breaker
@@ -9,22 +9,95 @@ Este módulo é responsável por:
 4. Salvar dados brutos em formato JSON
 """
 
+import logging
 import os
-import json
+import random
+import re
+import sqlite3
 import requests
+from requests.adapters import HTTPAdapter
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from pathlib import Path
 import structlog
 from dotenv import load_dotenv
 
-# Carregar variáveis de ambiente
-load_dotenv()
+from src.utils import fast_json
+from src.ingest.rate_cache import RateCache
+from src.ingest.circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+from src.ingest.http2_session import HAS_HTTP2, HTTP2Session
 
 # Configurar logger estruturado
 logger = structlog.get_logger()
 
+# Logger stdlib equivalente, usado só para checar o nível antes de montar campos caros
+# (funciona mesmo antes de o structlog ser configurado)
+_log_level_check = logging.getLogger(__name__)
+
+# Marcador no ambiente: o .env é lido uma vez e processos filhos herdam o resultado
+_DOTENV_MARKER = '_PIPELINE_DOTENV_LOADED'
+
+# Valores definidos via configure(), com precedência sobre as variáveis de ambiente
+_config_overrides: Dict[str, str] = {}
+
+# Arquivos brutos diários (YYYY-MM-DD.json ou YYYY-MM-DD_<BASE>.json, gravado
+# por collect_and_save_many), usados como fallback
+RAW_FILE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})(?:_([A-Z]{3}))?\.json$')
+
+# Campos obrigatórios da resposta da API (a tupla preserva a ordem das mensagens de erro)
+REQUIRED_RESPONSE_FIELDS_ORDER = ('result', 'base_code', 'conversion_rates')
+REQUIRED_RESPONSE_FIELDS = frozenset(REQUIRED_RESPONSE_FIELDS_ORDER)
+
+# Status HTTP transitórios, para os quais vale tentar novamente
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Cabeçalhos fixos de todas as requisições (definidos uma vez na sessão)
+DEFAULT_HEADERS = {
+    'User-Agent': 'Pipeline-Cotacoes-Cambiais/1.0',
+    'Accept': 'application/json'
+}
+
+
+def _load_env_once() -> None:
+    """
+    Carrega o arquivo .env na primeira necessidade, e não a cada import
+    """
+    if not os.environ.get(_DOTENV_MARKER):
+        load_dotenv()
+        os.environ[_DOTENV_MARKER] = '1'
+
+
+def mask_secret(text: str, secret: Optional[str]) -> str:
+    """
+    Substitui o segredo por *** (exceções do requests incluem a URL com a API key)
+    
+    Args:
+        text: Texto a sanitizar (ex: mensagem de exceção)
+        secret: Valor a esconder
+        
+    Returns:
+        Texto sem o segredo
+    """
+    if isinstance(secret, str) and secret and secret in text:
+        return text.replace(secret, '***')
+    return text
+
+
+def configure(api_key: Optional[str] = None, base_url: Optional[str] = None) -> None:
+    """
+    Define API key e/ou URL base usadas pelos clientes criados sem parâmetros
+    
+    Args:
+        api_key: Chave da API
+        base_url: URL base da API
+    """
+    if api_key is not None:
+        _config_overrides['api_key'] = api_key
+    if base_url is not None:
+        _config_overrides['base_url'] = base_url
+
 
 class ExchangeRateAPIClient:
     """
@@ -35,7 +108,15 @@ class ExchangeRateAPIClient:
         base_url: URL base da API
         timeout: Timeout para requisições
         retry_attempts: Número de tentativas em caso de falha
-        retry_delay: Delay entre tentativas (segundos)
+        retry_delay: Delay base do backoff exponencial entre tentativas (segundos)
+        max_delay: Teto do delay entre tentativas (segundos)
+        session: Sessão HTTP reutilizada entre chamadas (opcional)
+        circuit_breaker: Breaker que rejeita chamadas durante indisponibilidade da API
+        cache_ttl: Validade (segundos) das respostas em memória quando a API
+            não informa time_next_update_unix
+        total_deadline: Tempo máximo (segundos) de uma coleta, somando
+            tentativas e esperas
+        http2: Usar HTTP/2 via httpx na sessão criada pelo cliente
     """
     
     def __init__(
@@ -44,28 +125,67 @@ class ExchangeRateAPIClient:
         base_url: Optional[str] = None,
         timeout: int = 30,
         retry_attempts: int = 3,
-        retry_delay: int = 5
+        retry_delay: float = 0.5,
+        max_delay: float = 30.0,
+        session: Optional[requests.Session] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cache_ttl: float = 3600,
+        total_deadline: float = 45.0,
+        http2: Optional[bool] = None
     ):
         """
         Inicializa o cliente da API
         
         Args:
-            api_key: Chave da API (se None, pega do .env)
-            base_url: URL base da API (se None, pega do .env)
+            api_key: Chave da API (se None, usa configure() ou o .env)
+            base_url: URL base da API (se None, usa configure() ou o .env)
             timeout: Timeout em segundos
             retry_attempts: Número de tentativas
-            retry_delay: Delay entre tentativas
+            retry_delay: Delay base do backoff (dobra a cada tentativa)
+            max_delay: Teto do delay entre tentativas
+            session: Sessão HTTP com pool de conexões (se None, cria uma própria)
+            circuit_breaker: Circuit breaker (se None, usa o compartilhado da base_url)
+            cache_ttl: Validade padrão do cache em memória (segundos)
+            total_deadline: Prazo total de uma coleta, incluindo retries (segundos)
+            http2: Usar HTTP/2 (se None, lê EXCHANGE_API_HTTP2 do .env); ignorado
+                quando session é informada
         """
-        self.api_key = api_key or os.getenv('EXCHANGE_API_KEY')
-        self.base_url = base_url or os.getenv('EXCHANGE_API_BASE_URL', 'https://v6.exchangerate-api.com/v6')
+        if api_key is None or base_url is None or http2 is None:
+            _load_env_once()
+        
+        self.api_key = api_key or _config_overrides.get('api_key') or os.getenv('EXCHANGE_API_KEY')
+        self.base_url = (
+            base_url
+            or _config_overrides.get('base_url')
+            or os.getenv('EXCHANGE_API_BASE_URL', 'https://v6.exchangerate-api.com/v6')
+        )
         self.timeout = timeout
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
+        self.max_delay = max_delay
+        self.total_deadline = total_deadline
         
         # Validações
         if not self.api_key:
             raise ValueError("API key não encontrada. Verifique o arquivo .env")
         
+        # Sessão com keep-alive: conexões TCP/TLS reaproveitadas entre requisições
+        if http2 is None:
+            http2 = os.getenv('EXCHANGE_API_HTTP2', '').lower() in ('1', 'true', 'yes')
+        self.session = session if session is not None else create_http_session(http2=http2)
+        self.session.headers.update(DEFAULT_HEADERS)
+        
+        # Breaker compartilhado por URL base entre todas as instâncias
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(self.base_url)
+        
+        # Templates de URL resolvidos uma vez; o mascarado (sem a API key) é usado nos logs
+        self._url_template = f"{self.base_url}/{self.api_key}/latest/{{base}}"
+        self._masked_url_template = f"{self.base_url}/***/latest/{{base}}"
+        
+        # Cache em memória: moeda base -> (expira_em_unix, dados, corpo)
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Dict[str, Any], bytes]] = {}
+        
         logger.info(
             "Cliente API inicializado",
             api_key_length=len(self.api_key),
@@ -88,95 +208,201 @@ class ExchangeRateAPIClient:
             requests.RequestException: Em caso de erro na requisição
             ValueError: Em caso de resposta inválida da API
         """
-        url = f"{self.base_url}/{self.api_key}/latest/{base_currency}"
+        data, _ = self.get_latest_rates_raw(base_currency)
+        return data
+    
+    def get_latest_rates_raw(self, base_currency: str = 'USD') -> Tuple[Dict[str, Any], bytes]:
+        """
+        Busca as cotações e devolve também o corpo original da resposta
+        
+        O corpo é validado uma única vez e pode ser gravado em disco sem
+        nova serialização.
+        
+        Args:
+            base_currency: Código da moeda base (ex: 'USD', 'EUR')
+            
+        Returns:
+            Tupla (dados validados, corpo JSON em bytes)
+            
+        Raises:
+            CircuitOpenError: Se o circuit breaker estiver aberto
+            requests.Timeout: Se o prazo total (total_deadline) se esgotar
+            requests.RequestException: Em caso de erro na requisição
+            ValueError: Em caso de resposta inválida da API
+        """
+        # Respostas ainda válidas (até a próxima atualização da API) não geram requisição
+        entry = self._cache.get(base_currency)
+        if entry is not None and entry[0] > time.time():
+            logger.debug("Cotações servidas do cache em memória", base_currency=base_currency)
+            return entry[1], entry[2]
+        
+        url = self._url_template.format(base=base_currency)
         
         logger.info(
             "Iniciando coleta de cotações",
             base_currency=base_currency,
-            url=url.replace(self.api_key, "***")  # Mascarar API key nos logs
+            url=self._masked_url_template.format(base=base_currency)  # API key mascarada
         )
         
+        breaker = self.circuit_breaker
+        deadline = time.monotonic() + self.total_deadline
+        
         for attempt in range(1, self.retry_attempts + 1):
+            # Falhar rápido enquanto a API está indisponível
+            if not breaker.allow_request():
+                logger.warning("Requisição rejeitada pelo circuit breaker", base_currency=base_currency)
+                raise CircuitOpenError(f"Circuit breaker aberto para {self.base_url}")
+            
+            # Cada tentativa usa no máximo o tempo que resta do prazo total
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error("Prazo total da coleta esgotado", attempt=attempt, total_deadline=self.total_deadline)
+                raise requests.exceptions.Timeout(
+                    f"Prazo total de {self.total_deadline}s esgotado após {attempt - 1} tentativas"
+                )
+            
             try:
                 logger.info("Fazendo requisição", attempt=attempt, max_attempts=self.retry_attempts)
                 
-                response = requests.get(
-                    url,
-                    timeout=self.timeout,
-                    headers={
-                        'User-Agent': 'Pipeline-Cotacoes-Cambiais/1.0',
-                        'Accept': 'application/json'
-                    }
-                )
-                
-                # Log da resposta
-                logger.info(
-                    "Resposta recebida",
-                    status_code=response.status_code,
-                    response_size=len(response.content),
-                    attempt=attempt
-                )
+                # stream=True: o corpo só é baixado depois de conferido o status
+                response = self.session.get(url, timeout=min(self.timeout, remaining), stream=True)
                 
-                # Verificar se a requisição foi bem-sucedida
+                # Respostas de erro são descartadas sem ler o corpo (ex: páginas HTML)
+                if response.status_code >= 400:
+                    response.close()
                 response.raise_for_status()
                 
-                # Parse do JSON
-                data = response.json()
+                # Único buffer do corpo, reutilizado no parse, no cache e no arquivo bruto
+                body = response.content
+                
+                # Log da resposta
+                if _log_level_check.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Resposta recebida",
+                        status_code=response.status_code,
+                        response_size=len(body),
+                        attempt=attempt
+                    )
+                
+                # Parse do JSON direto do corpo recebido
+                data = fast_json.loads(body)
                 
                 # Validar estrutura da resposta
                 self._validate_api_response(data)
                 
-                logger.info(
-                    "Cotações coletadas com sucesso",
-                    base_currency=base_currency,
-                    num_rates=len(data.get('conversion_rates', {})),
-                    last_update=data.get('time_last_update_utc', 'N/A')
-                )
+                breaker.record_success()
                 
-                return data
+                expires_at = data.get('time_next_update_unix') or time.time() + self.cache_ttl
+                self._cache[base_currency] = (expires_at, data, body)
+                
+                if _log_level_check.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Cotações coletadas com sucesso",
+                        base_currency=base_currency,
+                        num_rates=len(data.get('conversion_rates', {})),
+                        last_update=data.get('time_last_update_utc', 'N/A')
+                    )
+                
+                return data, body
                 
             except requests.exceptions.Timeout:
+                breaker.record_failure()
                 logger.warning(
                     "Timeout na requisição",
                     attempt=attempt,
                     timeout=self.timeout
                 )
                 
-            except requests.exceptions.ConnectionError:
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                breaker.record_failure()
                 logger.warning(
                     "Erro de conexão",
-                    attempt=attempt
+                    attempt=attempt,
+                    error=mask_secret(str(e), self.api_key)
                 )
                 
             except requests.exceptions.HTTPError as e:
+                # A mensagem do requests contém a URL completa, inclusive a API key
+                safe_error = mask_secret(str(e), self.api_key)
                 logger.error(
                     "Erro HTTP",
                     attempt=attempt,
                     status_code=response.status_code,
-                    error=str(e)
+                    content_length=response.headers.get('Content-Length'),
+                    error=safe_error
                 )
                 
-                # Se for erro 4xx, não vale a pena tentar novamente
-                if 400 <= response.status_code < 500:
-                    raise
+                # Só status transitórios justificam nova tentativa; erros 4xx indicam
+                # que a API está de pé e não contam como indisponibilidade
+                if response.status_code in RETRYABLE_STATUS_CODES or response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    raise requests.exceptions.HTTPError(safe_error, response=response) from None
                     
-            except (json.JSONDecodeError, ValueError) as e:
+            except (fast_json.JSONDecodeError, ValueError) as e:
+                # JSON inválido ou resposta fora do formato não melhora com nova tentativa
+                breaker.record_failure()
                 logger.error(
                     "Erro no processamento da resposta",
                     attempt=attempt,
                     error=str(e)
                 )
+                raise
                 
             # Se não for a última tentativa, esperar antes de tentar novamente
             if attempt < self.retry_attempts:
-                logger.info(f"Aguardando {self.retry_delay}s antes da próxima tentativa...")
-                time.sleep(self.retry_delay)
+                # Não dormir além do prazo total
+                delay = min(self._backoff_delay(attempt), max(0.0, deadline - time.monotonic() - 1))
+                logger.info(f"Aguardando {delay:.2f}s antes da próxima tentativa...")
+                time.sleep(delay)
         
         # Se chegou aqui, todas as tentativas falharam
         error_msg = f"Falha ao coletar cotações após {self.retry_attempts} tentativas"
         logger.error(error_msg, base_currency=base_currency)
         raise requests.RequestException(error_msg)
     
+    def invalidate(self, base_currency: Optional[str] = None) -> None:
+        """
+        Descarta respostas do cache em memória
+        
+        Args:
+            base_currency: Moeda a descartar (se None, descarta todas)
+        """
+        if base_currency is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(base_currency, None)
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Calcula o delay antes da próxima tentativa (backoff exponencial com full jitter)
+        
+        O delay é sorteado entre 0 e min(max_delay, retry_delay * 2^(attempt-1)),
+        espalhando as novas tentativas de clientes que falharam ao mesmo tempo.
+        
+        Args:
+            attempt: Número da tentativa que acabou de falhar (1, 2, ...)
+            
+        Returns:
+            Delay em segundos
+        """
+        return random.uniform(0, min(self.max_delay, self.retry_delay * (2 ** (attempt - 1))))
+    
+    def close(self) -> None:
+        """
+        Fecha a sessão HTTP e libera as conexões do pool
+        """
+        self.session.close()
+    
+    def __enter__(self) -> 'ExchangeRateAPIClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def _validate_api_response(self, data: Dict[str, Any]) -> None:
         """
         Valida se a resposta da API tem a estrutura esperada
@@ -187,9 +413,18 @@ class ExchangeRateAPIClient:
         Raises:
             ValueError: Se a estrutura estiver inválida
         """
-        required_fields = ['result', 'base_code', 'conversion_rates']
+        # Caminho rápido: resposta válida passa por uma única verificação composta
+        rates = data.get('conversion_rates') if isinstance(data, dict) else None
+        if (
+            REQUIRED_RESPONSE_FIELDS.issubset(data)
+            and data['result'] == 'success'
+            and isinstance(rates, dict)
+            and rates
+        ):
+            return
         
-        for field in required_fields:
+        # Diagnóstico detalhado apenas quando a resposta é inválida
+        for field in REQUIRED_RESPONSE_FIELDS_ORDER:
             if field not in data:
                 raise ValueError(f"Campo obrigatório '{field}' não encontrado na resposta da API")
         
@@ -203,48 +438,285 @@ class ExchangeRateAPIClient:
             raise ValueError("Nenhuma cotação encontrada na resposta")
 
 
+def create_http_session(pool_connections: int = 8, pool_maxsize: int = 16, http2: bool = False):
+    """
+    Cria uma sessão HTTP com pool de conexões persistentes
+    
+    Args:
+        pool_connections: Número de hosts mantidos no pool
+        pool_maxsize: Conexões simultâneas por host
+        http2: Se True e httpx[http2] estiver instalado, usa HTTP/2 (requisições
+            concorrentes multiplexadas em uma conexão)
+        
+    Returns:
+        requests.Session configurada para HTTP e HTTPS, ou HTTP2Session
+    """
+    if http2:
+        if HAS_HTTP2:
+            return HTTP2Session(max_keepalive_connections=pool_maxsize)
+        logger.warning("HTTP/2 solicitado mas httpx[http2] não está instalado; usando requests")
+    
+    session = requests.Session()
+    # Sem retries no adapter: a política de retry fica no cliente
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def write_raw_envelope(
+    filepath: Path,
+    pipeline_metadata: Dict[str, Any],
+    body: bytes,
+    pretty: bool = False
+) -> int:
+    """
+    Grava o arquivo bruto {"pipeline_metadata": ..., "api_response": ...}
+    
+    No modo compacto (padrão) o corpo da API é copiado byte a byte para
+    dentro do envelope, sem desserializar e serializar novamente o payload.
+    O conteúdo é montado em um único buffer, gravado em um arquivo temporário
+    e publicado com os.replace, então leitores nunca veem um arquivo parcial.
+    
+    Args:
+        filepath: Caminho do arquivo de destino
+        pipeline_metadata: Metadados da coleta
+        body: Corpo JSON original da resposta da API (já validado)
+        pretty: Se True, grava o envelope inteiro indentado (inspeção manual)
+        
+    Returns:
+        Número de bytes gravados
+    """
+    if pretty:
+        payload = fast_json.dumps(
+            {"pipeline_metadata": pipeline_metadata, "api_response": fast_json.loads(body)},
+            indent=True
+        )
+    else:
+        payload = b''.join((
+            b'{"pipeline_metadata": ',
+            fast_json.dumps(pipeline_metadata),
+            b', "api_response": ',
+            body,
+            b'}\n'
+        ))
+    
+    tmp_path = Path(filepath).with_name(Path(filepath).name + '.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        try:
+            # os.write pode gravar parcialmente; normalmente uma única chamada basta
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, filepath)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    return len(payload)
+
+
 class DataIngester:
     """
     Classe responsável por orquestrar a ingestão e armazenamento dos dados
     """
     
-    def __init__(self, raw_data_path: str = 'data/raw'):
+    # Diretórios já criados neste processo (evita mkdir a cada instância)
+    _ready_dirs: Set[str] = set()
+    
+    def __init__(
+        self,
+        raw_data_path: str = 'data/raw',
+        cache_path: Optional[str] = None,
+        use_cache: bool = True,
+        max_stale_age_days: int = 3
+    ):
         """
         Inicializa o ingester
         
         Args:
             raw_data_path: Caminho para salvar dados brutos
+            cache_path: Arquivo SQLite do cache (se None, usa cache.db ao lado de raw_data_path)
+            use_cache: Se False, sempre consulta a API
+            max_stale_age_days: Idade máxima (dias) de um arquivo bruto usado como fallback
         """
         self.raw_data_path = Path(raw_data_path)
+        self.max_stale_age_days = max_stale_age_days
         self.api_client = ExchangeRateAPIClient()
         
-        # Criar diretório se não existir
-        self.raw_data_path.mkdir(parents=True, exist_ok=True)
+        if use_cache:
+            self.cache: Optional[RateCache] = RateCache(cache_path or self.raw_data_path.parent / 'cache.db')
+        else:
+            self.cache = None
+        
+        # Criar diretório se não existir (uma vez por caminho no processo)
+        raw_dir = os.path.abspath(self.raw_data_path)
+        if raw_dir not in DataIngester._ready_dirs:
+            self.raw_data_path.mkdir(parents=True, exist_ok=True)
+            DataIngester._ready_dirs.add(raw_dir)
         
         logger.info(
             "DataIngester inicializado",
-            raw_data_path=str(self.raw_data_path)
+            raw_data_path=str(self.raw_data_path),
+            cache_path=str(self.cache.db_path) if self.cache else None,
+            json_backend='orjson' if fast_json.HAS_ORJSON else 'json'
         )
     
+    def close(self) -> None:
+        """
+        Libera a sessão HTTP e a conexão do cache
+        """
+        self.api_client.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def __enter__(self) -> 'DataIngester':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _fetch_rates(self, base_currency: str, target_date: date) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Busca as cotações no cache local e, na falta, na API
+        
+        Falhas do cache nunca interrompem a coleta: entradas inválidas são
+        descartadas e a API é consultada normalmente.
+        
+        Args:
+            base_currency: Moeda base para cotações
+            target_date: Data alvo
+            
+        Returns:
+            Tupla (dados validados, corpo JSON em bytes)
+        """
+        if self.cache is not None:
+            try:
+                body = self.cache.get(base_currency, target_date)
+                if body is not None:
+                    data = fast_json.loads(body)
+                    self.api_client._validate_api_response(data)
+                    
+                    logger.info(
+                        "Cotações obtidas do cache local",
+                        base_currency=base_currency,
+                        target_date=target_date.isoformat()
+                    )
+                    return data, body
+                    
+            except ValueError as e:
+                logger.warning("Entrada inválida no cache local, descartando", error=str(e))
+                try:
+                    self.cache.delete(base_currency, target_date)
+                except sqlite3.Error:
+                    pass
+                    
+            except sqlite3.Error as e:
+                logger.warning("Cache local indisponível", error=str(e))
+        
+        data, body = self.api_client.get_latest_rates_raw(base_currency)
+        
+        if self.cache is not None:
+            try:
+                self.cache.put(base_currency, target_date, body)
+            except sqlite3.Error as e:
+                logger.warning("Falha ao gravar no cache local", error=str(e))
+        
+        return data, body
+    
+    def _find_stale_fallback(
+        self,
+        base_currency: str,
+        target_date: date
+    ) -> Optional[Tuple[Dict[str, Any], bytes, date, str]]:
+        """
+        Procura o arquivo bruto mais recente que possa substituir a coleta
+        
+        Considera apenas arquivos da mesma moeda base, com data até target_date
+        e no máximo max_stale_age_days dias mais antigos. Arquivos com sufixo de
+        outra moeda base (YYYY-MM-DD_<BASE>.json) nem são abertos; na mesma data,
+        o arquivo com o sufixo da moeda pedida tem preferência.
+        
+        Args:
+            base_currency: Moeda base para cotações
+            target_date: Data alvo
+            
+        Returns:
+            Tupla (resposta da API, corpo JSON em bytes, data do arquivo, caminho
+            do arquivo) ou None
+        """
+        candidates = []
+        try:
+            with os.scandir(self.raw_data_path) as entries:
+                for entry in entries:
+                    match = RAW_FILE_RE.match(entry.name)
+                    if not match:
+                        continue
+                    file_base = match.group(2)
+                    if file_base is not None and file_base != base_currency:
+                        continue
+                    try:
+                        file_date = date.fromisoformat(match.group(1))
+                    except ValueError:
+                        continue
+                    if 0 <= (target_date - file_date).days <= self.max_stale_age_days:
+                        candidates.append((file_date, file_base is not None, entry.path))
+        except OSError:
+            return None
+        
+        for file_date, _, path in sorted(candidates, reverse=True):
+            try:
+                content = fast_json.load_file(path)
+                if content['pipeline_metadata']['base_currency'] != base_currency:
+                    continue
+                api_response = content['api_response']
+                self.api_client._validate_api_response(api_response)
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            
+            return api_response, fast_json.dumps(api_response), file_date, path
+        
+        return None
+    
     def collect_and_save_daily_rates(
         self, 
         base_currency: str = 'USD',
-        target_date: Optional[date] = None
+        target_date: Optional[date] = None,
+        filename: Optional[str] = None,
+        pretty: bool = False
     ) -> str:
         """
         Coleta cotações e salva no formato YYYY-MM-DD.json
         
+        Se a API falhar (inclusive com circuit breaker aberto), usa o arquivo
+        bruto mais recente de até max_stale_age_days dias, marcado como
+        "stale" nos metadados.
+        
         Args:
             base_currency: Moeda base para cotações
             target_date: Data alvo (se None, usa data atual)
+            filename: Nome do arquivo de saída (se None, usa YYYY-MM-DD.json)
+            pretty: Se True, grava JSON indentado (padrão: compacto)
             
         Returns:
             Caminho do arquivo salvo
+            
+        Raises:
+            requests.RequestException: Se a API falhar e não houver fallback
+            ValueError: Se a resposta da API for inválida e não houver fallback
         """
         if target_date is None:
             target_date = date.today()
             
+        # Timestamp de parede para os metadados; relógio monotônico para a duração
         timestamp_start = datetime.now()
+        t0 = time.monotonic()
         
         logger.info(
             "Iniciando coleta diária de cotações",
@@ -254,52 +726,118 @@ class DataIngester:
         )
         
         try:
-            # Coletar dados da API
-            raw_data = self.api_client.get_latest_rates(base_currency)
-            
-            # Adicionar metadados do pipeline
-            enriched_data = {
-                "pipeline_metadata": {
-                    "collection_timestamp": timestamp_start.isoformat(),
-                    "collection_date": target_date.isoformat(),
-                    "base_currency": base_currency,
-                    "pipeline_version": "1.0.0"
-                },
-                "api_response": raw_data
-            }
-            
             # Definir nome do arquivo
-            filename = f"{target_date.strftime('%Y-%m-%d')}.json"
+            if filename is None:
+                filename = f"{target_date.strftime('%Y-%m-%d')}.json"
             filepath = self.raw_data_path / filename
             
-            # Salvar arquivo JSON
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(enriched_data, f, indent=2, ensure_ascii=False)
+            # Metadados do pipeline
+            pipeline_metadata = {
+                "collection_timestamp": timestamp_start.isoformat(),
+                "collection_date": target_date.isoformat(),
+                "base_currency": base_currency,
+                "pipeline_version": "1.0.0"
+            }
             
-            # Calcular tempo de execução
-            execution_time = (datetime.now() - timestamp_start).total_seconds()
+            try:
+                # Coletar dados do cache ou da API (dados validados + corpo original)
+                raw_data, body = self._fetch_rates(base_currency, target_date)
+                
+            except (requests.RequestException, ValueError) as e:
+                fallback = self._find_stale_fallback(base_currency, target_date)
+                if fallback is None:
+                    raise
+                
+                raw_data, body, source_date, source_path = fallback
+                reason = mask_secret(str(e), self.api_client.api_key)
+                logger.warning(
+                    "API indisponível, usando dados brutos anteriores",
+                    error=reason,
+                    source_date=source_date.isoformat(),
+                    target_date=target_date.isoformat()
+                )
+                
+                # O próprio arquivo de saída já existe e é válido: mantê-lo intacto
+                if Path(source_path) == filepath:
+                    return str(filepath)
+                
+                pipeline_metadata["stale"] = True
+                pipeline_metadata["fallback_reason"] = reason
+                pipeline_metadata["fallback_source_date"] = source_date.isoformat()
             
-            logger.info(
-                "Dados coletados e salvos com sucesso",
-                filepath=str(filepath),
-                file_size_kb=filepath.stat().st_size / 1024,
-                num_rates=len(raw_data.get('conversion_rates', {})),
-                execution_time_seconds=execution_time,
-                base_currency=base_currency
-            )
+            # Salvar arquivo JSON reaproveitando o corpo da resposta
+            bytes_written = write_raw_envelope(filepath, pipeline_metadata, body, pretty=pretty)
+            
+            # Campos do log (stat, contagem, duração) só são calculados se INFO estiver ativo
+            if _log_level_check.isEnabledFor(logging.INFO):
+                execution_time = time.monotonic() - t0
+                
+                logger.info(
+                    "Dados coletados e salvos com sucesso",
+                    filepath=str(filepath),
+                    file_size_kb=bytes_written / 1024,
+                    num_rates=len(raw_data.get('conversion_rates', {})),
+                    execution_time_seconds=execution_time,
+                    base_currency=base_currency
+                )
             
             return str(filepath)
             
         except Exception as e:
             logger.error(
                 "Erro durante coleta de dados",
-                error=str(e),
+                error=mask_secret(str(e), self.api_client.api_key),
                 error_type=type(e).__name__,
                 base_currency=base_currency,
                 target_date=target_date.isoformat()
             )
             raise
 
+    
+    def collect_and_save_many(
+        self,
+        base_currencies: List[str],
+        target_date: Optional[date] = None,
+        max_concurrency: int = 8
+    ) -> Dict[str, str]:
+        """
+        Coleta várias moedas base em paralelo, sobre a mesma sessão HTTP
+        
+        Cada moeda é salva em YYYY-MM-DD_<BASE>.json; as requisições
+        compartilham o pool de conexões, então o handshake TLS é amortizado
+        e as latências de rede se sobrepõem. Se a API falhar para uma moeda, o
+        fallback usa o arquivo mais recente dessa mesma moeda. A transformação
+        (camada Silver) continua lendo apenas YYYY-MM-DD.json.
+        
+        Args:
+            base_currencies: Moedas base (ex: ['USD', 'EUR', 'BRL'])
+            target_date: Data alvo (se None, usa data atual)
+            max_concurrency: Máximo de requisições simultâneas
+            
+        Returns:
+            Dicionário {moeda_base: caminho do arquivo salvo}
+            
+        Raises:
+            requests.RequestException: Primeira falha entre as moedas (após todas terminarem)
+        """
+        if target_date is None:
+            target_date = date.today()
+        
+        day = target_date.strftime('%Y-%m-%d')
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(base_currencies)))) as executor:
+            futures = {
+                base: executor.submit(
+                    self.collect_and_save_daily_rates,
+                    base,
+                    target_date,
+                    f"{day}_{base}.json"
+                )
+                for base in base_currencies
+            }
+        
+        return {base: future.result() for base, future in futures.items()}
+
 
 def main():
     """
@@ -308,11 +846,9 @@ def main():
     logger.info("=== INICIANDO PIPELINE DE INGESTÃO ===")
     
     try:
-        # Inicializar ingester
-        ingester = DataIngester()
-        
-        # Coletar dados para hoje
-        filepath = ingester.collect_and_save_daily_rates()
+        # Inicializar ingester e coletar dados para hoje
+        with DataIngester() as ingester:
+            filepath = ingester.collect_and_save_daily_rates()
         
         logger.info(
             "Pipeline de ingestão concluído com sucesso",
@@ -0,0 +1,124 @@
+"""
+Sessão HTTP/2 (httpx) com interface compatível com requests
+Pipeline de Cotações Cambiais - MBA Data Engineering
+
+Este módulo é responsável por:
+1. Multiplexar requisições concorrentes em uma única conexão HTTP/2
+2. Expor a mesma interface de sessão usada pelo ExchangeRateAPIClient
+3. Traduzir exceções do httpx para a hierarquia do requests, mantendo
+   retry, circuit breaker e fallback inalterados
+"""
+
+import logging
+from typing import Optional
+import requests
+
+try:
+    import httpx
+    import h2  # noqa: F401 - necessário para httpx.Client(http2=True)
+    HAS_HTTP2 = True
+except ImportError:
+    httpx = None
+    HAS_HTTP2 = False
+
+
+class HTTP2Response:
+    """
+    Adapta httpx.Response aos atributos de requests.Response usados pelo cliente
+    """
+
+    def __init__(self, response: 'httpx.Response'):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+
+    @property
+    def content(self) -> bytes:
+        """
+        Corpo da resposta (lido uma única vez)
+        """
+        try:
+            return self._response.read()
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+    def raise_for_status(self) -> None:
+        """
+        Levanta requests.HTTPError para status 4xx/5xx
+        """
+        if self.status_code >= 400:
+            kind = 'Client' if self.status_code < 500 else 'Server'
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} {kind} Error: {self._response.reason_phrase} for url: {self._response.url}",
+                response=self
+            )
+
+    def close(self) -> None:
+        """
+        Libera a stream da resposta
+        """
+        self._response.close()
+
+
+class HTTP2Session:
+    """
+    Sessão httpx com HTTP/2 e interface get()/headers/close() do requests.Session
+    """
+
+    def __init__(self, max_connections: int = 100, max_keepalive_connections: int = 20):
+        """
+        Inicializa o cliente httpx
+
+        Args:
+            max_connections: Máximo de conexões abertas
+            max_keepalive_connections: Conexões mantidas vivas no pool
+
+        Raises:
+            ImportError: Se httpx ou h2 não estiverem instalados
+        """
+        if not HAS_HTTP2:
+            raise ImportError("HTTP/2 requer httpx[http2]: pip install 'httpx[http2]'")
+
+        # O httpx registra a URL completa em INFO, o que exporia a API key
+        logging.getLogger('httpx').setLevel(logging.WARNING)
+
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            )
+        )
+        self.headers = self._client.headers
+
+    def get(self, url: str, timeout: Optional[float] = None, stream: bool = False) -> HTTP2Response:
+        """
+        Executa GET, com exceções traduzidas para requests
+
+        Args:
+            url: URL completa
+            timeout: Timeout em segundos
+            stream: Se True, o corpo só é lido ao acessar .content
+
+        Returns:
+            Resposta adaptada
+        """
+        try:
+            request = self._client.build_request('GET', url, timeout=timeout)
+            response = HTTP2Response(self._client.send(request, stream=True))
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+        if not stream:
+            response.content
+        return response
+
+    def close(self) -> None:
+        """
+        Fecha o cliente e suas conexões
+        """
+        self._client.close()
@@ -0,0 +1,131 @@
+"""
+Cache Local de Cotações (SQLite)
+Pipeline de Cotações Cambiais - MBA Data Engineering
+
+Este módulo é responsável por:
+1. Guardar o corpo bruto das respostas da API por (moeda base, data)
+2. Servir reexecuções e backfills sem nova requisição HTTP
+3. Expirar entradas do dia corrente, que ainda podem ser atualizadas pela API
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Optional, Union
+import structlog
+
+logger = structlog.get_logger()
+
+# Entradas do dia corrente expiram após 15 minutos; datas passadas não mudam mais
+TODAY_TTL_SECONDS = 15 * 60
+
+
+class RateCache:
+    """
+    Cache em SQLite das respostas da API, chaveado por (moeda base, data)
+
+    A conexão é aberta na primeira utilização e compartilhada entre threads
+    (protegida por lock), já que o DataIngester é reutilizado pelo DAG.
+    """
+
+    def __init__(self, db_path: Union[str, Path], today_ttl_seconds: int = TODAY_TTL_SECONDS):
+        """
+        Inicializa o cache
+
+        Args:
+            db_path: Caminho do arquivo SQLite (ex: data/cache.db)
+            today_ttl_seconds: Validade das entradas do dia corrente
+        """
+        self.db_path = Path(db_path)
+        self.today_ttl_seconds = today_ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Abre (uma única vez) a conexão e cria a tabela se necessário
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rates ("
+                " base TEXT NOT NULL,"
+                " day TEXT NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " PRIMARY KEY (base, day))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, base_currency: str, target_date: date) -> Optional[bytes]:
+        """
+        Busca o corpo da resposta em cache
+
+        Args:
+            base_currency: Moeda base
+            target_date: Data da coleta
+
+        Returns:
+            Corpo JSON em bytes, ou None se ausente/expirado
+        """
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT payload, fetched_at FROM rates WHERE base = ? AND day = ?",
+                (base_currency, target_date.isoformat())
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        payload, fetched_at = row
+        if target_date >= date.today() and time.time() - fetched_at > self.today_ttl_seconds:
+            logger.debug("Entrada do cache expirada", base_currency=base_currency, target_date=target_date.isoformat())
+            return None
+
+        return bytes(payload)
+
+    def put(self, base_currency: str, target_date: date, payload: bytes) -> None:
+        """
+        Grava (ou substitui) o corpo da resposta no cache
+
+        Args:
+            base_currency: Moeda base
+            target_date: Data da coleta
+            payload: Corpo JSON validado
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO rates (base, day, payload, fetched_at) VALUES (?, ?, ?, ?)",
+                    (base_currency, target_date.isoformat(), sqlite3.Binary(payload), time.time())
+                )
+
+    def delete(self, base_currency: str, target_date: date) -> None:
+        """
+        Remove uma entrada do cache (ex: payload corrompido)
+
+        Args:
+            base_currency: Moeda base
+            target_date: Data da coleta
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "DELETE FROM rates WHERE base = ? AND day = ?",
+                    (base_currency, target_date.isoformat())
+                )
+
+    def close(self) -> None:
+        """
+        Fecha a conexão com o banco
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -4,6 +4,7 @@ Geração de insights executivos com Large Language Models
 """
 
 from .insight_generator import InsightGenerator
+from .response_cache import ResponseCache
 
 __version__ = "1.0.0"
-__all__ = ["InsightGenerator"]
\ No newline at end of file
+__all__ = ["InsightGenerator", "ResponseCache"]
\ No newline at end of file
@@ -9,34 +9,112 @@ Este módulo é responsável por:
 4. Salvar relatórios estruturados
 """
 
-import json
+import hashlib
+import threading
+import httpx
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import structlog
-from openai import OpenAI
+from openai import OpenAI, DefaultHttpxClient
 import os
 from dotenv import load_dotenv
 
+from src.utils import fast_json
+from src.llm.response_cache import ResponseCache
+
+try:
+    import h2  # noqa: F401 - necessário para httpx.Client(http2=True)
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 # Carregar variáveis de ambiente
 load_dotenv()
 
 logger = structlog.get_logger()
 
+# Colunas do currency_summary efetivamente usadas na montagem do contexto
+SUMMARY_COLUMNS = ['currency', 'current_rate', 'trend_class', 'volatility_class', 'total_observations']
+
+# Colunas de classificação usadas nas distribuições
+CATEGORY_COLUMNS = ('trend_class', 'volatility_class')
+
+# Textos usados quando a API do LLM falha (não devem ser reaproveitados)
+FALLBACK_SUMMARY_TITLE = "RESUMO EXECUTIVO - COTAÇÕES CAMBIAIS"
+TECHNICAL_ANALYSIS_UNAVAILABLE = "Análise técnica não disponível devido a limitações de API."
+
+# Clientes OpenAI compartilhados por API key: novos InsightGenerator (ex: uma
+# instância por data em backfills) reaproveitam o pool de conexões do httpx
+_openai_clients: Dict[str, OpenAI] = {}
+_openai_clients_lock = threading.Lock()
+
+
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Obtém o cliente OpenAI compartilhado da API key (criando se necessário)
+    
+    Usa HTTP/2 quando httpx[http2] está instalado.
+    
+    Args:
+        api_key: Chave da API OpenAI
+        
+    Returns:
+        Cliente OpenAI com pool de conexões persistente
+    """
+    with _openai_clients_lock:
+        client = _openai_clients.get(api_key)
+        if client is None:
+            # DefaultHttpxClient mantém timeouts e redirects padrão do SDK
+            http_client = DefaultHttpxClient(
+                http2=HAS_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=8)
+            )
+            client = OpenAI(api_key=api_key, http_client=http_client)
+            _openai_clients[api_key] = client
+        return client
+
 
 class InsightGenerator:
     """
     Gerador de insights executivos usando LLM
     """
     
-    def __init__(self, gold_path: str = 'data/gold', outputs_path: str = 'outputs/reports'):
+    # Layouts fixos dos relatórios markdown e texto
+    _MD_TEMPLATE = (
+        "# Resumo Executivo - Cotações Cambiais\n\n"
+        "**Data:** {date}\n"
+        "**Gerado em:** {now}\n\n"
+        "---\n\n"
+        "{summary}"
+        "\n\n---\n\n"
+        "## Análise Técnica\n\n"
+        "{analysis}"
+    )
+    _TXT_TEMPLATE = (
+        "RELATÓRIO DIÁRIO - COTAÇÕES CAMBIAIS\n"
+        + "=" * 50 + "\n\n"
+        "Data: {date}\n"
+        "Gerado: {now}\n\n"
+        "{summary}"
+    )
+    
+    def __init__(self, gold_path: str = 'data/gold', outputs_path: str = 'outputs/reports',
+                 cache_path: Optional[str] = None, use_cache: bool = True):
         """
         Inicializa o gerador de insights
         
         Args:
             gold_path: Caminho dos dados Gold Layer
             outputs_path: Caminho para relatórios gerados
+            cache_path: Diretório do cache de respostas (padrão: <data>/cache/llm)
+            use_cache: Se False, sempre chama a API
         """
         self.gold_path = Path(gold_path)
         self.outputs_path = Path(outputs_path)
@@ -44,12 +122,17 @@ class InsightGenerator:
         # Criar diretório de outputs se não existir
         self.outputs_path.mkdir(parents=True, exist_ok=True)
         
+        # Cache das respostas: reexecuções da mesma data não repetem chamadas
+        self.cache: Optional[ResponseCache] = None
+        if use_cache:
+            self.cache = ResponseCache(cache_path or self.gold_path.parent / 'cache' / 'llm')
+        
         # Inicializar cliente OpenAI
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError("OPENAI_API_KEY não encontrada no arquivo .env")
             
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.model = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
         
         logger.info(
@@ -79,21 +162,27 @@ class InsightGenerator:
             # 1. Resumo por moeda
             summary_file = self.gold_path / f"currency_summary_{date_str}.parquet"
             if summary_file.exists():
-                data['currency_summary'] = pd.read_parquet(summary_file)
+                summary = self._read_parquet_columns(summary_file, SUMMARY_COLUMNS, ipc_sidecar=True)
+                
+                # Poucas classes distintas: category torna value_counts O(k) em vez de hash por linha
+                for column in CATEGORY_COLUMNS:
+                    if column in summary.columns and summary[column].dtype != 'category':
+                        summary[column] = summary[column].astype('category')
+                
+                data['currency_summary'] = summary
                 logger.debug(f"Carregado currency_summary: {len(data['currency_summary'])} moedas")
             
             # 2. Overview do mercado
             overview_file = self.gold_path / f"market_overview_{date_str}.json"
             if overview_file.exists():
-                with open(overview_file, 'r', encoding='utf-8') as f:
-                    data['market_overview'] = json.load(f)
+                data['market_overview'] = fast_json.load_file(overview_file)
                 logger.debug("Carregado market_overview")
             
-            # 3. Consolidado
+            # 3. Consolidado (apenas a contagem, lida do rodapé do Parquet)
             consolidated_file = self.gold_path / f"consolidated_{date_str}.parquet"
             if consolidated_file.exists():
-                data['consolidated'] = pd.read_parquet(consolidated_file)
-                logger.debug(f"Carregado consolidated: {len(data['consolidated'])} registros")
+                data['consolidated_rows'] = pq.ParquetFile(consolidated_file).metadata.num_rows
+                logger.debug(f"Carregado consolidated: {data['consolidated_rows']} registros")
             
             if not data:
                 raise FileNotFoundError(f"Nenhum arquivo Gold Layer encontrado para {date_str}")
@@ -110,6 +199,117 @@ class InsightGenerator:
             logger.error(f"Erro ao carregar dados Gold Layer: {str(e)}")
             raise
     
+    def _read_parquet_columns(self, file_path: Path, columns: List[str],
+                              ipc_sidecar: bool = False) -> pd.DataFrame:
+        """
+        Lê apenas as colunas necessárias de um arquivo Parquet
+        
+        Colunas ausentes no arquivo são ignoradas (os consumidores usam
+        row.get com valor padrão para as colunas opcionais).
+        
+        Args:
+            file_path: Caminho do arquivo Parquet
+            columns: Colunas desejadas
+            ipc_sidecar: Se True, reaproveita/grava uma cópia Arrow IPC (.arrow)
+                ao lado do Parquet, evitando decodificá-lo em reexecuções
+            
+        Returns:
+            DataFrame apenas com as colunas presentes
+        """
+        available = set(pq.read_schema(file_path).names)
+        projected = [column for column in columns if column in available]
+        
+        table = self._read_ipc_sidecar(file_path, projected) if ipc_sidecar else None
+        
+        if table is None:
+            table = pq.read_table(file_path, columns=projected, memory_map=True)
+            if ipc_sidecar:
+                self._write_ipc_sidecar(file_path, table)
+        
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    
+    @staticmethod
+    def _read_ipc_sidecar(file_path: Path, columns: List[str]) -> Optional[pa.Table]:
+        """
+        Lê a cópia Arrow IPC de um Parquet, se existir e estiver atualizada
+        
+        Args:
+            file_path: Caminho do arquivo Parquet de origem
+            columns: Colunas necessárias
+            
+        Returns:
+            Tabela mapeada em memória, ou None se ausente, antiga ou incompleta
+        """
+        sidecar = file_path.with_suffix('.arrow')
+        try:
+            if sidecar.stat().st_mtime < file_path.stat().st_mtime:
+                return None
+            table = pa.ipc.open_file(pa.memory_map(str(sidecar))).read_all()
+        except FileNotFoundError:
+            return None
+        except (OSError, pa.ArrowInvalid) as e:
+            logger.warning("Cópia Arrow IPC ilegível, relendo Parquet", file=str(sidecar), error=str(e))
+            return None
+        
+        if not set(columns) <= set(table.column_names):
+            return None
+        
+        logger.debug("Lido a partir da cópia Arrow IPC", file=str(sidecar))
+        return table.select(columns)
+    
+    @staticmethod
+    def _write_ipc_sidecar(file_path: Path, table: pa.Table) -> None:
+        """
+        Grava a cópia Arrow IPC de um Parquet (escrita atômica, falha não é fatal)
+        
+        Args:
+            file_path: Caminho do arquivo Parquet de origem
+            table: Tabela já lida do Parquet
+        """
+        sidecar = file_path.with_suffix('.arrow')
+        tmp_path = sidecar.with_name(sidecar.name + '.tmp')
+        try:
+            with pa.OSFile(str(tmp_path), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, sidecar)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("Não foi possível gravar cópia Arrow IPC", file=str(sidecar), error=str(e))
+    
+    @staticmethod
+    def _value_counts(series: pd.Series) -> Tuple[List[Any], np.ndarray]:
+        """
+        Contagem de valores com o kernel vetorizado do Arrow
+        
+        Nulos e categorias sem ocorrência são descartados; a ordem é por
+        contagem decrescente (empates na ordem de primeira ocorrência).
+        
+        Args:
+            series: Coluna a contar (texto ou category)
+            
+        Returns:
+            Tupla (valores, contagens)
+        """
+        counted = pc.value_counts(pa.Array.from_pandas(series))
+        values = counted.field('values')
+        counts = counted.field('counts').to_numpy()
+        
+        valid = ~values.is_null().to_numpy(zero_copy_only=False)
+        labels = np.array(values.to_pylist(), dtype=object)[valid]
+        counts = counts[valid]
+        
+        order = np.argsort(-counts, kind='stable')
+        return labels[order].tolist(), counts[order]
+    
+    @staticmethod
+    def _column_values(df: pd.DataFrame, column: str, default: Any) -> np.ndarray:
+        """
+        Valores de uma coluna como ndarray, ou o valor padrão repetido se ela não existir
+        """
+        if column in df.columns:
+            return df[column].to_numpy()
+        return np.full(len(df), default, dtype=object)
+    
     def prepare_market_context(self, data: Dict[str, Any]) -> str:
         """
         Prepara contexto estruturado para envio ao LLM
@@ -122,89 +322,112 @@ class InsightGenerator:
         """
         logger.info("Preparando contexto para análise LLM")
         
-        context_parts = []
+        # Cada seção é unida em um único bloco; o join final concatena só as seções
+        sections = []
         
         # Informações gerais do mercado
         if 'market_overview' in data:
             overview = data['market_overview']
-            context_parts.append("=== VISÃO GERAL DO MERCADO ===")
-            context_parts.append(f"Data da análise: {overview.get('timestamp', 'N/A')}")
-            context_parts.append(f"Total de moedas analisadas: {overview.get('total_currencies', 0)}")
-            context_parts.append(f"Período analisado: {overview.get('days_analyzed', 1)} dia(s)")
+            lines = [
+                "=== VISÃO GERAL DO MERCADO ===",
+                f"Data da análise: {overview.get('timestamp', 'N/A')}",
+                f"Total de moedas analisadas: {overview.get('total_currencies', 0)}",
+                f"Período analisado: {overview.get('days_analyzed', 1)} dia(s)"
+            ]
             
             if 'rate_statistics' in overview:
                 stats = overview['rate_statistics']
-                context_parts.append(f"Taxa mínima: {stats.get('min_rate', 0):.6f}")
-                context_parts.append(f"Taxa máxima: {stats.get('max_rate', 0):.4f}")
-                context_parts.append(f"Taxa média: {stats.get('avg_rate', 0):.4f}")
+                lines.append(f"Taxa mínima: {stats.get('min_rate', 0):.6f}")
+                lines.append(f"Taxa máxima: {stats.get('max_rate', 0):.4f}")
+                lines.append(f"Taxa média: {stats.get('avg_rate', 0):.4f}")
             
-            context_parts.append("")
+            lines.append("")
+            sections.append("\n".join(lines))
         
-        # Top 15 moedas mais importantes
         if 'currency_summary' in data:
-            df = data['currency_summary'].head(15)
-            context_parts.append("=== TOP 15 MOEDAS MAIS IMPORTANTES ===")
-            
-            for _, row in df.iterrows():
-                currency = row['currency']
-                rate = row['current_rate']
-                trend = row.get('trend_class', 'N/A')
-                volatility = row.get('volatility_class', 'N/A')
-                obs = row.get('total_observations', 0)
-                
-                context_parts.append(
-                    f"{currency}: Taxa={rate:.4f}, Tendência={trend}, "
-                    f"Volatilidade={volatility}, Observações={obs}"
+            df = data['currency_summary']
+            
+            # Passo único sobre o DataFrame: colunas e distribuições;
+            # as seções abaixo só formatam estes valores
+            total = len(df)
+            currencies = df['currency'].to_numpy()
+            rates = df['current_rate'].to_numpy()
+            trends = df['trend_class'].to_numpy() if 'trend_class' in df.columns else None
+            volatilities = self._column_values(df, 'volatility_class', 'N/A')
+            observations = self._column_values(df, 'total_observations', 0)
+            trend_distribution = self._value_counts(df['trend_class']) if trends is not None else None
+            volatility_distribution = (
+                self._value_counts(df['volatility_class']) if 'volatility_class' in df.columns else None
+            )
+            
+            # Top 15 moedas mais importantes
+            top = slice(0, 15)
+            top_trends = trends[top] if trends is not None else np.full(len(currencies[top]), 'N/A', dtype=object)
+            lines = ["=== TOP 15 MOEDAS MAIS IMPORTANTES ==="]
+            
+            lines.extend(
+                f"{currency}: Taxa={rate:.4f}, Tendência={trend}, "
+                f"Volatilidade={volatility}, Observações={obs}"
+                for currency, rate, trend, volatility, obs in zip(
+                    currencies[top], rates[top], top_trends, volatilities[top], observations[top]
                 )
+            )
             
-            context_parts.append("")
-        
-        # Moedas de maior interesse para Brasil
-        if 'currency_summary' in data:
+            lines.append("")
+            sections.append("\n".join(lines))
+            
+            # Moedas de maior interesse para Brasil (coletadas de uma vez por indexação)
             brazilian_interest = ['BRL', 'USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD', 'CHF', 'CNY']
-            df = data['currency_summary']
             
-            context_parts.append("=== MOEDAS DE INTERESSE PARA O BRASIL ===")
+            # np.isin filtra em C; o laço em Python só visita as linhas de interesse,
+            # guardando a primeira ocorrência de cada moeda
+            position = {}
+            for i in np.flatnonzero(np.isin(currencies, brazilian_interest)):
+                position.setdefault(currencies[i], i)
+            found = [currency for currency in brazilian_interest if currency in position]
+            positions = np.fromiter((position[currency] for currency in found), dtype=np.intp, count=len(found))
             
-            for currency in brazilian_interest:
-                currency_data = df[df['currency'] == currency]
-                if not currency_data.empty:
-                    row = currency_data.iloc[0]
-                    rate = row['current_rate']
-                    trend = row.get('trend_class', 'Estável')
-                    
-                    if currency == 'BRL':
-                        context_parts.append(f"Real Brasileiro (BRL): 1 USD = {rate:.4f} BRL - {trend}")
-                    else:
-                        context_parts.append(f"{currency}: {rate:.4f} - {trend}")
+            found_rates = rates[positions]
+            found_trends = trends[positions] if trends is not None else ['Estável'] * len(found)
             
-            context_parts.append("")
-        
-        # Distribuição de tendências
-        if 'currency_summary' in data:
-            df = data['currency_summary']
-            if 'trend_class' in df.columns:
-                trend_counts = df['trend_class'].value_counts()
-                context_parts.append("=== DISTRIBUIÇÃO DE TENDÊNCIAS ===")
+            lines = ["=== MOEDAS DE INTERESSE PARA O BRASIL ==="]
+            
+            for currency, rate, trend in zip(found, found_rates, found_trends):
+                if currency == 'BRL':
+                    lines.append(f"Real Brasileiro (BRL): 1 USD = {rate:.4f} BRL - {trend}")
+                else:
+                    lines.append(f"{currency}: {rate:.4f} - {trend}")
+            
+            lines.append("")
+            sections.append("\n".join(lines))
+            
+            # Distribuição de tendências
+            if trend_distribution is not None:
+                labels, counts = trend_distribution
+                lines = ["=== DISTRIBUIÇÃO DE TENDÊNCIAS ==="]
                 
-                for trend, count in trend_counts.items():
-                    percentage = (count / len(df)) * 100
-                    context_parts.append(f"{trend}: {count} moedas ({percentage:.1f}%)")
+                percentages = counts / total * 100
+                lines.extend(
+                    f"{trend}: {count} moedas ({percentage:.1f}%)"
+                    for trend, count, percentage in zip(labels, counts, percentages)
+                )
                 
-                context_parts.append("")
-        
-        # Distribuição de volatilidade
-        if 'currency_summary' in data:
-            df = data['currency_summary']
-            if 'volatility_class' in df.columns:
-                vol_counts = df['volatility_class'].value_counts()
-                context_parts.append("=== DISTRIBUIÇÃO DE VOLATILIDADE ===")
+                lines.append("")
+                sections.append("\n".join(lines))
+            
+            # Distribuição de volatilidade
+            if volatility_distribution is not None:
+                labels, counts = volatility_distribution
+                lines = ["=== DISTRIBUIÇÃO DE VOLATILIDADE ==="]
                 
-                for vol, count in vol_counts.items():
-                    percentage = (count / len(df)) * 100
-                    context_parts.append(f"{vol}: {count} moedas ({percentage:.1f}%)")
+                percentages = counts / total * 100
+                lines.extend(
+                    f"{vol}: {count} moedas ({percentage:.1f}%)"
+                    for vol, count, percentage in zip(labels, counts, percentages)
+                )
+                sections.append("\n".join(lines))
         
-        context = "\n".join(context_parts)
+        context = "\n".join(sections)
         
         logger.info(
             "Contexto preparado",
@@ -253,24 +476,13 @@ class InsightGenerator:
         Lembre-se: este relatório será lido por executivos que precisam de insights claros e acionáveis."""
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.3,
-                max_tokens=800
-            )
-            
-            summary = response.choices[0].message.content
+            summary = self._complete(system_prompt, user_prompt, temperature=0.3, max_tokens=800)
             
             # Log das interações (sem expor API key)
             logger.info(
                 "Resumo executivo gerado",
                 model=self.model,
-                summary_length=len(summary),
-                tokens_used=response.usage.total_tokens if hasattr(response, 'usage') else 'N/A'
+                summary_length=len(summary)
             )
             
             return summary
@@ -315,17 +527,7 @@ class InsightGenerator:
         5. Métricas de risco relevantes"""
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.2,
-                max_tokens=1000
-            )
-            
-            analysis = response.choices[0].message.content
+            analysis = self._complete(system_prompt, user_prompt, temperature=0.2, max_tokens=1000)
             
             logger.info(
                 "Análise técnica gerada",
@@ -336,7 +538,52 @@ class InsightGenerator:
             
         except Exception as e:
             logger.error(f"Erro ao gerar análise técnica: {str(e)}")
-            return "Análise técnica não disponível devido a limitações de API."
+            return TECHNICAL_ANALYSIS_UNAVAILABLE
+    
+    def _complete(self, system_prompt: str, user_prompt: str,
+                  temperature: float, max_tokens: int) -> str:
+        """
+        Executa uma chamada ao LLM, consultando o cache antes
+        
+        Args:
+            system_prompt: Prompt de sistema
+            user_prompt: Prompt do usuário
+            temperature: Temperatura da geração
+            max_tokens: Limite de tokens da resposta
+            
+        Returns:
+            Texto da resposta
+        """
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.make_key(system_prompt, user_prompt, self.model, temperature, max_tokens)
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info("Resposta LLM obtida do cache", model=self.model, key=key[:12])
+                return cached
+        
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        content = response.choices[0].message.content
+        
+        logger.debug(
+            "Chamada LLM concluída",
+            model=self.model,
+            tokens_used=response.usage.total_tokens if getattr(response, 'usage', None) else 'N/A'
+        )
+        
+        if key is not None and content:
+            self.cache.put(key, content, self.model)
+        
+        return content
     
     def _generate_fallback_summary(self, context: str) -> str:
         """
@@ -344,7 +591,7 @@ class InsightGenerator:
         """
         logger.warning("Gerando resumo alternativo (sem LLM)")
         
-        return f"""RESUMO EXECUTIVO - COTAÇÕES CAMBIAIS
+        return f"""{FALLBACK_SUMMARY_TITLE}
         
         **VISÃO GERAL**
         Este relatório apresenta a análise das cotações cambiais processadas pelo sistema.
@@ -363,7 +610,7 @@ class InsightGenerator:
         """
     
     def save_insights_report(self, summary: str, technical_analysis: str, 
-                           context: str, target_date: date) -> Dict[str, str]:
+                           context: str, target_date: date, pretty: bool = False) -> Dict[str, str]:
         """
         Salva relatório completo de insights
         
@@ -372,14 +619,18 @@ class InsightGenerator:
             technical_analysis: Análise técnica
             context: Contexto original
             target_date: Data de referência
+            pretty: Se True, indenta o JSON (mais lento e maior)
             
         Returns:
             Dicionário com caminhos dos arquivos salvos
         """
         logger.info("Salvando relatório de insights")
         
-        date_str = target_date.strftime('%Y-%m-%d')
-        timestamp = datetime.now().isoformat()
+        # Datas formatadas uma única vez; os três arquivos compartilham o mesmo instante
+        now = datetime.now()
+        date_str = target_date.isoformat()
+        date_human = target_date.strftime('%d/%m/%Y')
+        timestamp = now.isoformat()
         
         # Estrutura completa do relatório
         report = {
@@ -387,11 +638,17 @@ class InsightGenerator:
                 'generated_at': timestamp,
                 'target_date': date_str,
                 'model_used': self.model,
-                'pipeline_version': '1.0.0'
+                'pipeline_version': '1.0.0',
+                'context_sha': self._context_fingerprint(context),
+                'llm_fallback': self._is_fallback(summary, technical_analysis)
             },
             'executive_summary': summary,
             'technical_analysis': technical_analysis,
-            'data_context': context,
+            # O contexto completo é reconstruível do Gold Layer; o hash fica em metadata.context_sha
+            'data_context': {
+                'length': len(context),
+                'preview': context[:400]
+            },
             'recommendations': {
                 'immediate_actions': [
                     "Revisar exposição cambial nas moedas de maior volatilidade",
@@ -410,31 +667,32 @@ class InsightGenerator:
         
         # 1. Relatório completo em JSON
         json_file = self.outputs_path / f"insights_report_{date_str}.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        json_file.write_bytes(fast_json.dumps(report, indent=pretty))
         files_created['json_report'] = str(json_file)
         
         # 2. Resumo executivo em markdown
         md_file = self.outputs_path / f"executive_summary_{date_str}.md"
-        with open(md_file, 'w', encoding='utf-8') as f:
-            f.write(f"# Resumo Executivo - Cotações Cambiais\n\n")
-            f.write(f"**Data:** {target_date.strftime('%d/%m/%Y')}\n")
-            f.write(f"**Gerado em:** {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n\n")
-            f.write("---\n\n")
-            f.write(summary)
-            f.write("\n\n---\n\n")
-            f.write("## Análise Técnica\n\n")
-            f.write(technical_analysis)
+        md_file.write_text(
+            self._MD_TEMPLATE.format(
+                date=date_human,
+                now=now.strftime('%d/%m/%Y %H:%M:%S'),
+                summary=summary,
+                analysis=technical_analysis
+            ),
+            encoding='utf-8'
+        )
         files_created['markdown_summary'] = str(md_file)
         
         # 3. Relatório executivo simplificado em texto
         txt_file = self.outputs_path / f"daily_insights_{date_str}.txt"
-        with open(txt_file, 'w', encoding='utf-8') as f:
-            f.write("RELATÓRIO DIÁRIO - COTAÇÕES CAMBIAIS\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Data: {target_date.strftime('%d/%m/%Y')}\n")
-            f.write(f"Gerado: {datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}\n\n")
-            f.write(summary)
+        txt_file.write_text(
+            self._TXT_TEMPLATE.format(
+                date=date_human,
+                now=now.strftime('%d/%m/%Y às %H:%M:%S'),
+                summary=summary
+            ),
+            encoding='utf-8'
+        )
         files_created['text_summary'] = str(txt_file)
         
         # Calcular tamanhos
@@ -449,12 +707,65 @@ class InsightGenerator:
         
         return files_created
     
-    def process_insights(self, target_date: date) -> Dict[str, Any]:
+    @staticmethod
+    def _context_fingerprint(context: str) -> str:
+        """
+        Hash do contexto, gravado no relatório para detectar dados inalterados
+        """
+        return hashlib.blake2b(context.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _is_fallback(summary: str, technical_analysis: str) -> bool:
+        """
+        Indica se algum dos textos é o substituto gerado sem LLM
+        """
+        return (summary.startswith(FALLBACK_SUMMARY_TITLE)
+                or technical_analysis == TECHNICAL_ANALYSIS_UNAVAILABLE)
+    
+    def _load_reusable_report(self, context: str, target_date: date) -> Optional[Dict[str, Any]]:
+        """
+        Carrega o relatório já gerado para a data se o contexto não mudou
+        
+        O relatório só é reaproveitado se foi gerado pelo mesmo modelo, a partir
+        do mesmo contexto, sem texto substituto, e se os três arquivos existem.
+        
+        Args:
+            context: Contexto atual
+            target_date: Data de referência
+            
+        Returns:
+            Relatório JSON salvo e caminhos dos arquivos, ou None
+        """
+        date_str = target_date.isoformat()
+        files = {
+            'json_report': self.outputs_path / f"insights_report_{date_str}.json",
+            'markdown_summary': self.outputs_path / f"executive_summary_{date_str}.md",
+            'text_summary': self.outputs_path / f"daily_insights_{date_str}.txt"
+        }
+        if not all(path.exists() for path in files.values()):
+            return None
+        
+        try:
+            saved = fast_json.load_file(files['json_report'])
+            metadata = saved['metadata']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        if (metadata.get('context_sha') != self._context_fingerprint(context)
+                or metadata.get('model_used') != self.model
+                or metadata.get('llm_fallback', True)):
+            return None
+        
+        saved['files_created'] = {name: str(path) for name, path in files.items()}
+        return saved
+    
+    def process_insights(self, target_date: date, force: bool = False) -> Dict[str, Any]:
         """
         Processo principal de geração de insights
         
         Args:
             target_date: Data para análise
+            force: Se True, chama o LLM mesmo com relatório existente para o mesmo contexto
             
         Returns:
             Relatório do processamento
@@ -474,15 +785,31 @@ class InsightGenerator:
             # 2. Preparar contexto
             context = self.prepare_market_context(data)
             
-            # 3. Gerar resumo executivo
-            summary = self.generate_executive_summary(context)
-            
-            # 4. Gerar análise técnica
-            technical_analysis = self.generate_technical_analysis(context)
+            # Contexto idêntico ao do relatório já salvo: nada a regenerar
+            existing = None if force else self._load_reusable_report(context, target_date)
             
-            # 5. Salvar relatórios
-            files_created = self.save_insights_report(summary, technical_analysis, 
-                                                    context, target_date)
+            if existing is not None:
+                logger.info(
+                    "Contexto inalterado, reaproveitando relatórios existentes",
+                    target_date=target_date.isoformat(),
+                    context_sha=existing['metadata']['context_sha']
+                )
+                summary = existing['executive_summary']
+                technical_analysis = existing['technical_analysis']
+                files_created = existing['files_created']
+            else:
+                # 3-4. Gerar resumo executivo e análise técnica em paralelo
+                # (chamadas independentes, cada uma limitada pela rede)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    summary_future = executor.submit(self.generate_executive_summary, context)
+                    analysis_future = executor.submit(self.generate_technical_analysis, context)
+                
+                summary = summary_future.result()
+                technical_analysis = analysis_future.result()
+                
+                # 5. Salvar relatórios
+                files_created = self.save_insights_report(summary, technical_analysis, 
+                                                        context, target_date)
             
             # Calcular tempo de execução
             end_time = datetime.now()
@@ -497,7 +824,8 @@ class InsightGenerator:
                     'gold_files_loaded': len(data),
                     'context_length': len(context),
                     'summary_length': len(summary),
-                    'analysis_length': len(technical_analysis)
+                    'analysis_length': len(technical_analysis),
+                    'reused_existing_report': existing is not None
                 },
                 'output': {
                     'files_created': files_created,
@@ -0,0 +1,107 @@
+"""
+Cache em Disco das Respostas do LLM
+Pipeline de Cotações Cambiais - MBA Data Engineering
+
+Este módulo é responsável por:
+1. Gerar a chave do cache a partir de prompt, modelo e parâmetros
+2. Guardar o texto de cada completion em um arquivo JSON
+3. Servir reexecuções da mesma data sem nova chamada à API
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Optional, Union
+import structlog
+
+from src.utils import fast_json
+
+logger = structlog.get_logger()
+
+# Respostas com mais de 24h são descartadas
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+class ResponseCache:
+    """
+    Cache de completions em arquivos {dir}/{hash[:2]}/{hash}.json
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Inicializa o cache, criando o diretório se necessário
+
+        Args:
+            cache_dir: Diretório raiz do cache
+            ttl_seconds: Validade das entradas (pela data de modificação)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(system_prompt: str, user_prompt: str, model: str,
+                 temperature: float, max_tokens: int) -> str:
+        """
+        Calcula a chave SHA-256 de uma chamada
+
+        Args:
+            system_prompt: Prompt de sistema
+            user_prompt: Prompt do usuário (inclui o contexto dos dados)
+            model: Modelo usado
+            temperature: Temperatura da geração
+            max_tokens: Limite de tokens da resposta
+
+        Returns:
+            Hash hexadecimal
+        """
+        digest = hashlib.sha256()
+        for part in (system_prompt, user_prompt, model, str(temperature), str(max_tokens)):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Busca uma resposta em cache
+
+        Args:
+            key: Chave gerada por make_key
+
+        Returns:
+            Texto da resposta, ou None se ausente/expirado/ilegível
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            return fast_json.load_file(path)['content']
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Entrada do cache LLM ilegível, ignorando", key=key, error=str(e))
+            return None
+
+    def put(self, key: str, content: str, model: str) -> None:
+        """
+        Grava uma resposta no cache (escrita atômica)
+
+        Args:
+            key: Chave gerada por make_key
+            content: Texto da resposta
+            model: Modelo que gerou a resposta
+        """
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(fast_json.dumps({
+            'model': model,
+            'created_at': time.time(),
+            'content': content
+        }))
+        os.replace(tmp_path, path)
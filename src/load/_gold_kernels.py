@@ -0,0 +1,110 @@
+"""
+Kernels Numba do Gold Layer
+Pipeline de Cotações Cambiais - MBA Data Engineering
+
+Este módulo é responsável por:
+1. Calcular todas as métricas de tendência em uma única passada por moeda
+2. Manter janelas móveis em O(n): soma corrente para a média e filas
+   monotônicas para máxima/mínima
+3. Funcionar sem numba (mesmo código em Python puro, usado só em testes)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Substituto sem compilação para quando numba não está instalado
+        """
+        def decorator(func):
+            return func
+        return decorator
+
+# Tamanho das janelas (em dias), iguais às do caminho pandas
+MA_WINDOW = 7
+VOLATILITY_WINDOW = 7
+RANGE_WINDOW = 30
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def trend_kernel(rate, group_offsets, out_daily, out_cum, out_vol7, out_ma7,
+                 out_max30, out_min30, out_relpos):
+    """
+    Preenche as colunas de tendência para taxas ordenadas por moeda e data
+
+    Args:
+        rate: Taxa média diária (float64, sem NaN)
+        group_offsets: Início de cada moeda em rate, terminando em len(rate)
+        out_daily: Variação diária (%)
+        out_cum: Variação acumulada desde o primeiro dia (%)
+        out_vol7: Desvio padrão de 7 dias da variação diária
+        out_ma7: Média móvel de 7 dias
+        out_max30: Máxima de 30 dias
+        out_min30: Mínima de 30 dias
+        out_relpos: Posição relativa na faixa de 30 dias (0-100)
+    """
+    for g in prange(len(group_offsets) - 1):
+        start = group_offsets[g]
+        end = group_offsets[g + 1]
+        first = rate[start]
+
+        # Filas monotônicas de índices: decrescente (máxima) e crescente (mínima)
+        max_queue = np.empty(end - start, dtype=np.int64)
+        min_queue = np.empty(end - start, dtype=np.int64)
+        max_head = max_tail = 0
+        min_head = min_tail = 0
+        window_sum = 0.0
+
+        for i in range(start, end):
+            value = rate[i]
+
+            out_daily[i] = 0.0 if i == start else (value / rate[i - 1] - 1) * 100
+            out_cum[i] = (value / first - 1) * 100
+
+            # Média móvel com soma corrente
+            window_sum += value
+            if i - start >= MA_WINDOW:
+                window_sum -= rate[i - MA_WINDOW]
+            out_ma7[i] = window_sum / min(i - start + 1, MA_WINDOW)
+
+            # Desvio padrão em duas passadas sobre a janela curta (sem cancelamento)
+            vol_start = max(start, i - VOLATILITY_WINDOW + 1)
+            count = i - vol_start + 1
+            if count < 2:
+                out_vol7[i] = 0.0
+            else:
+                mean = 0.0
+                for k in range(vol_start, i + 1):
+                    mean += out_daily[k]
+                mean /= count
+                squares = 0.0
+                for k in range(vol_start, i + 1):
+                    squares += (out_daily[k] - mean) ** 2
+                out_vol7[i] = np.sqrt(squares / (count - 1))
+
+            # Máxima/mínima de 30 dias
+            while max_tail > max_head and rate[max_queue[max_tail - 1]] <= value:
+                max_tail -= 1
+            max_queue[max_tail] = i
+            max_tail += 1
+            if max_queue[max_head] <= i - RANGE_WINDOW:
+                max_head += 1
+
+            while min_tail > min_head and rate[min_queue[min_tail - 1]] >= value:
+                min_tail -= 1
+            min_queue[min_tail] = i
+            min_tail += 1
+            if min_queue[min_head] <= i - RANGE_WINDOW:
+                min_head += 1
+
+            high = rate[max_queue[max_head]]
+            low = rate[min_queue[min_head]]
+            out_max30[i] = high
+            out_min30[i] = low
+            out_relpos[i] = (value - low) / (high - low) * 100 if high > low else 50.0
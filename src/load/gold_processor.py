@@ -11,14 +11,74 @@ Este módulo é responsável por:
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 import structlog
-import json
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from src.load._gold_kernels import HAS_NUMBA, trend_kernel
+from src.utils import fast_json
 
 logger = structlog.get_logger()
 
+# Logger stdlib equivalente, usado só para checar o nível antes de montar campos caros
+# (funciona mesmo antes de o structlog ser configurado)
+_log_level_check = logging.getLogger(__name__)
+
+# Colunas do Silver Layer usadas no cálculo das métricas
+SILVER_COLUMNS = ['collection_date', 'target_currency', 'exchange_rate', 'collection_timestamp']
+
+# Escrita Parquet do Gold: zstd nível 1 (menor que snappy com velocidade
+# equivalente), dicionário em todas as colunas e estatísticas por row group
+GOLD_PARQUET_OPTIONS = {
+    'engine': 'pyarrow',
+    'compression': 'zstd',
+    'compression_level': 1,
+    'use_dictionary': True,
+    'write_statistics': True,
+    'row_group_size': 64_000,
+    'index': False
+}
+
+# Faixas de volatilidade média (7d) e o tipo categórico resultante, criados uma vez
+VOLATILITY_BINS = np.array([0, 1, 2, 5, np.inf])
+VOLATILITY_CLASS_DTYPE = pd.CategoricalDtype(['Baixa', 'Moderada', 'Alta', 'Muito Alta'], ordered=True)
+
+# Subdiretório do Gold com os períodos Silver já consolidados
+SILVER_CACHE_DIR = '_cache'
+
+# Entradas mantidas no cache em disco; cada execução diária gera uma chave nova
+# (o arquivo do dia muda), então as mais antigas são removidas após cada gravação
+SILVER_CACHE_MAX_ENTRIES = 8
+
+# Abaixo deste volume o custo de compilação do JIT supera o ganho sobre o Cython
+NUMBA_MIN_ROWS = 10_000
+
+# Colunas derivadas das tendências, na ordem dos argumentos de saída do trend_kernel
+TREND_COLUMNS = ['daily_change', 'cumulative_change', 'volatility_7d', 'ma_7d',
+                 'max_30d', 'min_30d', 'relative_position']
+
+# Agregados diários das taxas; float32 (~7 dígitos) basta para variações em %
+# e classificações, e reduz à metade a memória e o tamanho dos Parquet
+RATE_COLUMNS = ['rate_mean', 'rate_std', 'rate_min', 'rate_max']
+
+
+@lru_cache(maxsize=8)
+def _read_silver_cache(cache_file: str) -> pd.DataFrame:
+    """
+    Lê um período do cache do Silver, mantendo os 8 mais recentes em memória
+
+    O nome do arquivo inclui o hash do estado dos arquivos Silver, então
+    uma entrada em memória nunca fica desatualizada.
+    """
+    return pd.read_parquet(cache_file)
+
 
 class GoldLayerProcessor:
     """
@@ -65,40 +125,156 @@ class GoldLayerProcessor:
             end_date=end_date.isoformat()
         )
         
-        dataframes = []
+        # Arquivos existentes no período (um por dia)
+        paths = []
         current_date = start_date
         
         while current_date <= end_date:
             file_path = self.silver_path / f"exchange_rates_{current_date.strftime('%Y-%m-%d')}.parquet"
             
             if file_path.exists():
-                try:
-                    df = pd.read_parquet(file_path)
-                    dataframes.append(df)
-                    logger.debug(f"Carregado {len(df)} registros de {current_date}")
-                except Exception as e:
-                    logger.warning(f"Erro ao carregar {file_path}: {str(e)}")
+                paths.append(file_path)
             else:
                 logger.warning(f"Arquivo não encontrado: {file_path}")
                 
             current_date += timedelta(days=1)
         
-        if not dataframes:
+        if not paths:
             raise ValueError(f"Nenhum dado encontrado para o período {start_date} a {end_date}")
         
-        # Consolidar todos os DataFrames
-        consolidated_df = pd.concat(dataframes, ignore_index=True)
+        # Período já consolidado com os mesmos arquivos (nome, mtime e tamanho)
+        cache_key = self._silver_cache_key(start_date, end_date, paths)
+        cache_file = self.gold_path / SILVER_CACHE_DIR / f"silver_{cache_key}.parquet"
+        if cache_file.exists():
+            try:
+                consolidated_df = _read_silver_cache(str(cache_file)).copy()
+                logger.info("Dados Silver servidos do cache", cache_file=cache_file.name, total_records=len(consolidated_df))
+                return consolidated_df
+            except (pa.ArrowException, OSError) as e:
+                logger.warning("Cache do Silver ilegível, relendo os arquivos", cache_file=cache_file.name, error=str(e))
+        
+        try:
+            # Leitura única de todos os arquivos, só com as colunas usadas no Gold
+            table = ds.dataset([str(path) for path in paths], format='parquet').to_table(columns=SILVER_COLUMNS)
+            consolidated_df = table.to_pandas()
+        except (pa.ArrowException, OSError) as e:
+            # Arquivo corrompido ou esquema divergente: ler um a um, ignorando os inválidos
+            logger.warning("Leitura única do Silver falhou, lendo arquivo a arquivo", error=str(e))
+            
+            dataframes = self._read_silver_files(paths)
+            if not dataframes:
+                raise ValueError(f"Nenhum dado encontrado para o período {start_date} a {end_date}")
+            
+            consolidated_df = pd.concat(dataframes, ignore_index=True)
+        
+        # Poucas moedas repetidas em muitas linhas: category troca hash de strings
+        # por códigos inteiros nos groupby e grava a coluna dict-encoded no Parquet
+        consolidated_df['target_currency'] = consolidated_df['target_currency'].astype('category')
         
-        logger.info(
-            "Dados Silver consolidados",
-            total_records=len(consolidated_df),
-            date_range=f"{start_date} a {end_date}",
-            unique_dates=consolidated_df['collection_date'].nunique(),
-            unique_currencies=consolidated_df['target_currency'].nunique()
-        )
+        # Contagens só quando o log INFO está ativo; as categorias recém-criadas
+        # são exatamente as moedas presentes, sem varrer a coluna de novo
+        if _log_level_check.isEnabledFor(logging.INFO):
+            logger.info(
+                "Dados Silver consolidados",
+                total_records=len(consolidated_df),
+                date_range=f"{start_date} a {end_date}",
+                unique_dates=len(pd.unique(consolidated_df['collection_date'].to_numpy())),
+                unique_currencies=len(consolidated_df['target_currency'].cat.categories)
+            )
+        
+        self._write_silver_cache(consolidated_df, cache_file)
         
         return consolidated_df
     
+    @staticmethod
+    def _silver_cache_key(start_date: date, end_date: date, paths: List[Path]) -> str:
+        """
+        Calcula a chave do cache a partir do período e do estado dos arquivos
+        
+        Args:
+            start_date: Data inicial
+            end_date: Data final
+            paths: Arquivos Silver do período
+            
+        Returns:
+            Hash hexadecimal (muda se algum arquivo for reescrito)
+        """
+        files = sorted((path.name, path.stat().st_mtime_ns, path.stat().st_size) for path in paths)
+        return hashlib.sha1(f"{start_date}_{end_date}_{files}".encode('utf-8')).hexdigest()
+    
+    def _write_silver_cache(self, consolidated_df: pd.DataFrame, cache_file: Path) -> None:
+        """
+        Grava o período consolidado no cache (escrita atômica; falhas só geram aviso)
+        
+        Args:
+            consolidated_df: Dados Silver consolidados
+            cache_file: Arquivo de destino no cache
+        """
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            consolidated_df.to_parquet(tmp_file, index=False)
+            tmp_file.replace(cache_file)
+        except (pa.ArrowException, OSError) as e:
+            logger.warning("Não foi possível gravar o cache do Silver", cache_file=cache_file.name, error=str(e))
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+            return
+        
+        self._prune_silver_cache(cache_file)
+    
+    @staticmethod
+    def _prune_silver_cache(keep_file: Path) -> None:
+        """
+        Remove as entradas mais antigas do cache, mantendo as SILVER_CACHE_MAX_ENTRIES
+        mais recentes (por data de modificação) e sempre a recém-gravada
+        
+        Args:
+            keep_file: Arquivo de cache recém-gravado
+        """
+        entries = []
+        for entry in keep_file.parent.glob('silver_*.parquet'):
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry))
+            except OSError:
+                continue  # removida por outra execução
+        
+        stale = [entry for _, entry in sorted(entries, reverse=True) if entry != keep_file]
+        for entry in stale[SILVER_CACHE_MAX_ENTRIES - 1:]:
+            try:
+                entry.unlink()
+            except OSError as e:
+                logger.warning("Não foi possível remover entrada antiga do cache", cache_file=entry.name, error=str(e))
+    
+    def _read_silver_files(self, paths: List[Path]) -> List[pd.DataFrame]:
+        """
+        Lê arquivos Silver individualmente, ignorando os que falharem
+        
+        A descompressão do Parquet libera o GIL, então as leituras são feitas
+        em paralelo por threads.
+        
+        Args:
+            paths: Arquivos Parquet do Silver Layer
+            
+        Returns:
+            Lista de DataFrames lidos com sucesso, na ordem dos arquivos
+        """
+        def read(file_path: Path) -> Optional[pd.DataFrame]:
+            try:
+                df = pd.read_parquet(file_path, columns=SILVER_COLUMNS)
+                logger.debug(f"Carregado {len(df)} registros de {file_path.name}")
+                return df
+            except Exception as e:
+                logger.warning(f"Erro ao carregar {file_path}: {str(e)}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(16, len(paths)))) as executor:
+            results = list(executor.map(read, paths))
+        
+        return [df for df in results if df is not None]
+    
     def calculate_daily_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calcula métricas diárias por moeda
@@ -111,25 +287,32 @@ class GoldLayerProcessor:
         """
         logger.info("Calculando métricas diárias")
         
-        # Agrupar por data e moeda
-        daily_metrics = df.groupby(['collection_date', 'target_currency']).agg({
-            'exchange_rate': ['mean', 'std', 'min', 'max', 'count'],
-            'collection_timestamp': 'max'  # Último timestamp do dia
-        }).reset_index()
-        
-        # Flatten column names
-        daily_metrics.columns = [
-            'date', 'currency', 'rate_mean', 'rate_std', 'rate_min', 
-            'rate_max', 'observations', 'last_update'
-        ]
-        
-        # Calcular métricas adicionais
-        daily_metrics['rate_range'] = daily_metrics['rate_max'] - daily_metrics['rate_min']
-        daily_metrics['rate_cv'] = daily_metrics['rate_std'] / daily_metrics['rate_mean']  # Coeficiente de variação
-        daily_metrics['rate_cv'] = daily_metrics['rate_cv'].fillna(0)
-        
-        # Ordenar por data e moeda
-        daily_metrics = daily_metrics.sort_values(['date', 'currency']).reset_index(drop=True)
+        # Agrupar por data e moeda (agregações nomeadas já geram as colunas finais;
+        # o groupby ordena as chaves, então o resultado sai ordenado por data e moeda)
+        daily_metrics = df.groupby(['collection_date', 'target_currency'], observed=True).agg(
+            rate_mean=('exchange_rate', 'mean'),
+            rate_std=('exchange_rate', 'std'),
+            rate_min=('exchange_rate', 'min'),
+            rate_max=('exchange_rate', 'max'),
+            observations=('exchange_rate', 'count'),
+            last_update=('collection_timestamp', 'max')  # Último timestamp do dia
+        )
+        daily_metrics.index.names = ['date', 'currency']
+        daily_metrics = daily_metrics.reset_index()
+        daily_metrics[RATE_COLUMNS] = daily_metrics[RATE_COLUMNS].astype('float32')
+        daily_metrics['observations'] = daily_metrics['observations'].astype('int32')
+        
+        # Calcular métricas adicionais direto nos arrays
+        rate_std = daily_metrics['rate_std'].to_numpy()
+        rate_mean = daily_metrics['rate_mean'].to_numpy()
+        daily_metrics['rate_range'] = daily_metrics['rate_max'].to_numpy() - daily_metrics['rate_min'].to_numpy()
+        
+        # Coeficiente de variação; 0 onde o desvio é NaN (uma observação) ou a média é 0
+        daily_metrics['rate_cv'] = np.divide(
+            rate_std, rate_mean,
+            out=np.zeros_like(rate_std),
+            where=~np.isnan(rate_std) & (rate_mean != 0)
+        )
         
         logger.info(
             "Métricas diárias calculadas",
@@ -152,59 +335,50 @@ class GoldLayerProcessor:
         """
         logger.info("Calculando tendências históricas")
         
-        # Criar cópia para não modificar original
-        trends_df = daily_metrics.copy()
+        # Ordenar por moeda e data: sort_values já devolve um novo DataFrame, então
+        # as colunas derivadas abaixo não alteram o original (sem cópias extras)
+        trends_df = daily_metrics.sort_values(['currency', 'date'], ignore_index=True)
         
-        # Ordenar por moeda e data
-        trends_df = trends_df.sort_values(['currency', 'date']).reset_index(drop=True)
+        # Kernel numba: todas as métricas em uma passada O(n) por moeda
+        if HAS_NUMBA and len(trends_df) >= NUMBA_MIN_ROWS:
+            return self._calculate_trends_kernel(trends_df)
         
-        # Calcular variações por moeda
-        for currency in trends_df['currency'].unique():
-            mask = trends_df['currency'] == currency
-            currency_data = trends_df[mask].copy()
-            
-            # Verificar se há dados suficientes
-            if len(currency_data) < 2:
-                # Se só há 1 dia de dados, preencher com zeros
-                currency_data['daily_change'] = 0.0
-                currency_data['cumulative_change'] = 0.0
-                currency_data['volatility_7d'] = 0.0
-            else:
-                # Variação diária (%)
-                currency_data['daily_change'] = currency_data['rate_mean'].pct_change() * 100
-                
-                # Primeira linha será NaN, preencher com 0
-                currency_data['daily_change'] = currency_data['daily_change'].fillna(0)
-                
-                # Variação acumulada desde o primeiro dia (%)
-                first_rate = currency_data['rate_mean'].iloc[0]
-                currency_data['cumulative_change'] = ((currency_data['rate_mean'] / first_rate) - 1) * 100
-                
-                # Volatilidade 7 dias
-                currency_data['volatility_7d'] = currency_data['daily_change'].rolling(window=7, min_periods=1).std()
-                currency_data['volatility_7d'] = currency_data['volatility_7d'].fillna(0)
-            
-            # Média móvel 7 dias
-            currency_data['ma_7d'] = currency_data['rate_mean'].rolling(window=7, min_periods=1).mean()
-            
-            # Máxima e mínima dos últimos 30 dias
-            currency_data['max_30d'] = currency_data['rate_mean'].rolling(window=30, min_periods=1).max()
-            currency_data['min_30d'] = currency_data['rate_mean'].rolling(window=30, min_periods=1).min()
-            
-            # Posição relativa
-            range_30d = currency_data['max_30d'] - currency_data['min_30d']
-            currency_data['relative_position'] = np.where(
-                range_30d > 0,
-                (currency_data['rate_mean'] - currency_data['min_30d']) / range_30d * 100,
-                50.0  # Default se não há variação
-            )
-            
-            # Atualizar no DataFrame principal
-            trends_df.loc[mask] = currency_data
+        # Calcular variações por moeda (vetorizado por grupo, sem laço em Python)
+        # Razões calculadas em float64 (taxas próximas perdem dígitos em float32)
+        rate = trends_df['rate_mean'].astype('float64')
+        rates = rate.groupby(trends_df['currency'], sort=False, observed=True)
+        
+        # Variação diária (%); a primeira linha de cada moeda é NaN, preenchida com 0
+        trends_df['daily_change'] = (rates.pct_change() * 100).fillna(0)
+        
+        # Variação acumulada desde o primeiro dia (%)
+        trends_df['cumulative_change'] = ((rate / rates.transform('first')) - 1) * 100
+        
+        # Volatilidade 7 dias (0 para moedas com um único dia)
+        trends_df['volatility_7d'] = (
+            trends_df.groupby('currency', sort=False, observed=True)['daily_change']
+            .rolling(window=7, min_periods=1).std()
+            .reset_index(level=0, drop=True)
+            .fillna(0)
+        )
+        
+        # Média móvel 7 dias
+        trends_df['ma_7d'] = rates.rolling(window=7, min_periods=1).mean().reset_index(level=0, drop=True)
+        
+        # Máxima e mínima dos últimos 30 dias
+        trends_df['max_30d'] = rates.rolling(window=30, min_periods=1).max().reset_index(level=0, drop=True)
+        trends_df['min_30d'] = rates.rolling(window=30, min_periods=1).min().reset_index(level=0, drop=True)
+        
+        # Posição relativa
+        range_30d = trends_df['max_30d'] - trends_df['min_30d']
+        trends_df['relative_position'] = np.where(
+            range_30d > 0,
+            (rate - trends_df['min_30d']) / range_30d * 100,
+            50.0  # Default se não há variação
+        )
         
-        # Preencher NaN com 0 para variações
-        trends_df['daily_change'] = trends_df['daily_change'].fillna(0)
-        trends_df['volatility_7d'] = trends_df['volatility_7d'].fillna(0)
+        # As janelas móveis do pandas devolvem float64
+        trends_df[TREND_COLUMNS] = trends_df[TREND_COLUMNS].astype('float32')
         
         logger.info(
             "Tendências históricas calculadas",
@@ -214,6 +388,35 @@ class GoldLayerProcessor:
         
         return trends_df
     
+    def _calculate_trends_kernel(self, trends_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Preenche as tendências com o trend_kernel (dados já ordenados por moeda e data)
+        
+        Args:
+            trends_df: Métricas diárias ordenadas por moeda e data
+            
+        Returns:
+            DataFrame enriquecido com tendências
+        """
+        rate = trends_df['rate_mean'].to_numpy(dtype=np.float64)
+        codes = trends_df['currency'].factorize()[0]
+        group_offsets = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1, [len(rate)])).astype(np.int64)
+        
+        outputs = [np.empty_like(rate) for _ in TREND_COLUMNS]
+        trend_kernel(rate, group_offsets, *outputs)
+        
+        for column, values in zip(TREND_COLUMNS, outputs):
+            trends_df[column] = values.astype(np.float32)
+        
+        logger.info(
+            "Tendências históricas calculadas",
+            currencies_processed=len(group_offsets) - 1,
+            metrics_added=6,
+            engine='numba'
+        )
+        
+        return trends_df
+    
     def create_currency_summary(self, trends_df: pd.DataFrame) -> pd.DataFrame:
         """
         Cria resumo consolidado por moeda
@@ -226,88 +429,65 @@ class GoldLayerProcessor:
         """
         logger.info("Criando resumo por moeda")
         
-        # Pegar dados mais recentes de cada moeda
-        latest_data = trends_df.groupby('currency').last().reset_index()
-        
-        # Garantir que daily_change existe
-        if 'daily_change' not in latest_data.columns:
-            latest_data['daily_change'] = 0.0
-        if 'cumulative_change' not in latest_data.columns:
-            latest_data['cumulative_change'] = 0.0
-            
-        # Dados históricos por moeda - processamento seguro
-        agg_dict = {
-            'rate_mean': ['min', 'max', 'mean'],
-            'volatility_7d': 'mean',
-            'date': ['min', 'max', 'count']
+        has_daily_change = 'daily_change' in trends_df.columns
+        has_cumulative_change = 'cumulative_change' in trends_df.columns
+        
+        # Valores mais recentes e estatísticas históricas em uma única agregação
+        # (só inclui daily_change/cumulative_change se existirem)
+        aggregations = {
+            'current_rate': ('rate_mean', 'last'),
+            'ma_7d': ('ma_7d', 'last'),
+            'volatility_7d': ('volatility_7d', 'last'),
+            'relative_position': ('relative_position', 'last'),
+            'last_update': ('last_update', 'last')
         }
-        
-        # Só incluir daily_change se existir
-        if 'daily_change' in trends_df.columns:
-            daily_change_stats = trends_df.groupby('currency')['daily_change'].agg(['std', 'min', 'max']).reset_index()
-            daily_change_stats = daily_change_stats.fillna(0)
-        else:
-            daily_change_stats = pd.DataFrame({
-                'currency': trends_df['currency'].unique(),
-                'std': 0.0, 'min': 0.0, 'max': 0.0
-            })
-        
-        historical_stats = trends_df.groupby('currency').agg(agg_dict).reset_index()
-        
-        # Flatten columns
-        historical_stats.columns = [
-            'currency', 'historical_min', 'historical_max', 'historical_avg',
-            'avg_volatility_7d', 'first_date', 'last_date', 'total_observations'
-        ]
-        
-        # Merge com estatísticas de daily_change
-        historical_stats = historical_stats.merge(daily_change_stats, on='currency')
-        historical_stats = historical_stats.rename(columns={
-            'std': 'avg_daily_volatility',
-            'min': 'max_daily_drop', 
-            'max': 'max_daily_gain'
+        if has_daily_change:
+            aggregations['last_daily_change'] = ('daily_change', 'last')
+        if has_cumulative_change:
+            aggregations['total_change_pct'] = ('cumulative_change', 'last')
+        aggregations.update({
+            'historical_min': ('rate_mean', 'min'),
+            'historical_max': ('rate_mean', 'max'),
+            'historical_avg': ('rate_mean', 'mean'),
+            'avg_volatility_7d': ('volatility_7d', 'mean'),
+            'first_date': ('date', 'min'),
+            'last_date': ('date', 'max'),
+            'total_observations': ('date', 'count')
         })
+        if has_daily_change:
+            aggregations.update({
+                'avg_daily_volatility': ('daily_change', 'std'),
+                'max_daily_drop': ('daily_change', 'min'),
+                'max_daily_gain': ('daily_change', 'max')
+            })
         
-        # Merge com dados mais recentes - apenas colunas que existem
-        merge_columns = ['currency', 'rate_mean', 'ma_7d', 'volatility_7d', 'relative_position', 'last_update']
-        if 'daily_change' in latest_data.columns:
-            merge_columns.append('daily_change')
-        if 'cumulative_change' in latest_data.columns:
-            merge_columns.append('cumulative_change')
-            
-        summary = latest_data[merge_columns].merge(historical_stats, on='currency')
-        
-        # Renomear colunas
-        rename_dict = {
-            'rate_mean': 'current_rate'
-        }
-        if 'daily_change' in summary.columns:
-            rename_dict['daily_change'] = 'last_daily_change'
-        if 'cumulative_change' in summary.columns:
-            rename_dict['cumulative_change'] = 'total_change_pct'
-            
-        summary = summary.rename(columns=rename_dict)
+        # trends_df já vem ordenado por moeda, então sort=False preserva a ordem
+        summary = trends_df.groupby('currency', sort=False, observed=True).agg(**aggregations).reset_index()
         
         # Garantir que colunas necessárias existem
-        if 'last_daily_change' not in summary.columns:
+        daily_change_stats = ['avg_daily_volatility', 'max_daily_drop', 'max_daily_gain']
+        if has_daily_change:
+            summary[daily_change_stats] = summary[daily_change_stats].fillna(0)
+        else:
             summary['last_daily_change'] = 0.0
-        if 'total_change_pct' not in summary.columns:
+            summary[daily_change_stats] = 0.0
+        if not has_cumulative_change:
             summary['total_change_pct'] = 0.0
         
         # Classificações
         summary['volatility_class'] = pd.cut(
-            summary['avg_volatility_7d'], 
-            bins=[0, 1, 2, 5, float('inf')], 
-            labels=['Baixa', 'Moderada', 'Alta', 'Muito Alta']
+            summary['avg_volatility_7d'],
+            bins=VOLATILITY_BINS,
+            labels=VOLATILITY_CLASS_DTYPE.categories
         )
         
-        summary['trend_class'] = summary['last_daily_change'].apply(
-            lambda x: 'Forte Alta' if x > 2 else
-                     'Alta' if x > 0.5 else
-                     'Estável' if -0.5 <= x <= 0.5 else
-                     'Baixa' if x > -2 else
-                     'Forte Baixa'
-        )
+        # Faixas avaliadas em ordem; NaN não satisfaz nenhuma e cai em 'Forte Baixa'
+        last_change = summary['last_daily_change'].to_numpy()
+        summary['trend_class'] = np.select(
+            [last_change > 2, last_change > 0.5, last_change >= -0.5, last_change > -2],
+            ['Forte Alta', 'Alta', 'Estável', 'Baixa'],
+            default='Forte Baixa'
+        ).astype(object)
         
         # Ordenar por importância
         summary = summary.sort_values(['total_observations', 'avg_volatility_7d'], 
@@ -336,6 +516,17 @@ class GoldLayerProcessor:
         # Moedas principais (as 10 mais observadas)
         major_currencies = summary_df.head(10)
         
+        # Uma varredura por extremo (nanarg* ignora NaN, como idxmax/idxmin)
+        currencies = summary_df['currency'].to_numpy()
+        total_change = summary_df['total_change_pct'].to_numpy(dtype=float)
+        volatility = summary_df['avg_volatility_7d'].to_numpy(dtype=float)
+        i_gain, i_loss = np.nanargmax(total_change), np.nanargmin(total_change)
+        i_vol_max, i_vol_min = np.nanargmax(volatility), np.nanargmin(volatility)
+        
+        # Contagens por máscara booleana, sem materializar DataFrames filtrados
+        last_change = summary_df['last_daily_change'].to_numpy(dtype=float)
+        volatility_class = summary_df['volatility_class'].to_numpy()
+        
         overview = {
             'timestamp': datetime.now().isoformat(),
             'total_currencies': len(summary_df),
@@ -345,32 +536,32 @@ class GoldLayerProcessor:
                 'total_days': (summary_df['last_date'].max() - summary_df['first_date'].min()).days + 1
             },
             'market_sentiment': {
-                'currencies_up': len(summary_df[summary_df['last_daily_change'] > 0]),
-                'currencies_down': len(summary_df[summary_df['last_daily_change'] < 0]),
-                'currencies_stable': len(summary_df[summary_df['last_daily_change'].abs() <= 0.1])
+                'currencies_up': int(np.count_nonzero(last_change > 0)),
+                'currencies_down': int(np.count_nonzero(last_change < 0)),
+                'currencies_stable': int(np.count_nonzero(np.abs(last_change) <= 0.1))
             },
             'volatility_distribution': {
-                'low': len(summary_df[summary_df['volatility_class'] == 'Baixa']),
-                'moderate': len(summary_df[summary_df['volatility_class'] == 'Moderada']),
-                'high': len(summary_df[summary_df['volatility_class'] == 'Alta']),
-                'very_high': len(summary_df[summary_df['volatility_class'] == 'Muito Alta'])
+                'low': int(np.count_nonzero(volatility_class == 'Baixa')),
+                'moderate': int(np.count_nonzero(volatility_class == 'Moderada')),
+                'high': int(np.count_nonzero(volatility_class == 'Alta')),
+                'very_high': int(np.count_nonzero(volatility_class == 'Muito Alta'))
             },
             'top_performers': {
                 'biggest_gainer': {
-                    'currency': summary_df.loc[summary_df['total_change_pct'].idxmax(), 'currency'],
-                    'change_pct': float(summary_df['total_change_pct'].max())
+                    'currency': currencies[i_gain],
+                    'change_pct': float(total_change[i_gain])
                 },
                 'biggest_loser': {
-                    'currency': summary_df.loc[summary_df['total_change_pct'].idxmin(), 'currency'],
-                    'change_pct': float(summary_df['total_change_pct'].min())
+                    'currency': currencies[i_loss],
+                    'change_pct': float(total_change[i_loss])
                 },
                 'most_volatile': {
-                    'currency': summary_df.loc[summary_df['avg_volatility_7d'].idxmax(), 'currency'],
-                    'volatility': float(summary_df['avg_volatility_7d'].max())
+                    'currency': currencies[i_vol_max],
+                    'volatility': float(volatility[i_vol_max])
                 },
                 'most_stable': {
-                    'currency': summary_df.loc[summary_df['avg_volatility_7d'].idxmin(), 'currency'],
-                    'volatility': float(summary_df['avg_volatility_7d'].min())
+                    'currency': currencies[i_vol_min],
+                    'volatility': float(volatility[i_vol_min])
                 }
             },
             'major_currencies_summary': major_currencies[['currency', 'current_rate', 'last_daily_change', 
@@ -406,37 +597,41 @@ class GoldLayerProcessor:
         logger.info("Salvando Gold Layer")
         
         date_str = target_date.strftime('%Y-%m-%d')
-        files_created = {}
         
-        # 1. Métricas diárias
         daily_file = self.gold_path / f"daily_metrics_{date_str}.parquet"
-        daily_metrics.to_parquet(daily_file, compression='snappy', index=False)
-        files_created['daily_metrics'] = str(daily_file)
-        
-        # 2. Tendências históricas
         trends_file = self.gold_path / f"historical_trends_{date_str}.parquet"
-        trends_df.to_parquet(trends_file, compression='snappy', index=False)
-        files_created['historical_trends'] = str(trends_file)
-        
-        # 3. Resumo por moeda
         summary_file = self.gold_path / f"currency_summary_{date_str}.parquet"
-        summary_df.to_parquet(summary_file, compression='snappy', index=False)
-        files_created['currency_summary'] = str(summary_file)
-        
-        # 4. Overview do mercado (JSON)
         overview_file = self.gold_path / f"market_overview_{date_str}.json"
-        with open(overview_file, 'w', encoding='utf-8') as f:
-            json.dump(overview, f, indent=2, ensure_ascii=False)
-        files_created['market_overview'] = str(overview_file)
+        consolidated_file = self.gold_path / f"consolidated_{date_str}.parquet"
         
-        # 5. Consolidado final (dados mais importantes)
+        # Consolidado final (dados mais importantes)
         consolidated = summary_df[['currency', 'current_rate', 'last_daily_change', 
                                   'total_change_pct', 'ma_7d', 'volatility_7d', 
-                                  'trend_class', 'volatility_class']].copy()
-        
-        consolidated_file = self.gold_path / f"consolidated_{date_str}.parquet"
-        consolidated.to_parquet(consolidated_file, compression='snappy', index=False)
-        files_created['consolidated'] = str(consolidated_file)
+                                  'trend_class', 'volatility_class']]
+        
+        # A compressão do Parquet libera o GIL: os 4 arquivos são gravados em
+        # paralelo enquanto o overview JSON é escrito na thread principal
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            writes = [
+                executor.submit(daily_metrics.to_parquet, daily_file, **GOLD_PARQUET_OPTIONS),
+                executor.submit(trends_df.to_parquet, trends_file, **GOLD_PARQUET_OPTIONS),
+                executor.submit(summary_df.to_parquet, summary_file, **GOLD_PARQUET_OPTIONS),
+                executor.submit(consolidated.to_parquet, consolidated_file, **GOLD_PARQUET_OPTIONS)
+            ]
+            
+            overview_file.write_bytes(fast_json.dumps(overview, indent=True))
+            
+            # Propaga a primeira falha de gravação
+            for write in writes:
+                write.result()
+        
+        files_created = {
+            'daily_metrics': str(daily_file),
+            'historical_trends': str(trends_file),
+            'currency_summary': str(summary_file),
+            'market_overview': str(overview_file),
+            'consolidated': str(consolidated_file)
+        }
         
         # Calcular tamanhos dos arquivos
         total_size_kb = sum(Path(path).stat().st_size for path in files_created.values()) / 1024
@@ -563,8 +758,7 @@ class GoldLayerProcessor:
         """
         logger.info("Calculando tendências (versão simplificada)")
         
-        trends_df = daily_metrics.copy()
-        trends_df = trends_df.sort_values(['currency', 'date']).reset_index(drop=True)
+        trends_df = daily_metrics.sort_values(['currency', 'date'], ignore_index=True)
         
         # Adicionar colunas básicas com valores padrão seguros
         trends_df['daily_change'] = 0.0
@@ -583,8 +777,9 @@ class GoldLayerProcessor:
         """
         logger.info("Criando resumo por moeda (versão simplificada)")
         
-        # Usar dados mais recentes
-        summary = trends_df.groupby('currency').last().reset_index()
+        # Usar dados mais recentes: trends_df já vem ordenado por moeda e data,
+        # então a última linha de cada moeda é o dia mais recente (varredura linear)
+        summary = trends_df.drop_duplicates(subset='currency', keep='last').reset_index(drop=True)
         
         # Adicionar colunas necessárias
         summary['current_rate'] = summary['rate_mean']
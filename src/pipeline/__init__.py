@@ -0,0 +1,9 @@
+"""
+Módulo Pipeline - Pipeline de Cotações Cambiais
+Orquestração dos estágios como um grafo de dependências (DAG)
+"""
+
+from .dag import Task, DAGPipeline
+
+__version__ = "1.0.0"
+__all__ = ["Task", "DAGPipeline"]
@@ -0,0 +1,190 @@
+"""
+Executor de DAG - Pipeline de Cotações Cambiais
+MBA em Data Engineering
+
+Este módulo é responsável por:
+1. Representar os estágios do pipeline como tarefas com dependências
+2. Ordenar as tarefas topologicamente (algoritmo de Kahn)
+3. Executar tarefas independentes em paralelo (threads para I/O, processos para CPU)
+4. Liberar tarefas dependentes assim que seus pré-requisitos terminam
+"""
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import structlog
+
+logger = structlog.get_logger()
+
+EXECUTOR_THREAD = 'thread'
+EXECUTOR_PROCESS = 'process'
+
+
+@dataclass(frozen=True)
+class Task:
+    """
+    Tarefa do pipeline
+
+    Atributos:
+        name: Nome único da tarefa (ex: 'transform[2024-01-15]')
+        fn: Função executada; recebe `args` seguidos dos resultados das dependências
+        deps: Nomes das tarefas que precisam terminar antes desta
+        args: Argumentos posicionais fixos passados para `fn`
+        executor: 'thread' (I/O) ou 'process' (CPU); `fn` e `args` devem ser
+            serializáveis (pickle) quando 'process'
+    """
+    name: str
+    fn: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    args: Tuple[Any, ...] = ()
+    executor: str = EXECUTOR_THREAD
+
+
+class DAGPipeline:
+    """
+    Executor de tarefas organizadas em um grafo acíclico de dependências
+    """
+
+    def __init__(self, tasks: List[Task], max_workers: int = 8, max_processes: Optional[int] = None):
+        """
+        Inicializa o executor
+
+        Args:
+            tasks: Lista de tarefas do grafo
+            max_workers: Número de threads para tarefas de I/O
+            max_processes: Número de processos para tarefas de CPU (None = nº de CPUs)
+
+        Raises:
+            ValueError: Se houver nomes duplicados, dependências inexistentes ou ciclos
+        """
+        self.tasks: Dict[str, Task] = {}
+        for task in tasks:
+            if task.name in self.tasks:
+                raise ValueError(f"Tarefa duplicada: {task.name}")
+            if task.executor not in (EXECUTOR_THREAD, EXECUTOR_PROCESS):
+                raise ValueError(f"Executor inválido para {task.name}: {task.executor}")
+            self.tasks[task.name] = task
+
+        for task in tasks:
+            for dep in task.deps:
+                if dep not in self.tasks:
+                    raise ValueError(f"Dependência '{dep}' da tarefa '{task.name}' não existe")
+
+        self.max_workers = max_workers
+        self.max_processes = max_processes
+        self.order = self.topological_order()
+
+    def topological_order(self) -> List[str]:
+        """
+        Ordena as tarefas pelo algoritmo de Kahn
+
+        Returns:
+            Lista de nomes em ordem topológica
+
+        Raises:
+            ValueError: Se o grafo contiver ciclo
+        """
+        in_degree = {name: len(task.deps) for name, task in self.tasks.items()}
+        dependents = self._dependents()
+
+        ready = [name for name, degree in in_degree.items() if degree == 0]
+        order = []
+
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for child in dependents[name]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    ready.append(child)
+
+        if len(order) != len(self.tasks):
+            cyclic = sorted(name for name, degree in in_degree.items() if degree > 0)
+            raise ValueError(f"Ciclo detectado entre as tarefas: {cyclic}")
+
+        return order
+
+    def _dependents(self) -> Dict[str, List[str]]:
+        """
+        Mapeia cada tarefa para as tarefas que dependem dela
+        """
+        dependents: Dict[str, List[str]] = {name: [] for name in self.tasks}
+        for name, task in self.tasks.items():
+            for dep in task.deps:
+                dependents[dep].append(name)
+        return dependents
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Executa todas as tarefas respeitando as dependências
+
+        Tarefas sem dependências pendentes são submetidas imediatamente; cada
+        conclusão libera as tarefas seguintes, sem esperar o restante do grafo.
+
+        Returns:
+            Dicionário {nome_da_tarefa: resultado}
+
+        Raises:
+            Exception: A primeira exceção levantada por uma tarefa (as tarefas
+                ainda não iniciadas são canceladas)
+        """
+        in_degree = {name: len(task.deps) for name, task in self.tasks.items()}
+        dependents = self._dependents()
+        results: Dict[str, Any] = {}
+
+        needs_processes = any(task.executor == EXECUTOR_PROCESS for task in self.tasks.values())
+
+        logger.info(
+            "Executando DAG do pipeline",
+            total_tasks=len(self.tasks),
+            max_workers=self.max_workers,
+            uses_processes=needs_processes
+        )
+
+        thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        process_pool = ProcessPoolExecutor(max_workers=self.max_processes) if needs_processes else None
+        pending: Dict[Future, str] = {}
+
+        def submit(name: str) -> None:
+            task = self.tasks[name]
+            pool: Executor = process_pool if task.executor == EXECUTOR_PROCESS else thread_pool
+            dep_results = tuple(results[dep] for dep in task.deps)
+            pending[pool.submit(task.fn, *task.args, *dep_results)] = name
+            logger.debug("Tarefa submetida", task=name, executor=task.executor)
+
+        try:
+            for name in self.order:
+                if in_degree[name] == 0:
+                    submit(name)
+
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = pending.pop(future)
+                    results[name] = future.result()
+                    logger.debug("Tarefa concluída", task=name)
+
+                    for child in dependents[name]:
+                        in_degree[child] -= 1
+                        if in_degree[child] == 0:
+                            submit(child)
+
+            return results
+
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+        finally:
+            thread_pool.shutdown(wait=True, cancel_futures=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=True, cancel_futures=True)
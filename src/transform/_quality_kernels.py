@@ -0,0 +1,78 @@
+"""
+Kernels Numba das Verificações de Qualidade
+Pipeline de Cotações Cambiais - MBA Data Engineering
+
+Este módulo é responsável por:
+1. Calcular mínimo, máximo, média e desvio das taxas em uma única passada
+2. Contar taxas zeradas, negativas e extremas na mesma passada, sem máscaras
+3. Funcionar sem numba (mesmo código em Python puro, usado só em testes)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """
+        Substituto sem compilação para quando numba não está instalado
+        """
+        def decorator(func):
+            return func
+        return decorator
+
+# Taxas acima deste valor são contadas como extremas (mesmo limite do caminho NumPy)
+EXTREME_RATE = 1000
+
+
+@njit(nogil=True, cache=True)
+def rate_stats_kernel(rates):
+    """
+    Estatísticas das taxas em uma passada (média/variância de Welford)
+
+    Args:
+        rates: Taxas de câmbio (NaN são ignorados, como no pandas)
+
+    Returns:
+        Tupla (count, min, max, mean, std, zero_rates, negative_rates, extreme_rates);
+        min/max/mean são NaN sem valores e std é NaN com menos de 2 valores
+    """
+    count = 0
+    low = np.inf
+    high = -np.inf
+    mean = 0.0
+    m2 = 0.0
+    zero_rates = 0
+    negative_rates = 0
+    extreme_rates = 0
+
+    for i in range(rates.shape[0]):
+        value = float(rates[i])
+        if np.isnan(value):
+            continue
+
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+
+        if value < low:
+            low = value
+        if value > high:
+            high = value
+
+        if value == 0:
+            zero_rates += 1
+        elif value < 0:
+            negative_rates += 1
+        elif value > EXTREME_RATE:
+            extreme_rates += 1
+
+    if count == 0:
+        return 0, np.nan, np.nan, np.nan, np.nan, 0, 0, 0
+
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    return count, low, high, mean, std, zero_rates, negative_rates, extreme_rates
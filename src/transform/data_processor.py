@@ -10,8 +10,11 @@ Este módulo é responsável por:
 5. Salvar em Parquet na camada Silver
 """
 
-import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import numpy as np
 from datetime import datetime, date
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
@@ -20,8 +23,64 @@ from pydantic import BaseModel, validator, ValidationError
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+from src.transform._quality_kernels import EXTREME_RATE, HAS_NUMBA, rate_stats_kernel
+from src.utils import fast_json
+
 logger = structlog.get_logger()
 
+# Limites compartilhados entre o modelo Pydantic e a validação vetorizada
+MAX_EXCHANGE_RATE = 1_000_000
+MIN_TIMESTAMP_YEAR = 2000
+MAX_TIMESTAMP_YEAR = 2030
+
+# Abaixo disso o caminho NumPy é mais rápido que chamar o kernel numba
+NUMBA_MIN_ROWS = 10_000
+
+# Campos de um registro de cotação, na ordem do ExchangeRateRecord
+RECORD_COLUMNS = [
+    'base_currency', 'target_currency', 'exchange_rate', 'collection_timestamp',
+    'collection_date', 'last_update_timestamp', 'pipeline_version'
+]
+
+# Schema da camada Silver: o Arrow não precisa inferir tipos ao gravar
+SILVER_SCHEMA = pa.schema([
+    pa.field('base_currency', pa.string()),
+    pa.field('target_currency', pa.string()),
+    pa.field('exchange_rate', pa.float32()),
+    pa.field('collection_timestamp', pa.timestamp('ns')),
+    pa.field('collection_date', pa.date32()),
+    pa.field('last_update_timestamp', pa.timestamp('ns')),
+    pa.field('pipeline_version', pa.string())
+])
+
+# Escrita Parquet do Silver: dicionário só nas colunas de baixa cardinalidade e
+# BYTE_STREAM_SPLIT na taxa (separa os bytes do float, que o snappy comprime melhor)
+SILVER_PARQUET_OPTIONS = {
+    'compression': 'snappy',
+    'use_dictionary': ['base_currency', 'target_currency', 'pipeline_version'],
+    'column_encoding': {'exchange_rate': 'BYTE_STREAM_SPLIT'},
+    'data_page_size': 1024 * 1024
+}
+
+CURRENCY_CODE_ERROR = 'Código de moeda deve ter 3 letras (ex: USD, BRL)'
+
+# Código de moeda: exatamente 3 letras ASCII, em qualquer caixa (compilado uma vez)
+CURRENCY_CODE_PATTERN = re.compile(r'[A-Za-z]{3}')
+TIMESTAMP_RANGE_ERROR = 'Timestamp fora do intervalo válido (2000-2030)'
+
+
+def is_valid_currency_code(code: Any) -> bool:
+    """
+    Verifica se o valor é um código de moeda de 3 letras
+    
+    Args:
+        code: Valor a verificar (não textuais são inválidos)
+        
+    Returns:
+        True se o código casa com CURRENCY_CODE_PATTERN
+    """
+    return isinstance(code, str) and CURRENCY_CODE_PATTERN.fullmatch(code) is not None
+
 
 class ExchangeRateRecord(BaseModel):
     """
@@ -38,8 +97,8 @@ class ExchangeRateRecord(BaseModel):
     @validator('base_currency', 'target_currency')
     def validate_currency_code(cls, v):
         """Valida código de moeda - deve ter 3 caracteres alfabéticos"""
-        if not v or len(v) != 3 or not v.isalpha():
-            raise ValueError('Código de moeda deve ter 3 letras (ex: USD, BRL)')
+        if not is_valid_currency_code(v):
+            raise ValueError(CURRENCY_CODE_ERROR)
         return v.upper()
     
     @validator('exchange_rate')
@@ -49,17 +108,95 @@ class ExchangeRateRecord(BaseModel):
             raise ValueError('Taxa de câmbio deve ser positiva')
         if not pd.isna(v) and (v == float('inf') or v != v):  # Check for inf and NaN
             raise ValueError('Taxa de câmbio deve ser um número válido')
-        if v > 1000000:  # Sanity check
+        if v > MAX_EXCHANGE_RATE:  # Sanity check
             raise ValueError('Taxa de câmbio parece muito alta (>1M)')
         return round(v, 8)  # Precisão de 8 casas decimais
     
     @validator('collection_timestamp', 'last_update_timestamp')
     def validate_timestamps(cls, v):
         """Valida timestamps"""
-        if v.year < 2000 or v.year > 2030:
-            raise ValueError('Timestamp fora do intervalo válido (2000-2030)')
+        if v.year < MIN_TIMESTAMP_YEAR or v.year > MAX_TIMESTAMP_YEAR:
+            raise ValueError(TIMESTAMP_RANGE_ERROR)
         return v
 
+# Compatibilidade Pydantic v1/v2 resolvida uma vez, não a cada registro
+_PYDANTIC_V2 = hasattr(ExchangeRateRecord, 'model_validate')
+
+
+def _validate_model(record: Dict[str, Any]) -> ExchangeRateRecord:
+    """
+    Valida um registro com todos os validadores do ExchangeRateRecord
+    """
+    if _PYDANTIC_V2:
+        return ExchangeRateRecord.model_validate(record)
+    return ExchangeRateRecord(**record)
+
+
+def _model_to_dict(record: ExchangeRateRecord) -> Dict[str, Any]:
+    """
+    Converte um ExchangeRateRecord em dict
+    """
+    return record.model_dump() if _PYDANTIC_V2 else record.dict()
+
+
+def _to_datetime64(value: datetime) -> np.datetime64:
+    """
+    Converte um datetime em datetime64[ns] (NaT fora do intervalo representável,
+    que a validação rejeita, em vez do estouro silencioso do np.datetime64)
+    """
+    timestamp = pd.to_datetime(value, errors='coerce')
+    return np.datetime64('NaT', 'ns') if timestamp is pd.NaT else timestamp.to_datetime64()
+
+
+def _is_missing(value: Any) -> bool:
+    """
+    Indica valor ausente (None/NaN/NaT) em um campo escalar
+    """
+    return value is None or (not isinstance(value, str) and pd.isna(value))
+
+
+def _rate_stats(rates: np.ndarray) -> Dict[str, Any]:
+    """
+    Estatísticas da distribuição das taxas em uma passada sobre o array
+    
+    Com numba e arrays grandes, mínimo/máximo/média/desvio e as contagens saem
+    de uma única passada compilada; a mediana continua com np.nanmedian.
+    
+    Args:
+        rates: Taxas de câmbio (NaN são ignorados, como no pandas)
+        
+    Returns:
+        Dicionário com mínimo, máximo, média, mediana, desvio e contagens
+    """
+    if rates.dtype.kind != 'f':
+        rates = rates.astype(np.float64)
+    
+    if HAS_NUMBA and rates.size >= NUMBA_MIN_ROWS:
+        count, low, high, mean, std, zero_rates, negative_rates, extreme_rates = rate_stats_kernel(rates)
+        stats = [low, high, mean, np.nanmedian(rates) if count else np.nan, std]
+        counts = [zero_rates, negative_rates, extreme_rates]
+    else:
+        valid = rates[~np.isnan(rates)]
+        if valid.size:
+            stats = [valid.min(), valid.max(), valid.mean(), np.median(valid),
+                     valid.std(ddof=1) if valid.size > 1 else np.nan]
+        else:
+            stats = [np.nan] * 5
+        counts = [np.count_nonzero(valid == 0), np.count_nonzero(valid < 0),
+                  np.count_nonzero(valid > EXTREME_RATE)]
+    
+    return {
+        'min_rate': float(stats[0]),
+        'max_rate': float(stats[1]),
+        'mean_rate': float(stats[2]),
+        'median_rate': float(stats[3]),
+        'std_rate': float(stats[4]),
+        'zero_rates': int(counts[0]),
+        'negative_rates': int(counts[1]),
+        'extreme_rates': int(counts[2])
+    }
+
+
 class DataQualityChecker:
     """
     Classe para verificações de qualidade dos dados
@@ -69,21 +206,27 @@ class DataQualityChecker:
         self.quality_issues = []
         self.logger = structlog.get_logger("DataQualityChecker")
     
-    def check_completeness(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def check_completeness(self, df: pd.DataFrame, missing_data: Optional[pd.Series] = None) -> Dict[str, Any]:
         """
         Verifica completude dos dados
+        
+        Args:
+            df: DataFrame avaliado
+            missing_data: Nulos por coluna, se já calculados
         """
         total_records = len(df)
-        missing_data = df.isnull().sum()
+        if missing_data is None:
+            missing_data = df.isnull().sum()
+        total_missing = int(missing_data.sum())
         
         quality_report = {
             'total_records': total_records,
             'missing_values': missing_data.to_dict(),
-            'completeness_score': 1 - (missing_data.sum() / (len(df.columns) * total_records))
+            'completeness_score': 1 - (total_missing / (len(df.columns) * total_records))
         }
         
         # Log issues
-        if missing_data.sum() > 0:
+        if total_missing > 0:
             self.quality_issues.append(f"Dados faltantes encontrados: {missing_data.to_dict()}")
             
         return quality_report
@@ -95,11 +238,11 @@ class DataQualityChecker:
         base_currencies = df['base_currency'].unique()
         target_currencies = df['target_currency'].unique()
         
-        # Verificar se códigos têm 3 caracteres
-        invalid_codes = []
-        for currency in list(base_currencies) + list(target_currencies):
-            if len(currency) != 3 or not currency.isalpha():
-                invalid_codes.append(currency)
+        # Verificar se códigos têm 3 caracteres (uma checagem sobre todos os códigos únicos)
+        codes = pd.Series(np.concatenate([np.asarray(base_currencies, dtype=object),
+                                          np.asarray(target_currencies, dtype=object)]))
+        invalid_mask = codes.str.fullmatch(CURRENCY_CODE_PATTERN).ne(True)
+        invalid_codes = codes[invalid_mask].tolist()
         
         quality_report = {
             'unique_base_currencies': len(base_currencies),
@@ -113,22 +256,18 @@ class DataQualityChecker:
             
         return quality_report
     
-    def check_rate_distribution(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def check_rate_distribution(self, df: pd.DataFrame, rates: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Verifica distribuição das taxas de câmbio
+        
+        Args:
+            df: DataFrame avaliado
+            rates: Array de exchange_rate, se já extraído
         """
-        rates = df['exchange_rate']
+        if rates is None:
+            rates = df['exchange_rate'].to_numpy()
         
-        quality_report = {
-            'min_rate': float(rates.min()),
-            'max_rate': float(rates.max()),
-            'mean_rate': float(rates.mean()),
-            'median_rate': float(rates.median()),
-            'std_rate': float(rates.std()),
-            'zero_rates': int((rates == 0).sum()),
-            'negative_rates': int((rates < 0).sum()),
-            'extreme_rates': int((rates > 1000).sum())
-        }
+        quality_report = _rate_stats(rates)
         
         # Identificar possíveis problemas
         if quality_report['zero_rates'] > 0:
@@ -140,12 +279,27 @@ class DataQualityChecker:
             
         return quality_report
     
-    def generate_quality_report(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def generate_quality_report(self, df: pd.DataFrame, table: Optional[pa.Table] = None) -> Dict[str, Any]:
         """
         Gera relatório completo de qualidade
+        
+        Args:
+            df: DataFrame avaliado
+            table: Mesmos dados em Arrow (nulos no sentido do pandas), se já montados;
+                os nulos vêm da contagem mantida pelo Arrow em cada coluna, sem
+                varrer o DataFrame, e as taxas do próprio buffer Arrow
         """
         self.quality_issues = []  # Reset issues
         
+        # Calculados uma vez e compartilhados entre as verificações
+        if table is not None:
+            missing_data = pd.Series({col: table.column(col).null_count for col in df.columns}, dtype='int64')
+            rates = table.column('exchange_rate').to_numpy()
+        else:
+            missing_data = df.isnull().sum()
+            rates = df['exchange_rate'].to_numpy()
+        total_missing = int(missing_data.sum())
+        
         report = {
             'timestamp': datetime.now().isoformat(),
             'dataset_info': {
@@ -153,40 +307,49 @@ class DataQualityChecker:
                 'columns': list(df.columns),
                 'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024 / 1024
             },
-            'completeness': self.check_completeness(df),
+            'completeness': self.check_completeness(df, missing_data=missing_data),
             'currency_consistency': self.check_currency_consistency(df),
-            'rate_distribution': self.check_rate_distribution(df),
+            'rate_distribution': self.check_rate_distribution(df, rates=rates),
             'quality_issues': self.quality_issues,
-            'overall_quality_score': self._calculate_overall_score(df)
+            'overall_quality_score': self._calculate_overall_score(
+                df, total_missing=total_missing, rates=rates
+            )
         }
         
         return report
     
-    def _calculate_overall_score(self, df: pd.DataFrame) -> float:
+    def _calculate_overall_score(self, df: pd.DataFrame, total_missing: Optional[int] = None,
+                                 rates: Optional[np.ndarray] = None) -> float:
         """
         Calcula score geral de qualidade (0-1)
+        
+        Args:
+            df: DataFrame avaliado
+            total_missing: Total de valores nulos, se já calculado
+            rates: Array de exchange_rate, se já extraído
         """
         score = 1.0
+        n_records = len(df)
         
         # Penalizar por dados faltantes
-        missing_ratio = df.isnull().sum().sum() / (len(df) * len(df.columns))
+        if total_missing is None:
+            total_missing = df.isnull().sum().sum()
+        missing_ratio = total_missing / (n_records * len(df.columns))
         score -= missing_ratio * 0.3
         
         # Penalizar por taxas inválidas
-        invalid_rates = ((df['exchange_rate'] <= 0) | 
-                        (df['exchange_rate'] > 1000000)).sum()
-        if len(df) > 0:
-            score -= (invalid_rates / len(df)) * 0.4
+        if rates is None:
+            rates = df['exchange_rate'].to_numpy()
+        invalid_rates = np.count_nonzero((rates <= 0) | (rates > MAX_EXCHANGE_RATE))
+        if n_records > 0:
+            score -= (invalid_rates / n_records) * 0.4
         
-        # Penalizar por códigos de moeda inválidos
-        invalid_currencies = 0
-        for col in ['base_currency', 'target_currency']:
-            invalid_currencies += df[col].apply(
-                lambda x: len(str(x)) != 3 or not str(x).isalpha()
-            ).sum()
+        # Penalizar por códigos de moeda inválidos (base e destino em uma única checagem)
+        codes = pd.concat([df['base_currency'], df['target_currency']], ignore_index=True).astype(str)
+        invalid_currencies = int((~codes.str.fullmatch(CURRENCY_CODE_PATTERN)).sum())
         
-        if len(df) > 0:
-            score -= (invalid_currencies / (len(df) * 2)) * 0.3
+        if n_records > 0:
+            score -= (invalid_currencies / (n_records * 2)) * 0.3
         
         return max(0.0, score)
 
@@ -234,8 +397,9 @@ class DataTransformer:
         
         logger.info("Carregando dados brutos", file_path=str(file_path))
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Leitura em bytes (mmap para arquivos grandes de backfill), sem cópia em str
+        file_size = file_path.stat().st_size
+        data = fast_json.load_file(file_path)
         
         # Validar estrutura básica
         if 'pipeline_metadata' not in data or 'api_response' not in data:
@@ -243,13 +407,13 @@ class DataTransformer:
         
         logger.info(
             "Dados brutos carregados",
-            file_size_kb=file_path.stat().st_size / 1024,
+            file_size_kb=file_size / 1024,
             pipeline_version=data['pipeline_metadata'].get('pipeline_version', 'unknown')
         )
         
         return data
     
-    def transform_to_tabular(self, raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def transform_to_tabular(self, raw_data: Dict[str, Any]) -> Dict[str, np.ndarray]:
         """
         Transforma dados JSON em formato tabular
         
@@ -257,7 +421,7 @@ class DataTransformer:
             raw_data: Dados brutos do JSON
             
         Returns:
-            Lista de registros tabulares
+            Dicionário de colunas (arrays NumPy paralelos, uma posição por cotação)
         """
         logger.info("Iniciando transformação para formato tabular")
         
@@ -280,55 +444,141 @@ class DataTransformer:
         base_currency = api_response['base_code']
         conversion_rates = api_response['conversion_rates']
         
-        # Transformar cada taxa em um registro
-        records = []
-        for target_currency, exchange_rate in conversion_rates.items():
-            record = {
-                'base_currency': base_currency,
-                'target_currency': target_currency,
-                'exchange_rate': float(exchange_rate),
-                'collection_timestamp': collection_timestamp,
-                'collection_date': collection_date,
-                'last_update_timestamp': last_update_timestamp,
-                'pipeline_version': metadata['pipeline_version']
-            }
-            records.append(record)
+        # Timestamps como datetime64[ns]: o array vai para o pandas/Arrow sem
+        # conversão objeto a objeto
+        collection_ts64 = _to_datetime64(collection_timestamp)
+        last_update_ts64 = _to_datetime64(last_update_timestamp)
+        
+        # Uma coluna por campo; os valores comuns a todas as cotações são repetidos
+        n_rates = len(conversion_rates)
+        columns = {
+            'base_currency': np.full(n_rates, base_currency, dtype=object),
+            'target_currency': np.fromiter(conversion_rates.keys(), dtype=object, count=n_rates),
+            'exchange_rate': np.fromiter(conversion_rates.values(), dtype=np.float64, count=n_rates),
+            'collection_timestamp': np.full(n_rates, collection_ts64, dtype='datetime64[ns]'),
+            'collection_date': np.full(n_rates, collection_date, dtype=object),
+            'last_update_timestamp': np.full(n_rates, last_update_ts64, dtype='datetime64[ns]'),
+            'pipeline_version': np.full(n_rates, metadata['pipeline_version'], dtype=object)
+        }
         
         logger.info(
             "Transformação tabular concluída",
-            total_records=len(records),
+            total_records=n_rates,
             base_currency=base_currency,
-            unique_targets=len(conversion_rates)
+            unique_targets=n_rates
         )
         
-        return records
+        return columns
     
-    def validate_records(self, records: List[Dict[str, Any]]) -> List[ExchangeRateRecord]:
+    def validate_records(self, records: Union[List[Dict[str, Any]], Dict[str, Any]],
+                         trusted: bool = True) -> pd.DataFrame:
         """
-        Valida registros usando Pydantic
+        Valida registros com verificações vetorizadas (mesmas regras do ExchangeRateRecord)
+        
+        Cada regra é avaliada uma vez sobre a coluna inteira, em vez de instanciar
+        um modelo Pydantic por cotação.
         
         Args:
-            records: Lista de registros não validados
+            records: Lista de registros (dicts) ou dicionário de colunas
+            trusted: Se False, valida cada registro com o modelo Pydantic completo
+                (para entradas que não vêm do transform_to_tabular)
             
         Returns:
-            Lista de registros validados
+            DataFrame só com os registros válidos (códigos em maiúsculas, taxas com 8 casas)
         """
-        logger.info("Iniciando validação de registros", total_records=len(records))
+        df = pd.DataFrame(records).reindex(columns=RECORD_COLUMNS)
+        total_records = len(df)
         
-        validated_records = []
+        logger.info("Iniciando validação de registros", total_records=total_records, trusted=trusted)
+        
+        if not trusted:
+            return self._validate_with_model(df)
+        
+        base_currency = df['base_currency'].astype(object)
+        target_currency = df['target_currency'].astype(object)
+        rates = pd.to_numeric(df['exchange_rate'], errors='coerce')
+        collection_ts = pd.to_datetime(df['collection_timestamp'], errors='coerce')
+        update_ts = pd.to_datetime(df['last_update_timestamp'], errors='coerce')
+        
+        # Máscara por regra, com a mensagem usada no log dos registros inválidos
+        checks = [
+            (self._currency_code_mask(base_currency), f"base_currency: {CURRENCY_CODE_ERROR}"),
+            (self._currency_code_mask(target_currency), f"target_currency: {CURRENCY_CODE_ERROR}"),
+            ((rates > 0).to_numpy(), 'exchange_rate: Taxa de câmbio deve ser positiva'),
+            (np.isfinite(rates.to_numpy(dtype=np.float64)), 'exchange_rate: Taxa de câmbio deve ser um número válido'),
+            ((rates <= MAX_EXCHANGE_RATE).to_numpy(), 'exchange_rate: Taxa de câmbio parece muito alta (>1M)'),
+            (collection_ts.dt.year.between(MIN_TIMESTAMP_YEAR, MAX_TIMESTAMP_YEAR).to_numpy(),
+             f"collection_timestamp: {TIMESTAMP_RANGE_ERROR}"),
+            (update_ts.dt.year.between(MIN_TIMESTAMP_YEAR, MAX_TIMESTAMP_YEAR).to_numpy(),
+             f"last_update_timestamp: {TIMESTAMP_RANGE_ERROR}"),
+            (df['collection_date'].notna().to_numpy(), 'collection_date: Campo obrigatório'),
+            (df['pipeline_version'].notna().to_numpy(), 'pipeline_version: Campo obrigatório')
+        ]
+        valid = np.logical_and.reduce([mask for mask, _ in checks]) if total_records else np.ones(0, dtype=bool)
+        
+        # Detalhes só para os registros inválidos (normalmente nenhum)
         validation_errors = []
+        for i in np.flatnonzero(~valid):
+            errors = [message for mask, message in checks if not mask[i]]
+            validation_errors.append({
+                'record_index': int(i),
+                'record': df.iloc[i].to_dict(),
+                'errors': errors
+            })
+            logger.warning(
+                "Erro de validação no registro",
+                record_index=int(i),
+                errors=errors
+            )
+        
+        validated_df = df.assign(
+            base_currency=base_currency.str.upper(),
+            target_currency=target_currency.str.upper(),
+            exchange_rate=rates.round(8),
+            collection_timestamp=collection_ts,
+            last_update_timestamp=update_ts
+        )[valid].reset_index(drop=True)
+        
+        logger.info(
+            "Validação concluída",
+            valid_records=len(validated_df),
+            invalid_records=len(validation_errors),
+            validation_success_rate=len(validated_df) / total_records if total_records else 0
+        )
         
-        for i, record in enumerate(records):
+        if validation_errors:
+            logger.error(
+                "Registros com erro de validação encontrados",
+                total_errors=len(validation_errors),
+                sample_errors=validation_errors[:3]  # Primeiros 3 erros como exemplo
+            )
+        
+        return validated_df
+    
+    def _validate_with_model(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Valida registro a registro com o ExchangeRateRecord (caminho não confiável)
+        
+        Args:
+            df: Registros a validar, com as colunas de RECORD_COLUMNS
+            
+        Returns:
+            DataFrame só com os registros válidos
+        """
+        validated_rows = []
+        validation_errors = []
+        
+        for i, record in enumerate(df.to_dict('records')):
+            # Campos ausentes chegam como NaN; removê-los faz o Pydantic acusar a falta
+            record = {key: value for key, value in record.items() if not _is_missing(value)}
             try:
-                validated_record = ExchangeRateRecord(**record)
-                validated_records.append(validated_record)
+                validated_rows.append(_model_to_dict(_validate_model(record)))
             except ValidationError as e:
-                error_info = {
+                validation_errors.append({
                     'record_index': i,
                     'record': record,
                     'errors': e.errors()
-                }
-                validation_errors.append(error_info)
+                })
                 logger.warning(
                     "Erro de validação no registro",
                     record_index=i,
@@ -337,9 +587,9 @@ class DataTransformer:
         
         logger.info(
             "Validação concluída",
-            valid_records=len(validated_records),
+            valid_records=len(validated_rows),
             invalid_records=len(validation_errors),
-            validation_success_rate=len(validated_records) / len(records) if records else 0
+            validation_success_rate=len(validated_rows) / len(df) if len(df) else 0
         )
         
         if validation_errors:
@@ -349,31 +599,29 @@ class DataTransformer:
                 sample_errors=validation_errors[:3]  # Primeiros 3 erros como exemplo
             )
         
-        return validated_records
+        return pd.DataFrame(validated_rows, columns=RECORD_COLUMNS)
+    
+    @staticmethod
+    def _currency_code_mask(codes: pd.Series) -> np.ndarray:
+        """
+        Máscara de códigos com exatamente 3 letras (valores não textuais são inválidos)
+        """
+        valid = codes.str.fullmatch(CURRENCY_CODE_PATTERN).eq(True)
+        return valid.to_numpy(dtype=bool)
     
-    def create_dataframe(self, validated_records: List[ExchangeRateRecord]) -> pd.DataFrame:
+    def create_dataframe(self, validated_df: pd.DataFrame) -> pd.DataFrame:
         """
-        Cria DataFrame a partir dos registros validados
+        Cria o DataFrame final a partir dos registros validados
         
         Args:
-            validated_records: Lista de registros validados
+            validated_df: DataFrame retornado por validate_records
             
         Returns:
             DataFrame pandas
         """
-        logger.info("Criando DataFrame", total_records=len(validated_records))
+        logger.info("Criando DataFrame", total_records=len(validated_df))
         
-        # Converter registros Pydantic para dicts
-        records_dict = []
-        for record in validated_records:
-            # Compatibilidade Pydantic v1/v2
-            if hasattr(record, 'model_dump'):
-                records_dict.append(record.model_dump())  # v2
-            else:
-                records_dict.append(record.dict())  # v1
-        
-        # Criar DataFrame
-        df = pd.DataFrame(records_dict)
+        df = validated_df
         
         # Otimizar tipos de dados
         df = self._optimize_datatypes(df)
@@ -391,25 +639,48 @@ class DataTransformer:
         """
         Otimiza tipos de dados do DataFrame
         """
-        # REMOVIDO: Conversão para categoria que estava causando erro
-        # categorical_columns = ['base_currency', 'target_currency', 'pipeline_version']
-        # for col in categorical_columns:
-        #     if col in df.columns:
-        #         df[col] = df[col].astype('category')
-        
-        # Converter exchange_rate para float32 (suficiente para taxas)
+        # Colunas de baixa cardinalidade como categoria (códigos em vez de N strings).
+        # Só vale em memória: o SILVER_SCHEMA grava essas colunas como string, então
+        # o Gold continua lendo object e não recebe categorias divergentes entre datas
+        categorical_columns = ['base_currency', 'target_currency', 'pipeline_version']
+        for col in categorical_columns:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        # Converter exchange_rate para float32 (suficiente para taxas); o float64
+        # só existe até o arredondamento da validação, e a conversão é única
         if 'exchange_rate' in df.columns:
-            df['exchange_rate'] = df['exchange_rate'].astype('float32')
+            df['exchange_rate'] = df['exchange_rate'].astype('float32', copy=False)
         
         return df
     
-    def save_to_parquet(self, df: pd.DataFrame, date_str: str) -> str:
+    @staticmethod
+    def to_arrow_table(df: pd.DataFrame) -> pa.Table:
+        """
+        Monta a tabela Arrow da camada Silver a partir das colunas do DataFrame
+        
+        O schema é fixo (sem inferência de tipos) e NaN/NaT/None viram nulos,
+        com a mesma semântica do isnull() do pandas.
+        
+        Args:
+            df: DataFrame com as colunas do SILVER_SCHEMA
+            
+        Returns:
+            Tabela Arrow
+        """
+        return pa.Table.from_arrays(
+            [pa.array(df[field.name].to_numpy(), type=field.type, from_pandas=True) for field in SILVER_SCHEMA],
+            schema=SILVER_SCHEMA
+        )
+    
+    def save_to_parquet(self, df: pd.DataFrame, date_str: str, table: Optional[pa.Table] = None) -> str:
         """
         Salva DataFrame em formato Parquet
         
         Args:
             df: DataFrame a ser salvo
             date_str: Data para nome do arquivo
+            table: Tabela Arrow já montada com to_arrow_table (evita reconverter o DataFrame)
             
         Returns:
             Caminho do arquivo salvo
@@ -420,13 +691,12 @@ class DataTransformer:
         
         logger.info("Salvando em formato Parquet", filepath=str(filepath))
         
+        # Montar a tabela Arrow direto das colunas, sem a conversão genérica do pandas
+        if table is None:
+            table = self.to_arrow_table(df)
+        
         # Salvar com compressão
-        df.to_parquet(
-            filepath,
-            engine='pyarrow',
-            compression='snappy',
-            index=False
-        )
+        pq.write_table(table, filepath, **SILVER_PARQUET_OPTIONS)
         
         # Verificar arquivo salvo
         file_size_kb = filepath.stat().st_size / 1024
@@ -468,23 +738,25 @@ class DataTransformer:
             # 1. Carregar dados brutos
             raw_data = self.load_raw_data(date_str)
             
-            # 2. Transformar para formato tabular
-            records = self.transform_to_tabular(raw_data)
+            # 2. Transformar para formato tabular (dicionário de colunas)
+            columns = self.transform_to_tabular(raw_data)
+            total_raw_records = len(columns['exchange_rate'])
             
             # 3. Validar registros
-            validated_records = self.validate_records(records)
+            validated_df = self.validate_records(columns)
             
-            if not validated_records:
+            if validated_df.empty:
                 raise ValueError("Nenhum registro válido após validação")
             
             # 4. Criar DataFrame
-            df = self.create_dataframe(validated_records)
+            df = self.create_dataframe(validated_df)
             
-            # 5. Verificar qualidade dos dados
-            quality_report = self.quality_checker.generate_quality_report(df)
+            # 5. Verificar qualidade dos dados (sobre a mesma tabela Arrow que será gravada)
+            table = self.to_arrow_table(df)
+            quality_report = self.quality_checker.generate_quality_report(df, table=table)
             
             # 6. Salvar em Parquet
-            output_filepath = self.save_to_parquet(df, date_str)
+            output_filepath = self.save_to_parquet(df, date_str, table=table)
             
             # Calcular tempo de execução
             end_time = datetime.now()
@@ -497,12 +769,12 @@ class DataTransformer:
                 'execution_time_seconds': execution_time,
                 'input': {
                     'raw_file': str(self.raw_data_path / f"{date_str}.json"),
-                    'total_raw_records': len(records)
+                    'total_raw_records': total_raw_records
                 },
                 'processing': {
-                    'validated_records': len(validated_records),
-                    'invalid_records': len(records) - len(validated_records),
-                    'validation_success_rate': len(validated_records) / len(records)
+                    'validated_records': len(validated_df),
+                    'invalid_records': total_raw_records - len(validated_df),
+                    'validation_success_rate': len(validated_df) / total_raw_records
                 },
                 'output': {
                     'silver_file': output_filepath,
@@ -542,6 +814,60 @@ class DataTransformer:
                 'error_type': type(e).__name__
             }
 
+    
+    def process_dates(self, target_dates: List[Union[str, date]],
+                      max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Processa várias datas em paralelo, um processo por data
+        
+        As datas são independentes (um arquivo Raw de entrada e um Parquet de
+        saída cada), então cada worker monta seu próprio DataTransformer com os
+        mesmos caminhos e nada é compartilhado entre processos.
+        
+        Args:
+            target_dates: Datas a processar (strings YYYY-MM-DD ou objetos date)
+            max_workers: Número de processos (padrão: os.cpu_count())
+            
+        Returns:
+            Relatórios do processamento, na ordem de target_dates
+        """
+        date_strs = [
+            d.strftime('%Y-%m-%d') if isinstance(d, date) else d
+            for d in target_dates
+        ]
+        workers = min(max_workers or os.cpu_count() or 1, len(date_strs))
+        
+        logger.info("Processando datas em paralelo", total_dates=len(date_strs), max_workers=workers)
+        
+        # Uma data só (ou um worker) não compensa subir processos
+        if workers <= 1:
+            reports = [self.process_date(d) for d in date_strs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                reports = list(executor.map(
+                    _process_date_worker,
+                    [str(self.raw_data_path)] * len(date_strs),
+                    [str(self.silver_data_path)] * len(date_strs),
+                    date_strs
+                ))
+        
+        failed = [r['target_date'] for r in reports if r['status'] != 'success']
+        logger.info(
+            "Processamento de datas concluído",
+            successful=len(reports) - len(failed),
+            failed=len(failed),
+            failed_dates=failed
+        )
+        
+        return reports
+
+
+def _process_date_worker(raw_data_path: str, silver_data_path: str, date_str: str) -> Dict[str, Any]:
+    """
+    Processa uma data em um processo worker (função de módulo para ser serializável)
+    """
+    return DataTransformer(raw_data_path, silver_data_path).process_date(date_str)
+
 
 def main():
     """
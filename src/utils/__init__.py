@@ -8,6 +8,7 @@ em todo o pipeline.
 Módulos:
 - logging_config: Configuração de logging estruturado
 - data_validator: Validação e verificação de qualidade dos dados
+- fast_json: Leitura/escrita de JSON (orjson com fallback para json)
 """
 
 from .logging_config import setup_logging, get_logger, LoggerMixin
@@ -65,6 +65,29 @@ class CurrencyValidator:
         # Verificar se está na lista de moedas conhecidas
         return currency_upper in cls.VALID_CURRENCIES
     
+    @classmethod
+    def is_valid_currency_code_vec(cls, currency_codes) -> np.ndarray:
+        """
+        Versão vetorizada de is_valid_currency_code
+        
+        Args:
+            currency_codes: Sequência/array/Série de códigos de moeda
+            
+        Returns:
+            Array booleano com a validade de cada código
+        """
+        codes = pd.Series(currency_codes, dtype=object)
+        
+        # Checagem de tipo pela inferência do pandas (uma varredura em C): sem
+        # nenhuma string não há código válido, e o acessor .str nem se aplica
+        if pd.api.types.infer_dtype(codes, skipna=True) not in ('string', 'mixed', 'mixed-integer'):
+            return np.zeros(len(codes), dtype=bool)
+        
+        # O acessor .str devolve NaN para valores não textuais, que ficam fora do isin;
+        # a lista de moedas conhecidas só contém códigos de 3 letras
+        normalized = codes.str.upper().str.strip()
+        return normalized.isin(cls.VALID_CURRENCIES).to_numpy()
+    
     @classmethod
     def validate_currency_pair(cls, base: str, target: str) -> Tuple[bool, List[str]]:
         """
@@ -127,6 +150,24 @@ class ExchangeRateValidator:
         except (ValueError, TypeError):
             return False
     
+    @classmethod
+    def is_valid_rate_vec(cls, rates) -> np.ndarray:
+        """
+        Versão vetorizada de is_valid_rate
+        
+        Args:
+            rates: Sequência/array/Série de taxas de câmbio
+            
+        Returns:
+            Array booleano com a validade de cada taxa
+        """
+        # Valores não numéricos viram NaN (inválidos), como o False do is_valid_rate
+        rates_array = pd.to_numeric(pd.Series(rates), errors='coerce').to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        
+        return np.isfinite(rates_array) & (rates_array >= cls.MIN_RATE) & (rates_array <= cls.MAX_RATE)
+    
     @classmethod
     def detect_outliers(cls, rates: pd.Series, method: str = 'iqr') -> pd.Series:
         """
@@ -297,8 +338,9 @@ class DataFrameValidator:
                 
         # Verificar taxas extremas
         if 'exchange_rate' in df.columns:
-            extreme_rates = ((df['exchange_rate'] < ExchangeRateValidator.MIN_RATE) | 
-                           (df['exchange_rate'] > ExchangeRateValidator.MAX_RATE)).sum()
+            rates = pd.to_numeric(df['exchange_rate'], errors='coerce')
+            extreme_rates = ((rates < ExchangeRateValidator.MIN_RATE) | 
+                           (rates > ExchangeRateValidator.MAX_RATE)).sum()
             if extreme_rates > 0:
                 report['issues'].append(f"Taxas extremas encontradas: {extreme_rates} registros")
         
@@ -340,18 +382,21 @@ def generate_validation_summary(df: pd.DataFrame, currency_validator_results: Di
     
     # Validação de taxas
     if 'exchange_rate' in df.columns:
-        rates_valid = df['exchange_rate'].apply(ExchangeRateValidator.is_valid_rate).all()
-        outliers = ExchangeRateValidator.detect_outliers(df['exchange_rate'])
+        rates_valid = bool(ExchangeRateValidator.is_valid_rate_vec(df['exchange_rate']).all())
+        
+        # Estatísticas só sobre os valores numéricos (os demais já tornam all_valid=False)
+        rates = pd.to_numeric(df['exchange_rate'], errors='coerce')
+        outliers = ExchangeRateValidator.detect_outliers(rates)
         
         summary['validation_results']['exchange_rates'] = {
             'all_valid': rates_valid,
             'outliers_count': outliers.sum(),
             'outlier_percentage': (outliers.sum() / len(df)) * 100,
             'rate_statistics': {
-                'min': float(df['exchange_rate'].min()),
-                'max': float(df['exchange_rate'].max()),
-                'mean': float(df['exchange_rate'].mean()),
-                'median': float(df['exchange_rate'].median())
+                'min': float(rates.min()),
+                'max': float(rates.max()),
+                'mean': float(rates.mean()),
+                'median': float(rates.median())
             }
         }
     
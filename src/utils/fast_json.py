@@ -0,0 +1,125 @@
+"""
+Serialização JSON Rápida
+Pipeline de Cotações Cambiais - MBA Data Engineering
+
+Este módulo centraliza leitura e escrita de JSON no pipeline.
+Usa orjson (implementação em C) quando instalado e cai para o
+módulo json da biblioteca padrão caso contrário, com a mesma interface
+e a mesma saída: valores ausentes ou não finitos (NaN, inf, pd.NA, pd.NaT)
+viram null nos dois casos.
+"""
+
+import json
+import math
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Union
+
+import pandas as pd
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+# A partir deste tamanho o arquivo é mapeado em memória (mmap) em vez de
+# copiado para um buffer bytes antes do parse
+MMAP_MIN_BYTES = 1024 * 1024
+
+# orjson.JSONDecodeError é subclasse de json.JSONDecodeError (e de ValueError)
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Desserializa JSON
+
+    Args:
+        data: Conteúdo JSON em bytes ou texto
+
+    Returns:
+        Objeto Python correspondente
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serializa um objeto em JSON UTF-8
+
+    Args:
+        obj: Objeto a serializar (datas/datetimes, inclusive pd.Timestamp, são
+            convertidos para ISO 8601, escalares/arrays NumPy para os tipos Python
+            equivalentes e NaN/inf/pd.NA/pd.NaT para null)
+        indent: Se True, indenta com 2 espaços
+
+    Returns:
+        JSON codificado em bytes UTF-8
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=_default)
+
+    # O json padrão escreveria NaN/Infinity (JSON inválido); o orjson escreve null
+    return json.dumps(
+        _replace_non_finite(obj),
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        default=_default
+    ).encode('utf-8')
+
+
+def load_file(file_path: Union[str, Path]) -> Any:
+    """
+    Lê e desserializa um arquivo JSON
+
+    Com orjson, arquivos grandes (>= MMAP_MIN_BYTES) são lidos via mmap: o
+    parser percorre as páginas do arquivo sem uma cópia intermediária em bytes.
+
+    Args:
+        file_path: Caminho do arquivo
+
+    Returns:
+        Objeto Python correspondente
+    """
+    with open(Path(file_path), 'rb') as f:
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+        return loads(f.read())
+
+
+def _default(obj: Any) -> Any:
+    """
+    Conversão de tipos não suportados nativamente (usada pelos dois backends)
+    """
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if hasattr(obj, 'tolist'):
+        # Escalares e arrays NumPy
+        return _replace_non_finite(obj.tolist())
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """
+    Troca floats NaN/inf por None em dicts, listas e tuplas (backend json padrão)
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
@@ -79,6 +79,9 @@ def setup_logging(
         level=numeric_level,
     )
     
+    # basicConfig não altera um root já configurado (ex: auto-configuração no import)
+    logging.getLogger().setLevel(numeric_level)
+    
     # Configurar handler para arquivo
     log_filename = f"pipeline_{datetime.now().strftime('%Y%m%d')}.log"
     log_filepath = Path(log_file_path) / log_filename
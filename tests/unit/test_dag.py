@@ -0,0 +1,130 @@
+"""
+Testes Unitários para o Executor de DAG
+Pipeline de Cotações Cambiais - MBA Data Engineering
+
+Este arquivo contém testes para validar:
+1. Ordenação topológica das tarefas
+2. Detecção de ciclos e dependências inválidas
+3. Passagem de resultados entre tarefas dependentes
+4. Propagação de erros
+5. Dependências entre datas nas tarefas montadas pelo main
+"""
+
+import argparse
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+import main
+from src.pipeline.dag import Task, DAGPipeline
+
+
+def _concat(prefix, previous=''):
+    return previous + prefix
+
+
+def _fail():
+    raise RuntimeError("falha proposital")
+
+
+class TestDAGPipeline:
+    """
+    Testes para a classe DAGPipeline
+    """
+
+    def test_topological_order_respects_dependencies(self):
+        """
+        Testa se cada tarefa aparece depois de suas dependências
+        """
+        tasks = [
+            Task('load', _concat, deps=('transform',), args=('c',)),
+            Task('ingest', _concat, args=('a',)),
+            Task('transform', _concat, deps=('ingest',), args=('b',)),
+        ]
+
+        order = DAGPipeline(tasks).order
+
+        assert order.index('ingest') < order.index('transform') < order.index('load')
+
+    def test_cycle_raises_error(self):
+        """
+        Testa se ciclos são detectados na construção
+        """
+        tasks = [
+            Task('a', _concat, deps=('b',), args=('a',)),
+            Task('b', _concat, deps=('a',), args=('b',)),
+        ]
+
+        with pytest.raises(ValueError, match="Ciclo detectado"):
+            DAGPipeline(tasks)
+
+    def test_unknown_dependency_raises_error(self):
+        """
+        Testa se dependência inexistente é rejeitada
+        """
+        with pytest.raises(ValueError, match="não existe"):
+            DAGPipeline([Task('a', _concat, deps=('x',), args=('a',))])
+
+    def test_run_passes_dependency_results(self):
+        """
+        Testa se o resultado de cada dependência é repassado à tarefa seguinte
+        """
+        tasks = []
+        for day in ['d1', 'd2']:
+            tasks.append(Task(f'ingest[{day}]', _concat, args=(f'{day}:i',)))
+            tasks.append(Task(f'transform[{day}]', _concat, deps=(f'ingest[{day}]',), args=('>t',)))
+
+        results = DAGPipeline(tasks, max_workers=2).run()
+
+        assert results['transform[d1]'] == 'd1:i>t'
+        assert results['transform[d2]'] == 'd2:i>t'
+
+    def test_run_propagates_task_error(self):
+        """
+        Testa se erro de uma tarefa é propagado e dependentes não executam
+        """
+        tasks = [
+            Task('ingest', _fail),
+            Task('transform', _concat, deps=('ingest',), args=('b',)),
+        ]
+
+        with pytest.raises(RuntimeError, match="falha proposital"):
+            DAGPipeline(tasks).run()
+
+
+class TestBuildPipelineTasks:
+    """
+    Testes para as tarefas do pipeline montadas em main.build_pipeline_tasks
+    """
+
+    def test_load_waits_for_earlier_transforms(self):
+        """
+        Testa que o load[d] só roda depois de todo transform[d'] com d' <= d
+        (a janela do Gold lê os arquivos Silver dos dias anteriores)
+        """
+        dates = [date(2024, 1, 2), date(2024, 1, 1), date(2024, 1, 3)]
+        tasks, final_tasks = main.build_pipeline_tasks(argparse.Namespace(stage='all'), dates)
+
+        deps = {task.name: task.deps for task in tasks}
+        assert deps['load[2024-01-01]'] == ('transform[2024-01-01]',)
+        assert deps['load[2024-01-03]'] == (
+            'transform[2024-01-03]', 'transform[2024-01-01]', 'transform[2024-01-02]'
+        )
+        assert final_tasks == ['llm[2024-01-02]', 'llm[2024-01-01]', 'llm[2024-01-03]']
+
+        order = DAGPipeline(tasks).order
+        for load_date in dates:
+            for transform_date in dates:
+                if transform_date <= load_date:
+                    assert order.index(f'transform[{transform_date}]') < order.index(f'load[{load_date}]')
+
+    def test_run_stage_ignores_window_outputs(self):
+        """
+        Testa que as saídas das transformações da janela não chegam ao estágio
+        """
+        runner = lambda args, logger, input_file: input_file
+        with patch.dict(main._STAGE_RUNNERS, {'load': runner}):
+            result = main.run_stage_for_date('load', argparse.Namespace(), 'silver_d3', 'silver_d1', 'silver_d2')
+
+        assert result == 'silver_d3'
@@ -12,12 +12,14 @@ Este arquivo contém testes para validar:
 import pytest
 import json
 import requests
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock, patch
 from pathlib import Path
 from datetime import date, datetime
 
 # Imports do módulo a ser testado
-from src.ingest.exchange_api import ExchangeRateAPIClient, DataIngester
+from src.ingest.exchange_api import ExchangeRateAPIClient, DataIngester, write_raw_envelope
+from src.ingest.rate_cache import RateCache
+from src.ingest.circuit_breaker import CircuitBreaker, CircuitOpenError, STATE_CLOSED, STATE_OPEN
 
 
 class TestExchangeRateAPIClient:
@@ -36,7 +38,8 @@ class TestExchangeRateAPIClient:
             base_url=self.base_url,
             timeout=10,
             retry_attempts=2,
-            retry_delay=1
+            retry_delay=1,
+            circuit_breaker=CircuitBreaker()
         )
     
     def test_init_with_parameters(self):
@@ -68,6 +71,21 @@ class TestExchangeRateAPIClient:
         assert client.api_key == 'env_api_key'
         assert client.base_url == 'https://env-api.com/v6'
     
+    def test_configure_overrides_environment(self):
+        """
+        Testa se configure() define a API key usada por clientes sem parâmetros
+        """
+        from src.ingest import exchange_api
+        
+        exchange_api.configure(api_key='configured_key', base_url='https://configured.test/v6')
+        try:
+            client = ExchangeRateAPIClient(circuit_breaker=CircuitBreaker())
+        finally:
+            exchange_api._config_overrides.clear()
+        
+        assert client.api_key == 'configured_key'
+        assert client.base_url == 'https://configured.test/v6'
+    
     def test_validate_api_response_success(self):
         """
         Testa validação de resposta válida da API
@@ -124,7 +142,7 @@ class TestExchangeRateAPIClient:
         with pytest.raises(ValueError, match="Nenhuma cotação encontrada"):
             self.client._validate_api_response(empty_response)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_latest_rates_success(self, mock_get):
         """
         Testa coleta bem-sucedida de cotações
@@ -132,7 +150,7 @@ class TestExchangeRateAPIClient:
         # Mock da resposta da API
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'result': 'success',
             'base_code': 'USD',
             'conversion_rates': {
@@ -140,7 +158,7 @@ class TestExchangeRateAPIClient:
                 'EUR': 0.8456
             },
             'time_last_update_utc': 'Mon, 01 Jan 2024 00:00:01 +0000'
-        }
+        }).encode('utf-8')
         mock_get.return_value = mock_response
         
         # Executar teste
@@ -154,16 +172,73 @@ class TestExchangeRateAPIClient:
         
         # Verificar se a URL foi chamada corretamente
         expected_url = f"{self.base_url}/{self.api_key}/latest/USD"
-        mock_get.assert_called_once_with(
-            expected_url,
-            timeout=10,
-            headers={
-                'User-Agent': 'Pipeline-Cotacoes-Cambiais/1.0',
-                'Accept': 'application/json'
-            }
+        mock_get.assert_called_once_with(expected_url, timeout=10, stream=True)
+        
+        # Cabeçalhos definidos uma única vez na sessão
+        assert self.client.session.headers['User-Agent'] == 'Pipeline-Cotacoes-Cambiais/1.0'
+        assert self.client.session.headers['Accept'] == 'application/json'
+    
+    @patch('requests.Session.get')
+    def test_get_latest_rates_uses_memory_cache(self, mock_get):
+        """
+        Testa se a segunda chamada reutiliza a resposta até a próxima atualização da API
+        """
+        mock_get.return_value = Mock(
+            status_code=200,
+            content=json.dumps({
+                'result': 'success',
+                'base_code': 'USD',
+                'conversion_rates': {'BRL': 5.1234},
+                'time_next_update_unix': datetime.now().timestamp() + 3600
+            }).encode('utf-8')
         )
+        
+        self.client.get_latest_rates('USD')
+        self.client.get_latest_rates('USD')
+        assert mock_get.call_count == 1
+        
+        self.client.invalidate('USD')
+        self.client.get_latest_rates('USD')
+        assert mock_get.call_count == 2
+    
+    def test_http2_falls_back_to_requests_without_httpx(self):
+        """
+        Testa se HTTP/2 sem httpx[http2] instalado usa a sessão do requests
+        """
+        from src.ingest import exchange_api
+        
+        with patch.object(exchange_api, 'HAS_HTTP2', False):
+            session = exchange_api.create_http_session(http2=True)
+        
+        assert isinstance(session, requests.Session)
+        session.close()
+    
+    def test_http2_response_raises_requests_http_error(self):
+        """
+        Testa se a resposta HTTP/2 levanta a mesma exceção do requests
+        """
+        httpx = pytest.importorskip('httpx')
+        pytest.importorskip('h2')
+        from src.ingest.http2_session import HTTP2Response
+        
+        response = HTTP2Response(httpx.Response(503, request=httpx.Request('GET', 'https://test-api.com/v6')))
+        
+        with pytest.raises(requests.exceptions.HTTPError, match="503 Server Error"):
+            response.raise_for_status()
+        assert response.status_code == 503
+    
+    def test_context_manager_closes_session(self):
+        """
+        Testa se o cliente fecha a sessão HTTP ao sair do bloco with
+        """
+        session = Mock(headers={})
+        
+        with ExchangeRateAPIClient(api_key=self.api_key, session=session) as client:
+            assert client.session is session
+        
+        session.close.assert_called_once()
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @patch('time.sleep')  # Mock do sleep para acelerar teste
     def test_get_latest_rates_retry_on_timeout(self, mock_sleep, mock_get):
         """
@@ -175,11 +250,11 @@ class TestExchangeRateAPIClient:
             requests.exceptions.Timeout("Timeout occurred"),
             Mock(
                 status_code=200,
-                json=lambda: {
+                content=json.dumps({
                     'result': 'success',
                     'base_code': 'USD',
                     'conversion_rates': {'BRL': 5.1234}
-                }
+                }).encode('utf-8')
             )
         ]
         
@@ -189,9 +264,76 @@ class TestExchangeRateAPIClient:
         # Verificações
         assert result['result'] == 'success'
         assert mock_get.call_count == 2  # Duas tentativas
-        mock_sleep.assert_called_once_with(1)  # Delay entre tentativas
+        mock_sleep.assert_called_once()  # Delay entre tentativas
+        assert 0 <= mock_sleep.call_args[0][0] <= 1  # Jitter limitado ao delay base
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    @patch('time.sleep')
+    def test_total_deadline_stops_retries(self, mock_sleep, mock_get):
+        """
+        Testa se o prazo total interrompe as tentativas restantes
+        """
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+        client = ExchangeRateAPIClient(
+            api_key=self.api_key,
+            retry_attempts=5,
+            total_deadline=10,
+            circuit_breaker=CircuitBreaker()
+        )
+        
+        # Relógio: início em 0s; segunda tentativa em 4s; terceira após o prazo
+        with patch('time.monotonic', side_effect=[0.0, 0.0, 1.0, 4.0, 5.0, 11.0]):
+            with pytest.raises(requests.exceptions.Timeout, match="Prazo total"):
+                client.get_latest_rates('USD')
+        
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[1].kwargs['timeout'] == 6.0
+    
+    @patch('requests.Session.get')
+    @patch('time.sleep')
+    def test_invalid_json_is_not_retried(self, mock_sleep, mock_get):
+        """
+        Testa se resposta com JSON inválido falha sem novas tentativas
+        """
+        mock_get.return_value = Mock(status_code=200, content=b'<html>erro</html>')
+        
+        with pytest.raises(ValueError):
+            self.client.get_latest_rates('USD')
+        
+        assert mock_get.call_count == 1
+        mock_sleep.assert_not_called()
+    
+    @patch('requests.Session.get')
+    def test_http_error_does_not_leak_api_key(self, mock_get):
+        """
+        Testa se o erro 4xx propagado não contém a API key
+        """
+        mock_response = Mock(status_code=403, content=b'{}')
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"403 Client Error: Forbidden for url: {self.base_url}/{self.api_key}/latest/USD"
+        )
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+            self.client.get_latest_rates('USD')
+        
+        # Corpo da resposta de erro não é lido; a conexão é liberada
+        mock_response.close.assert_called_once()
+        assert self.api_key not in str(exc_info.value)
+        assert '/***/latest/USD' in str(exc_info.value)
+    
+    def test_backoff_delay_is_capped(self):
+        """
+        Testa se o backoff cresce exponencialmente e respeita o teto
+        """
+        client = ExchangeRateAPIClient(api_key=self.api_key, retry_delay=1, max_delay=5)
+        
+        with patch('random.uniform', side_effect=lambda low, high: high):
+            assert client._backoff_delay(1) == 1
+            assert client._backoff_delay(3) == 4
+            assert client._backoff_delay(10) == 5
+    
+    @patch('requests.Session.get')
     @patch('time.sleep')
     def test_get_latest_rates_all_retries_fail(self, mock_sleep, mock_get):
         """
@@ -219,8 +361,11 @@ class TestDataIngester:
         Configuração executada antes de cada teste
         """
         self.test_path = Path("test_data/raw")
-        self.ingester = DataIngester(raw_data_path=str(self.test_path))
+        with patch('pathlib.Path.mkdir'), \
+             patch.dict('os.environ', {'EXCHANGE_API_KEY': 'test_key_123'}):
+            self.ingester = DataIngester(raw_data_path=str(self.test_path), use_cache=False)
     
+    @patch.dict('os.environ', {'EXCHANGE_API_KEY': 'test_key_123'})
     @patch('pathlib.Path.mkdir')
     def test_init_creates_directory(self, mock_mkdir):
         """
@@ -229,17 +374,7 @@ class TestDataIngester:
         DataIngester(raw_data_path="test/path")
         mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
     
-    @patch('src.ingest.exchange_api.ExchangeRateAPIClient')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('json.dump')
-    @patch('pathlib.Path.stat')
-    def test_collect_and_save_daily_rates_success(
-        self, 
-        mock_stat, 
-        mock_json_dump,
-        mock_file_open,
-        mock_api_client_class
-    ):
+    def test_collect_and_save_daily_rates_success(self, tmp_path):
         """
         Testa coleta e salvamento bem-sucedido de cotações diárias
         """
@@ -254,13 +389,10 @@ class TestDataIngester:
             },
             'time_last_update_utc': 'Mon, 01 Jan 2024 00:00:01 +0000'
         }
-        mock_api_client.get_latest_rates.return_value = mock_api_response
-        mock_api_client_class.return_value = mock_api_client
-        
-        # Mock do stat do arquivo (para tamanho)
-        mock_stat_result = Mock()
-        mock_stat_result.st_size = 1024  # 1KB
-        mock_stat.return_value = mock_stat_result
+        mock_api_body = json.dumps(mock_api_response).encode('utf-8')
+        mock_api_client.get_latest_rates_raw.return_value = (mock_api_response, mock_api_body)
+        self.ingester.api_client = mock_api_client
+        self.ingester.raw_data_path = tmp_path
         
         # Executar teste
         target_date = date(2024, 1, 1)
@@ -274,15 +406,11 @@ class TestDataIngester:
         assert expected_filename in result_path
         
         # Verificar se API foi chamada corretamente
-        mock_api_client.get_latest_rates.assert_called_once_with('USD')
+        mock_api_client.get_latest_rates_raw.assert_called_once_with('USD')
         
-        # Verificar se arquivo foi aberto para escrita
-        mock_file_open.assert_called_once()
-        
-        # Verificar se JSON foi salvo
-        mock_json_dump.assert_called_once()
-        call_args = mock_json_dump.call_args[0]
-        saved_data = call_args[0]
+        # Verificar se JSON salvo é válido e nenhum temporário ficou para trás
+        saved_data = json.loads(Path(result_path).read_bytes())
+        assert [p.name for p in tmp_path.iterdir()] == [expected_filename]
         
         # Verificar estrutura dos dados salvos
         assert 'pipeline_metadata' in saved_data
@@ -291,21 +419,286 @@ class TestDataIngester:
         assert saved_data['pipeline_metadata']['base_currency'] == 'USD'
         assert saved_data['api_response'] == mock_api_response
     
-    @patch('src.ingest.exchange_api.ExchangeRateAPIClient')
-    def test_collect_and_save_daily_rates_api_failure(self, mock_api_client_class):
+    def test_collect_and_save_daily_rates_api_failure(self):
         """
         Testa comportamento quando API falha
         """
         # Mock do cliente da API que falha
         mock_api_client = Mock()
-        mock_api_client.get_latest_rates.side_effect = requests.RequestException("API Error")
-        mock_api_client_class.return_value = mock_api_client
+        mock_api_client.get_latest_rates_raw.side_effect = requests.RequestException("API Error")
+        self.ingester.api_client = mock_api_client
         
         # Executar teste e verificar se levanta exceção
         with pytest.raises(requests.RequestException):
             self.ingester.collect_and_save_daily_rates()
 
 
+class TestCircuitBreaker:
+    """
+    Testes para o circuit breaker da API
+    """
+    
+    def test_opens_after_threshold_and_half_opens_after_timeout(self):
+        """
+        Testa transições CLOSED → OPEN → HALF_OPEN → CLOSED
+        """
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+        
+        with patch('time.monotonic', return_value=100.0):
+            breaker.record_failure()
+            assert breaker.allow_request()
+            breaker.record_failure()
+            assert breaker.state == STATE_OPEN
+            assert not breaker.allow_request()
+        
+        with patch('time.monotonic', return_value=111.0):
+            assert breaker.allow_request()  # chamada de teste
+            assert not breaker.allow_request()  # demais aguardam o resultado
+            breaker.record_success()
+        
+        assert breaker.state == STATE_CLOSED
+    
+    @patch('requests.Session.get')
+    @patch('time.sleep')
+    def test_open_circuit_fails_fast(self, mock_sleep, mock_get):
+        """
+        Testa se o cliente não faz requisições com o circuito aberto
+        """
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+        client = ExchangeRateAPIClient(
+            api_key="test_api_key_123",
+            retry_attempts=3,
+            circuit_breaker=CircuitBreaker(failure_threshold=2)
+        )
+        
+        with pytest.raises(CircuitOpenError):
+            client.get_latest_rates('USD')
+        assert mock_get.call_count == 2
+        
+        with pytest.raises(CircuitOpenError):
+            client.get_latest_rates('USD')
+        assert mock_get.call_count == 2
+
+
+class TestRateCache:
+    """
+    Testes para o cache SQLite de cotações
+    """
+    
+    def test_put_and_get_roundtrip(self, tmp_path):
+        """
+        Testa se o corpo gravado é devolvido para a mesma chave
+        """
+        cache = RateCache(tmp_path / 'cache.db')
+        cache.put('USD', date(2024, 1, 1), b'{"result": "success"}')
+        
+        assert cache.get('USD', date(2024, 1, 1)) == b'{"result": "success"}'
+        assert cache.get('EUR', date(2024, 1, 1)) is None
+        assert cache.get('USD', date(2024, 1, 2)) is None
+        cache.close()
+    
+    def test_today_entry_expires(self, tmp_path):
+        """
+        Testa se entradas do dia corrente expiram e as de datas passadas não
+        """
+        cache = RateCache(tmp_path / 'cache.db', today_ttl_seconds=60)
+        cache.put('USD', date.today(), b'{}')
+        cache.put('USD', date(2024, 1, 1), b'{}')
+        
+        with patch('time.time', return_value=datetime.now().timestamp() + 3600):
+            assert cache.get('USD', date.today()) is None
+            assert cache.get('USD', date(2024, 1, 1)) == b'{}'
+        cache.close()
+    
+    @patch.dict('os.environ', {'EXCHANGE_API_KEY': 'test_key_123'})
+    def test_ingester_serves_from_cache(self, tmp_path):
+        """
+        Testa se a segunda coleta da mesma data não consulta a API
+        """
+        payload = {
+            'result': 'success',
+            'base_code': 'USD',
+            'conversion_rates': {'BRL': 5.1234}
+        }
+        body = json.dumps(payload).encode('utf-8')
+        
+        ingester = DataIngester(raw_data_path=str(tmp_path / 'raw'))
+        ingester.api_client.get_latest_rates_raw = Mock(return_value=(payload, body))
+        
+        first = ingester.collect_and_save_daily_rates('USD', date(2024, 1, 1))
+        second = ingester.collect_and_save_daily_rates('USD', date(2024, 1, 1))
+        
+        assert first == second
+        assert ingester.api_client.get_latest_rates_raw.call_count == 1
+        assert json.loads(Path(second).read_bytes())['api_response'] == payload
+        ingester.cache.close()
+
+
+class TestRawEnvelope:
+    """
+    Testes para a gravação do arquivo bruto
+    """
+    
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_envelope_roundtrip(self, tmp_path, has_orjson):
+        """
+        Testa se o envelope gravado é JSON válido com orjson e com o json padrão
+        """
+        from src.utils import fast_json
+        
+        if has_orjson and not fast_json.HAS_ORJSON:
+            pytest.skip("orjson não instalado")
+        
+        body = json.dumps({'result': 'success', 'conversion_rates': {'BRL': 5.1234}}).encode('utf-8')
+        metadata = {'collection_date': '2024-01-01', 'source': 'Cotações São Paulo'}
+        filepath = tmp_path / '2024-01-01.json'
+        
+        with patch.object(fast_json, 'HAS_ORJSON', has_orjson):
+            bytes_written = write_raw_envelope(filepath, metadata, body)
+        
+        saved = json.loads(filepath.read_bytes())
+        assert saved['pipeline_metadata'] == metadata
+        assert saved['api_response']['conversion_rates']['BRL'] == 5.1234
+        assert bytes_written == filepath.stat().st_size
+    
+    def test_pretty_envelope_is_indented(self, tmp_path):
+        """
+        Testa se o modo pretty grava o mesmo conteúdo indentado
+        """
+        body = b'{"result":"success","conversion_rates":{"BRL":5.1234}}'
+        compact_path = tmp_path / 'compact.json'
+        pretty_path = tmp_path / 'pretty.json'
+        
+        write_raw_envelope(compact_path, {'collection_date': '2024-01-01'}, body)
+        write_raw_envelope(pretty_path, {'collection_date': '2024-01-01'}, body, pretty=True)
+        
+        assert b'\n  ' in pretty_path.read_bytes()
+        assert json.loads(pretty_path.read_bytes()) == json.loads(compact_path.read_bytes())
+
+
+class TestFastJson:
+    """
+    Testes para a serialização JSON com orjson e com o json padrão
+    """
+    
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_backends_produce_same_json(self, has_orjson):
+        """
+        Testa se os dois backends convertem Timestamp/NA/NaT/NaN/inf e NumPy da mesma forma
+        """
+        import numpy as np
+        import pandas as pd
+        from src.utils import fast_json
+        
+        if has_orjson and not fast_json.HAS_ORJSON:
+            pytest.skip("orjson não instalado")
+        
+        obj = {
+            'timestamp': pd.Timestamp('2024-01-01 10:00:00.5'),
+            'date': date(2024, 1, 1),
+            'missing': [pd.NA, pd.NaT, None],
+            'non_finite': [float('nan'), np.float64('inf'), float('-inf')],
+            'array': np.array([1.5, np.nan]),
+            'nested': {'rate': np.float32(5.25), 'count': np.int64(3)}
+        }
+        
+        with patch.object(fast_json, 'HAS_ORJSON', has_orjson):
+            encoded = fast_json.dumps(obj)
+        
+        assert json.loads(encoded) == {
+            'timestamp': '2024-01-01T10:00:00.500000',
+            'date': '2024-01-01',
+            'missing': [None, None, None],
+            'non_finite': [None, None, None],
+            'array': [1.5, None],
+            'nested': {'rate': 5.25, 'count': 3}
+        }
+        assert b'NaN' not in encoded and b'Infinity' not in encoded
+
+
+class TestCollectMany:
+    """
+    Testes para a coleta de várias moedas base
+    """
+    
+    @patch.dict('os.environ', {'EXCHANGE_API_KEY': 'test_key_123'})
+    def test_collect_and_save_many_writes_one_file_per_base(self, tmp_path):
+        """
+        Testa se cada moeda base gera seu próprio arquivo
+        """
+        def fake_rates(base):
+            payload = {'result': 'success', 'base_code': base, 'conversion_rates': {'BRL': 5.0}}
+            return payload, json.dumps(payload).encode('utf-8')
+        
+        ingester = DataIngester(raw_data_path=str(tmp_path), use_cache=False)
+        ingester.api_client.get_latest_rates_raw = Mock(side_effect=fake_rates)
+        
+        paths = ingester.collect_and_save_many(['USD', 'EUR'], date(2024, 1, 1))
+        
+        assert sorted(paths) == ['EUR', 'USD']
+        assert paths['EUR'].endswith('2024-01-01_EUR.json')
+        assert json.loads(Path(paths['EUR']).read_bytes())['api_response']['base_code'] == 'EUR'
+
+
+class TestStaleFallback:
+    """
+    Testes para o fallback com dados brutos anteriores
+    """
+    
+    @patch.dict('os.environ', {'EXCHANGE_API_KEY': 'test_key_123'})
+    def test_uses_recent_raw_file_when_api_fails(self, tmp_path):
+        """
+        Testa se a falha da API reaproveita o arquivo mais recente marcado como stale
+        """
+        payload = {
+            'result': 'success',
+            'base_code': 'USD',
+            'conversion_rates': {'BRL': 5.1234}
+        }
+        ingester = DataIngester(raw_data_path=str(tmp_path), use_cache=False)
+        ingester.api_client.get_latest_rates_raw = Mock(return_value=(payload, json.dumps(payload).encode('utf-8')))
+        ingester.collect_and_save_daily_rates('USD', date(2024, 1, 1))
+        
+        ingester.api_client.get_latest_rates_raw = Mock(side_effect=requests.RequestException("API Error"))
+        result_path = ingester.collect_and_save_daily_rates('USD', date(2024, 1, 3))
+        
+        saved = json.loads(Path(result_path).read_bytes())
+        assert saved['pipeline_metadata']['stale'] is True
+        assert saved['pipeline_metadata']['fallback_source_date'] == '2024-01-01'
+        assert saved['api_response'] == payload
+        
+        # Arquivo fora da janela de max_stale_age_days não é usado
+        with pytest.raises(requests.RequestException):
+            ingester.collect_and_save_daily_rates('USD', date(2024, 1, 10))
+    
+    @patch.dict('os.environ', {'EXCHANGE_API_KEY': 'test_key_123'})
+    def test_non_usd_base_falls_back_to_its_own_file(self, tmp_path):
+        """
+        Testa se uma moeda base coletada por collect_and_save_many usa o próprio
+        arquivo YYYY-MM-DD_<BASE>.json do dia anterior, e não o de outra moeda
+        """
+        def fake_rates(base):
+            payload = {'result': 'success', 'base_code': base, 'conversion_rates': {'BRL': 5.0}}
+            return payload, json.dumps(payload).encode('utf-8')
+        
+        ingester = DataIngester(raw_data_path=str(tmp_path), use_cache=False)
+        ingester.api_client.get_latest_rates_raw = Mock(side_effect=fake_rates)
+        ingester.collect_and_save_many(['USD', 'EUR'], date(2024, 1, 1))
+        
+        ingester.api_client.get_latest_rates_raw = Mock(side_effect=requests.RequestException("API Error"))
+        with pytest.raises(requests.RequestException):
+            ingester.collect_and_save_many(['EUR', 'GBP'], date(2024, 1, 2))
+        
+        eur_file = tmp_path / '2024-01-02_EUR.json'
+        saved = json.loads(eur_file.read_bytes())
+        assert saved['pipeline_metadata']['stale'] is True
+        assert saved['pipeline_metadata']['fallback_source_date'] == '2024-01-01'
+        assert saved['api_response']['base_code'] == 'EUR'
+        
+        # GBP não tem arquivo anterior: não herda o de USD nem o de EUR
+        assert not (tmp_path / '2024-01-02_GBP.json').exists()
+
+
 class TestIntegration:
     """
     Testes de integração básicos
@@ -315,15 +708,15 @@ class TestIntegration:
         'EXCHANGE_API_KEY': 'test_key_123',
         'EXCHANGE_API_BASE_URL': 'https://test-api.com/v6'
     })
-    def test_full_workflow_with_mocks(self):
+    def test_full_workflow_with_mocks(self, tmp_path):
         """
         Testa o workflow completo com mocks
         """
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             # Mock da resposta da API
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {
+            mock_response.content = json.dumps({
                 'result': 'success',
                 'base_code': 'USD',
                 'conversion_rates': {
@@ -333,23 +726,20 @@ class TestIntegration:
                     'JPY': 149.52
                 },
                 'time_last_update_utc': 'Mon, 01 Jan 2024 00:00:01 +0000'
-            }
+            }).encode('utf-8')
             mock_get.return_value = mock_response
             
             # Executar workflow
-            ingester = DataIngester(raw_data_path="test_output")
-            
-            with patch('builtins.open', mock_open()) as mock_file:
-                with patch('json.dump') as mock_json_dump:
-                    with patch('pathlib.Path.stat', return_value=Mock(st_size=2048)):
-                        result_path = ingester.collect_and_save_daily_rates('USD')
+            ingester = DataIngester(raw_data_path=str(tmp_path / "test_output"), use_cache=False)
+            result_path = ingester.collect_and_save_daily_rates('USD')
             
             # Verificações
             assert result_path is not None
             assert "test_output" in result_path
             mock_get.assert_called_once()
-            mock_file.assert_called_once()
-            mock_json_dump.assert_called_once()
+            
+            saved_data = json.loads(Path(result_path).read_bytes())
+            assert saved_data['api_response']['conversion_rates']['JPY'] == 149.52
 
 
 # Fixtures para testes
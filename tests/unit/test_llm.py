@@ -0,0 +1,393 @@
+"""
+Testes Unitários para o Módulo LLM
+Pipeline de Cotações Cambiais - MBA Data Engineering
+
+Este arquivo contém testes para validar:
+1. Carregamento dos dados Gold Layer
+2. Montagem do contexto enviado ao LLM
+3. Cache das respostas do LLM
+"""
+
+import json
+import os
+import pytest
+import subprocess
+import sys
+import threading
+import time
+import pandas as pd
+from datetime import date
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Imports do módulo a ser testado
+from src.llm.insight_generator import InsightGenerator, get_openai_client
+from src.llm.response_cache import ResponseCache
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """
+    InsightGenerator apontando para diretórios temporários
+    """
+    with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}), \
+         patch.dict('src.llm.insight_generator._openai_clients', clear=True):
+        yield InsightGenerator(
+            gold_path=str(tmp_path / 'gold'),
+            outputs_path=str(tmp_path / 'reports')
+        )
+
+
+@pytest.fixture
+def summary_df():
+    """
+    currency_summary mínimo no formato do Gold Layer
+    """
+    return pd.DataFrame({
+        'currency': ['USD', 'BRL', 'EUR', 'XYZ'],
+        'current_rate': [1.0, 5.2, 0.9, 3.33333],
+        'trend_class': ['Alta', 'Estável', 'Alta', 'Baixa'],
+        'volatility_class': ['Baixa', 'Alta', 'Baixa', 'Baixa'],
+        'total_observations': [1, 3, 1, 2],
+        'avg_volatility_7d': [0.1, 0.2, 0.3, 0.4]
+    })
+
+
+class TestOpenAIClient:
+    """
+    Testes para o cliente OpenAI compartilhado
+    """
+
+    def test_client_shared_between_generators(self, tmp_path):
+        """
+        Testa que instâncias com a mesma API key reaproveitam o cliente
+        """
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}), \
+             patch.dict('src.llm.insight_generator._openai_clients', clear=True):
+            first = InsightGenerator(gold_path=str(tmp_path / 'gold'), outputs_path=str(tmp_path / 'reports'))
+            second = InsightGenerator(gold_path=str(tmp_path / 'gold'), outputs_path=str(tmp_path / 'reports'))
+
+            assert first.client is second.client
+            assert get_openai_client('outra_key') is not first.client
+
+    def test_import_does_not_load_ingest_package(self):
+        """
+        Testa que importar a camada LLM não carrega o pacote de ingestão
+        """
+        code = (
+            "import sys, src.llm.insight_generator; "
+            "print(any(name == 'src.ingest' or name.startswith('src.ingest.') for name in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip().splitlines()[-1] == 'False'
+
+
+class TestLoadGoldData:
+    """
+    Testes para carregamento do Gold Layer
+    """
+
+    def test_load_projects_summary_columns(self, generator, summary_df):
+        """
+        Testa que apenas as colunas usadas no contexto são lidas
+        """
+        generator.gold_path.mkdir(parents=True)
+        summary_df.to_parquet(generator.gold_path / 'currency_summary_2024-01-15.parquet', index=False)
+        summary_df.to_parquet(generator.gold_path / 'consolidated_2024-01-15.parquet', index=False)
+
+        data = generator.load_gold_data(date(2024, 1, 15))
+
+        assert 'avg_volatility_7d' not in data['currency_summary'].columns
+        assert list(data['currency_summary']['currency']) == ['USD', 'BRL', 'EUR', 'XYZ']
+        assert data['consolidated_rows'] == 4
+        assert data['currency_summary']['trend_class'].dtype == 'category'
+
+    def test_summary_ipc_sidecar_reused(self, generator, summary_df):
+        """
+        Testa que a segunda leitura usa a cópia Arrow IPC e não o Parquet
+        """
+        generator.gold_path.mkdir(parents=True)
+        summary_file = generator.gold_path / 'currency_summary_2024-01-15.parquet'
+        summary_df.to_parquet(summary_file, index=False)
+
+        first = generator.load_gold_data(date(2024, 1, 15))['currency_summary']
+        assert summary_file.with_suffix('.arrow').exists()
+
+        with patch('src.llm.insight_generator.pq.read_table', side_effect=AssertionError("Parquet relido")):
+            second = generator.load_gold_data(date(2024, 1, 15))['currency_summary']
+
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_stale_ipc_sidecar_ignored(self, generator, summary_df):
+        """
+        Testa que um Parquet regravado invalida a cópia Arrow IPC
+        """
+        generator.gold_path.mkdir(parents=True)
+        summary_file = generator.gold_path / 'currency_summary_2024-01-15.parquet'
+        summary_df.to_parquet(summary_file, index=False)
+        generator.load_gold_data(date(2024, 1, 15))
+
+        summary_df.assign(current_rate=summary_df['current_rate'] * 2).to_parquet(summary_file, index=False)
+        sidecar = summary_file.with_suffix('.arrow')
+        os.utime(sidecar, (summary_file.stat().st_mtime - 10,) * 2)
+
+        data = generator.load_gold_data(date(2024, 1, 15))
+
+        assert data['currency_summary']['current_rate'].iloc[1] == pytest.approx(10.4)
+
+    def test_load_market_overview(self, generator):
+        """
+        Testa leitura do market_overview em JSON
+        """
+        generator.gold_path.mkdir(parents=True)
+        overview = {'timestamp': '2024-01-15T10:00:00', 'total_currencies': 163, 'nota': 'câmbio'}
+        (generator.gold_path / 'market_overview_2024-01-15.json').write_text(
+            json.dumps(overview, ensure_ascii=False), encoding='utf-8'
+        )
+
+        data = generator.load_gold_data(date(2024, 1, 15))
+
+        assert data['market_overview'] == overview
+
+    def test_load_without_files_raises(self, generator):
+        """
+        Testa erro quando não há arquivos Gold Layer para a data
+        """
+        generator.gold_path.mkdir(parents=True)
+
+        with pytest.raises(FileNotFoundError):
+            generator.load_gold_data(date(2024, 1, 15))
+
+
+class TestPrepareMarketContext:
+    """
+    Testes para montagem do contexto do LLM
+    """
+
+    def test_context_sections(self, generator, summary_df):
+        """
+        Testa linhas do top 15, moedas de interesse e distribuições
+        """
+        context = generator.prepare_market_context({'currency_summary': summary_df})
+
+        assert "XYZ: Taxa=3.3333, Tendência=Baixa, Volatilidade=Baixa, Observações=2" in context
+        assert "Real Brasileiro (BRL): 1 USD = 5.2000 BRL - Estável" in context
+        assert "EUR: 0.9000 - Alta" in context
+        assert "Alta: 2 moedas (50.0%)" in context
+        assert "Baixa: 3 moedas (75.0%)" in context
+
+    def test_interest_uses_first_occurrence(self, generator, summary_df):
+        """
+        Testa que moedas repetidas usam a primeira linha do resumo
+        """
+        duplicated = pd.concat([summary_df, summary_df.assign(current_rate=9.9)], ignore_index=True)
+
+        context = generator.prepare_market_context({'currency_summary': duplicated})
+
+        assert "Real Brasileiro (BRL): 1 USD = 5.2000 BRL - Estável" in context
+        assert "9.9000 BRL" not in context
+
+    def test_distribution_skips_nulls_and_empty_categories(self, generator, summary_df):
+        """
+        Testa distribuição com categorias sem ocorrência e valores nulos
+        """
+        summary_df['volatility_class'] = pd.Categorical(
+            ['Alta', 'Baixa', 'Alta', None],
+            categories=['Baixa', 'Moderada', 'Alta', 'Muito Alta']
+        )
+
+        context = generator.prepare_market_context({'currency_summary': summary_df})
+        distribution = context.split("=== DISTRIBUIÇÃO DE VOLATILIDADE ===\n")[1]
+
+        assert distribution == "Alta: 2 moedas (50.0%)\nBaixa: 1 moedas (25.0%)"
+
+    def test_context_optional_columns_missing(self, generator, summary_df):
+        """
+        Testa valores padrão quando colunas opcionais não existem
+        """
+        context = generator.prepare_market_context({'currency_summary': summary_df[['currency', 'current_rate']]})
+
+        assert "USD: Taxa=1.0000, Tendência=N/A, Volatilidade=N/A, Observações=0" in context
+        assert "USD: 1.0000 - Estável" in context
+        assert "DISTRIBUIÇÃO" not in context
+
+
+class TestResponseCache:
+    """
+    Testes para o cache de respostas do LLM
+    """
+
+    def _mock_completion(self, generator, content='Resumo gerado'):
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=content))]
+        response.usage = Mock(total_tokens=42)
+        generator.client.chat.completions.create = Mock(return_value=response)
+        return generator.client.chat.completions.create
+
+    def test_same_context_hits_cache(self, generator):
+        """
+        Testa que a segunda chamada com o mesmo contexto não vai à API
+        """
+        create = self._mock_completion(generator)
+
+        first = generator.generate_executive_summary("contexto")
+        second = generator.generate_executive_summary("contexto")
+
+        assert first == second == 'Resumo gerado'
+        create.assert_called_once()
+
+    def test_different_context_misses_cache(self, generator):
+        """
+        Testa que contextos diferentes geram chamadas separadas
+        """
+        create = self._mock_completion(generator)
+
+        generator.generate_executive_summary("contexto A")
+        generator.generate_executive_summary("contexto B")
+
+        assert create.call_count == 2
+
+    def test_expired_entry_ignored(self, tmp_path):
+        """
+        Testa que entradas além do TTL não são servidas
+        """
+        cache = ResponseCache(tmp_path, ttl_seconds=0)
+        key = ResponseCache.make_key('s', 'u', 'modelo', 0.3, 800)
+        cache.put(key, 'texto', 'modelo')
+
+        with patch('src.llm.response_cache.time.time', return_value=time.time() + 10):
+            assert cache.get(key) is None
+
+    def test_api_failure_not_cached(self, generator):
+        """
+        Testa que o resumo alternativo não é gravado no cache
+        """
+        generator.client.chat.completions.create = Mock(side_effect=RuntimeError("API indisponível"))
+
+        summary = generator.generate_executive_summary("contexto")
+
+        assert 'RESUMO EXECUTIVO' in summary
+        assert not list(generator.cache.cache_dir.rglob('*.json'))
+
+
+class TestProcessInsights:
+    """
+    Testes para o processo completo de geração de insights
+    """
+
+    def test_llm_calls_run_concurrently(self, generator, summary_df):
+        """
+        Testa que resumo e análise técnica são gerados em paralelo
+        """
+        generator.gold_path.mkdir(parents=True)
+        summary_df.to_parquet(generator.gold_path / 'currency_summary_2024-01-15.parquet', index=False)
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_other(context):
+            barrier.wait()
+            return 'texto'
+
+        with patch.object(generator, 'generate_executive_summary', side_effect=wait_for_other), \
+             patch.object(generator, 'generate_technical_analysis', side_effect=wait_for_other):
+            report = generator.process_insights(date(2024, 1, 15))
+
+        assert report['status'] == 'success'
+        assert report['processing']['summary_length'] == len('texto')
+
+
+class TestSaveInsightsReport:
+    """
+    Testes para gravação dos relatórios
+    """
+
+    def test_reports_written(self, generator):
+        """
+        Testa conteúdo dos relatórios markdown e texto
+        """
+        files = generator.save_insights_report("Resumo", "Análise", "contexto", date(2024, 1, 15))
+
+        markdown = Path(files['markdown_summary']).read_text(encoding='utf-8')
+        text = Path(files['text_summary']).read_text(encoding='utf-8')
+
+        assert markdown.startswith("# Resumo Executivo - Cotações Cambiais\n\n**Data:** 15/01/2024\n")
+        assert markdown.endswith("Resumo\n\n---\n\n## Análise Técnica\n\nAnálise")
+        assert text.startswith("RELATÓRIO DIÁRIO - COTAÇÕES CAMBIAIS\n" + "=" * 50 + "\n\nData: 15/01/2024\n")
+        assert text.endswith("Resumo")
+
+    def test_reports_keep_braces_in_llm_text(self, generator):
+        """
+        Testa que chaves no texto do LLM não são interpretadas pelo template
+        """
+        files = generator.save_insights_report("Taxa {USD}", "Análise {x}", "contexto", date(2024, 1, 15))
+
+        assert Path(files['markdown_summary']).read_text(encoding='utf-8').endswith("Análise {x}")
+        assert Path(files['text_summary']).read_text(encoding='utf-8').endswith("Taxa {USD}")
+
+    def test_json_report_compact_by_default(self, generator):
+        """
+        Testa JSON compacto por padrão e indentado com pretty=True
+        """
+        files = generator.save_insights_report("Resumo", "Análise", "contexto", date(2024, 1, 15))
+        compact = Path(files['json_report']).read_bytes()
+
+        files = generator.save_insights_report("Resumo", "Análise", "contexto", date(2024, 1, 15), pretty=True)
+        pretty = Path(files['json_report']).read_bytes()
+
+        assert b'\n' not in compact
+        assert b'\n  "executive_summary"' in pretty
+        assert json.loads(compact)['technical_analysis'] == "Análise"
+        assert json.loads(compact)['metadata']['target_date'] == '2024-01-15'
+
+    def test_json_report_stores_context_summary(self, generator):
+        """
+        Testa que o JSON guarda apenas tamanho, prévia e hash do contexto
+        """
+        context = "linha de contexto\n" * 100
+
+        files = generator.save_insights_report("Resumo", "Análise", context, date(2024, 1, 15))
+        report = json.loads(Path(files['json_report']).read_bytes())
+
+        assert report['data_context'] == {'length': len(context), 'preview': context[:400]}
+        assert report['metadata']['context_sha'] == generator._context_fingerprint(context)
+
+    def _mock_completion(self, generator):
+        response = Mock()
+        response.choices = [Mock(message=Mock(content='Texto do LLM'))]
+        response.usage = Mock(total_tokens=42)
+        generator.client.chat.completions.create = Mock(return_value=response)
+        return generator.client.chat.completions.create
+
+    def test_unchanged_context_reuses_report(self, generator, summary_df):
+        """
+        Testa que um contexto inalterado reaproveita os relatórios sem chamar o LLM
+        """
+        generator.gold_path.mkdir(parents=True)
+        summary_df.to_parquet(generator.gold_path / 'currency_summary_2024-01-15.parquet', index=False)
+        generator.cache = None
+        create = self._mock_completion(generator)
+
+        first = generator.process_insights(date(2024, 1, 15))
+        second = generator.process_insights(date(2024, 1, 15))
+
+        assert create.call_count == 2
+        assert first['processing']['reused_existing_report'] is False
+        assert second['processing']['reused_existing_report'] is True
+        assert second['output']['files_created'] == first['output']['files_created']
+
+        generator.process_insights(date(2024, 1, 15), force=True)
+        assert create.call_count == 4
+
+    def test_fallback_report_not_reused(self, generator, summary_df):
+        """
+        Testa que relatórios gerados sem LLM são regenerados na próxima execução
+        """
+        generator.gold_path.mkdir(parents=True)
+        summary_df.to_parquet(generator.gold_path / 'currency_summary_2024-01-15.parquet', index=False)
+        generator.client.chat.completions.create = Mock(side_effect=RuntimeError("API indisponível"))
+
+        generator.process_insights(date(2024, 1, 15))
+        second = generator.process_insights(date(2024, 1, 15))
+
+        assert second['processing']['reused_existing_report'] is False
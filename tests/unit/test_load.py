@@ -0,0 +1,451 @@
+"""
+Testes Unitários para o Módulo Load (Gold Layer)
+Pipeline de Cotações Cambiais - MBA Data Engineering
+
+Este arquivo contém testes para validar:
+1. Métricas diárias por moeda (amplitude e coeficiente de variação)
+2. Tendências históricas
+3. Carregamento do Silver Layer
+4. Resumo por moeda e overview do mercado
+5. Kernel de tendências (numba)
+"""
+
+import json
+import os
+import time
+import pytest
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Imports do módulo a ser testado
+from src.load.gold_processor import GoldLayerProcessor
+
+
+@pytest.fixture
+def processor(tmp_path):
+    """
+    GoldLayerProcessor apontando para diretórios temporários
+    """
+    return GoldLayerProcessor(
+        silver_path=str(tmp_path / 'silver'),
+        gold_path=str(tmp_path / 'gold')
+    )
+
+
+@pytest.fixture
+def silver_df():
+    """
+    Dados Silver com 10 dias de USD/BRL/EUR e um único dia de JPY
+    """
+    rng = np.random.default_rng(42)
+    rows = []
+    for day in range(10):
+        for currency in ['USD', 'BRL', 'EUR', 'JPY']:
+            if currency == 'JPY' and day > 0:
+                continue
+            for hour in range(2):
+                rows.append({
+                    'collection_date': date(2024, 1, 1) + timedelta(days=day),
+                    'target_currency': currency,
+                    'exchange_rate': float(rng.uniform(1, 6)),
+                    'collection_timestamp': pd.Timestamp('2024-01-01') + pd.Timedelta(days=day, hours=hour)
+                })
+    return pd.DataFrame(rows)
+
+
+class TestDailyMetrics:
+    """
+    Testes para métricas diárias por moeda
+    """
+
+    def test_range_and_cv(self, processor, silver_df):
+        """
+        Testa amplitude e coeficiente de variação, com 0 para uma única observação
+        """
+        # Um dia extra com uma única cotação por moeda
+        single = silver_df[silver_df['collection_date'] == date(2024, 1, 1)].drop_duplicates('target_currency')
+        daily = processor.calculate_daily_metrics(
+            pd.concat([silver_df, single.assign(collection_date=date(2024, 2, 1))], ignore_index=True)
+        )
+
+        usd = daily[(daily['currency'] == 'USD') & (daily['date'] == date(2024, 1, 1))].iloc[0]
+        assert usd['rate_range'] == pytest.approx(usd['rate_max'] - usd['rate_min'])
+        assert usd['rate_cv'] == pytest.approx(usd['rate_std'] / usd['rate_mean'])
+
+        single_day = daily[daily['date'] == date(2024, 2, 1)]
+        assert single_day['rate_std'].isna().all()
+        assert (single_day['rate_cv'] == 0).all()
+
+
+class TestHistoricalTrends:
+    """
+    Testes para cálculo de tendências históricas
+    """
+
+    def test_trend_columns_per_currency(self, processor, silver_df):
+        """
+        Testa variações e janelas móveis calculadas por moeda
+        """
+        daily = processor.calculate_daily_metrics(silver_df)
+        trends = processor.calculate_historical_trends(daily)
+
+        brl = trends[trends['currency'] == 'BRL'].reset_index(drop=True)
+        rates = brl['rate_mean']
+
+        assert brl['daily_change'].iloc[0] == 0
+        assert brl['daily_change'].iloc[1] == pytest.approx((rates[1] / rates[0] - 1) * 100)
+        assert brl['cumulative_change'].iloc[-1] == pytest.approx((rates.iloc[-1] / rates[0] - 1) * 100)
+        assert brl['ma_7d'].iloc[-1] == pytest.approx(rates.iloc[-7:].mean())
+        assert brl['max_30d'].iloc[-1] == pytest.approx(rates.max())
+        assert brl['volatility_7d'].iloc[-1] == pytest.approx(brl['daily_change'].iloc[-7:].std())
+        assert brl['relative_position'].between(0, 100).all()
+
+    def test_single_day_currency(self, processor, silver_df):
+        """
+        Testa valores neutros para moeda com um único dia de dados
+        """
+        daily = processor.calculate_daily_metrics(silver_df)
+        trends = processor.calculate_historical_trends(daily)
+
+        jpy = trends[trends['currency'] == 'JPY'].iloc[0]
+
+        assert jpy['daily_change'] == 0
+        assert jpy['cumulative_change'] == 0
+        assert jpy['volatility_7d'] == 0
+        assert jpy['relative_position'] == 50.0
+
+    def test_float32_columns(self, processor, silver_df):
+        """
+        Testa que taxas e tendências são armazenadas em float32
+        """
+        daily = processor.calculate_daily_metrics(silver_df)
+        trends = processor.calculate_historical_trends(daily)
+
+        assert daily['rate_mean'].dtype == np.float32
+        assert daily['observations'].dtype == np.int32
+        for column in ['daily_change', 'cumulative_change', 'ma_7d', 'volatility_7d',
+                       'max_30d', 'min_30d', 'relative_position']:
+            assert trends[column].dtype == np.float32, column
+
+    def test_input_not_modified(self, processor, silver_df):
+        """
+        Testa que as métricas diárias de entrada não são alteradas
+        """
+        daily = processor.calculate_daily_metrics(silver_df)
+        original = daily.copy()
+
+        processor.calculate_historical_trends(daily)
+
+        pd.testing.assert_frame_equal(daily, original)
+
+
+class TestLoadSilverData:
+    """
+    Testes para carregamento do Silver Layer
+    """
+
+    def _write_silver(self, processor, silver_df):
+        processor.silver_path.mkdir(parents=True)
+        for day, day_df in silver_df.groupby('collection_date'):
+            day_df.to_parquet(processor.silver_path / f"exchange_rates_{day.isoformat()}.parquet", index=False)
+
+    def test_currency_loaded_as_category(self, processor, silver_df):
+        """
+        Testa que a moeda é carregada como category sem gerar combinações vazias
+        """
+        self._write_silver(processor, silver_df)
+
+        loaded = processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 10))
+        daily = processor.calculate_daily_metrics(loaded)
+
+        assert loaded['target_currency'].dtype == 'category'
+        assert len(loaded) == len(silver_df)
+        # 10 dias x 3 moedas + 1 dia de JPY (sem produto cartesiano de categorias)
+        assert len(daily) == 31
+
+    def test_projects_gold_columns(self, processor, silver_df):
+        """
+        Testa que apenas as colunas usadas no Gold são lidas
+        """
+        self._write_silver(processor, silver_df.assign(pipeline_version='1.0.0'))
+
+        loaded = processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 10))
+
+        assert list(loaded.columns) == ['collection_date', 'target_currency', 'exchange_rate', 'collection_timestamp']
+        assert loaded['collection_date'].iloc[0] == date(2024, 1, 1)
+
+    def test_corrupt_file_skipped(self, processor, silver_df):
+        """
+        Testa que um arquivo corrompido é ignorado e os demais são carregados
+        """
+        self._write_silver(processor, silver_df)
+        (processor.silver_path / 'exchange_rates_2024-01-05.parquet').write_bytes(b'corrompido')
+
+        loaded = processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 10))
+
+        assert date(2024, 1, 5) not in set(loaded['collection_date'])
+        assert loaded['collection_date'].nunique() == 9
+
+    def test_fallback_projects_gold_columns(self, processor, silver_df):
+        """
+        Testa que a leitura arquivo a arquivo também traz só as colunas do Gold
+        """
+        self._write_silver(processor, silver_df.assign(pipeline_version='1.0.0'))
+        (processor.silver_path / 'exchange_rates_2024-01-05.parquet').write_bytes(b'corrompido')
+
+        loaded = processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 10))
+
+        assert list(loaded.columns) == ['collection_date', 'target_currency', 'exchange_rate', 'collection_timestamp']
+
+    def test_period_served_from_cache(self, processor, silver_df):
+        """
+        Testa que a segunda leitura do mesmo período vem do cache do Gold
+        """
+        self._write_silver(processor, silver_df)
+        first = processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 10))
+
+        with patch('src.load.gold_processor.ds.dataset', side_effect=AssertionError("releu o Silver")):
+            cached = processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 10))
+
+        pd.testing.assert_frame_equal(cached, first)
+        assert len(list((processor.gold_path / '_cache').glob('silver_*.parquet'))) == 1
+
+    def test_cache_invalidated_by_rewrite(self, processor, silver_df):
+        """
+        Testa que reescrever um arquivo Silver invalida o cache do período
+        """
+        self._write_silver(processor, silver_df)
+        processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 10))
+
+        day_file = processor.silver_path / 'exchange_rates_2024-01-10.parquet'
+        silver_df[silver_df['collection_date'] == date(2024, 1, 10)].head(1).to_parquet(day_file, index=False)
+
+        reloaded = processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 10))
+
+        assert (reloaded['collection_date'] == date(2024, 1, 10)).sum() == 1
+
+    def test_old_cache_entries_pruned(self, processor, silver_df):
+        """
+        Testa que gravar um período novo remove as entradas mais antigas do cache
+        """
+        self._write_silver(processor, silver_df)
+        cache_dir = processor.gold_path / '_cache'
+        cache_dir.mkdir(parents=True)
+        for age, name in enumerate(['silver_new.parquet', 'silver_mid.parquet', 'silver_old.parquet'], start=1):
+            (cache_dir / name).write_bytes(b'')
+            os.utime(cache_dir / name, (time.time() - age * 3600,) * 2)
+
+        with patch('src.load.gold_processor.SILVER_CACHE_MAX_ENTRIES', 2):
+            processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 10))
+
+        remaining = sorted(path.name for path in cache_dir.glob('silver_*.parquet'))
+        assert len(remaining) == 2
+        assert 'silver_new.parquet' in remaining
+        assert 'silver_mid.parquet' not in remaining and 'silver_old.parquet' not in remaining
+
+    def test_failed_cache_write_removes_tmp(self, processor, silver_df):
+        """
+        Testa que uma falha ao gravar o cache não deixa o arquivo .tmp para trás
+        """
+        self._write_silver(processor, silver_df)
+
+        with patch('pathlib.Path.replace', side_effect=OSError("disco cheio")):
+            loaded = processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 10))
+
+        assert len(loaded) == len(silver_df)
+        assert list((processor.gold_path / '_cache').iterdir()) == []
+
+    def test_no_files_raises(self, processor):
+        """
+        Testa erro quando não há arquivos no período
+        """
+        processor.silver_path.mkdir(parents=True)
+
+        with pytest.raises(ValueError):
+            processor.load_silver_data(date(2024, 1, 1), date(2024, 1, 3))
+
+
+class TestCurrencySummary:
+    """
+    Testes para o resumo por moeda
+    """
+
+    def test_trend_class_buckets(self, processor):
+        """
+        Testa as faixas de classificação de tendência, incluindo os limites
+        """
+        changes = [3.0, 2.0, 0.5, -0.5, -1.0, -2.0, float('nan')]
+        currencies = ['AAA', 'BBB', 'CCC', 'DDD', 'EEE', 'FFF', 'GGG']
+        trends = pd.DataFrame({
+            'currency': currencies,
+            'date': [date(2024, 1, 1)] * len(changes),
+            'rate_mean': 1.0,
+            'ma_7d': 1.0,
+            'volatility_7d': 0.5,
+            'relative_position': 50.0,
+            'last_update': pd.Timestamp('2024-01-01'),
+            'daily_change': changes,
+            'cumulative_change': 0.0
+        })
+
+        summary = processor.create_currency_summary(trends).set_index('currency')
+
+        assert list(summary.loc[currencies, 'trend_class']) == [
+            'Forte Alta', 'Alta', 'Estável', 'Estável', 'Baixa', 'Forte Baixa', 'Forte Baixa'
+        ]
+
+    def test_volatility_class_dtype(self, processor, silver_df):
+        """
+        Testa que a classe de volatilidade usa o tipo categórico ordenado do módulo
+        """
+        from src.load.gold_processor import VOLATILITY_CLASS_DTYPE
+
+        daily = processor.calculate_daily_metrics(silver_df)
+        summary = processor.create_currency_summary(processor.calculate_historical_trends(daily))
+
+        assert summary['volatility_class'].dtype == VOLATILITY_CLASS_DTYPE
+        # Volatilidade 0 fica fora de (0, 1], como antes
+        assert pd.isna(summary.set_index('currency').loc['JPY', 'volatility_class'])
+
+    def test_simple_summary_uses_latest_day(self, processor, silver_df):
+        """
+        Testa que o resumo simplificado usa o dia mais recente de cada moeda
+        """
+        daily = processor.calculate_daily_metrics(silver_df)
+        trends = processor.calculate_historical_trends_simple(daily)
+
+        summary = processor.create_currency_summary_simple(trends).set_index('currency')
+        latest = daily.sort_values('date').groupby('currency', observed=True).tail(1).set_index('currency')
+
+        assert summary.loc['USD', 'last_date'] == date(2024, 1, 10)
+        assert summary.loc['JPY', 'last_date'] == date(2024, 1, 1)
+        assert summary.loc['BRL', 'current_rate'] == latest.loc['BRL', 'rate_mean']
+        assert len(summary) == 4
+
+
+class TestMarketOverview:
+    """
+    Testes para o overview do mercado
+    """
+
+    def test_top_performers(self, processor, silver_df):
+        """
+        Testa maiores altas/baixas e volatilidades contra o resumo por moeda
+        """
+        daily = processor.calculate_daily_metrics(silver_df)
+        summary = processor.create_currency_summary(processor.calculate_historical_trends(daily))
+
+        top = processor.create_market_overview(summary)['top_performers']
+        by_currency = summary.set_index('currency')
+
+        assert top['biggest_gainer']['currency'] == by_currency['total_change_pct'].idxmax()
+        assert top['biggest_loser']['change_pct'] == by_currency['total_change_pct'].min()
+        assert top['most_volatile']['currency'] == by_currency['avg_volatility_7d'].idxmax()
+        assert top['most_stable']['volatility'] == by_currency['avg_volatility_7d'].min()
+
+    def test_sentiment_and_volatility_counts(self, processor, silver_df):
+        """
+        Testa as contagens de sentimento e distribuição de volatilidade
+        """
+        daily = processor.calculate_daily_metrics(silver_df)
+        summary = processor.create_currency_summary(processor.calculate_historical_trends(daily))
+
+        overview = processor.create_market_overview(summary)
+        sentiment = overview['market_sentiment']
+
+        assert sentiment['currencies_up'] == (summary['last_daily_change'] > 0).sum()
+        assert sentiment['currencies_down'] == (summary['last_daily_change'] < 0).sum()
+        assert sentiment['currencies_stable'] == (summary['last_daily_change'].abs() <= 0.1).sum()
+        assert isinstance(sentiment['currencies_up'], int)
+        assert sum(overview['volatility_distribution'].values()) == summary['volatility_class'].notna().sum()
+
+
+class TestTrendKernel:
+    """
+    Testes para o kernel de tendências (executado em Python puro sem numba)
+    """
+
+    def test_matches_pandas_path(self, processor, silver_df):
+        """
+        Testa que o kernel reproduz as tendências calculadas pelo pandas
+        """
+        rng = np.random.default_rng(7)
+        # 50 dias para exercitar a saída de elementos da janela de 30
+        long_df = pd.concat([
+            silver_df.assign(collection_date=silver_df['collection_date'] + timedelta(days=offset),
+                             exchange_rate=rng.uniform(1, 6, len(silver_df)))
+            for offset in range(0, 45, 10)
+        ], ignore_index=True)
+        daily = processor.calculate_daily_metrics(long_df)
+
+        expected = processor.calculate_historical_trends(daily)
+        sorted_daily = daily.sort_values(['currency', 'date']).reset_index(drop=True)
+        result = processor._calculate_trends_kernel(sorted_daily)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+
+class TestSaveGoldLayer:
+    """
+    Testes para gravação do Gold Layer
+    """
+
+    def test_parquet_written_with_zstd(self, processor, silver_df):
+        """
+        Testa que os arquivos Parquet do Gold usam zstd e dicionário na moeda
+        """
+        daily = processor.calculate_daily_metrics(silver_df)
+        trends = processor.calculate_historical_trends(daily)
+        summary = processor.create_currency_summary(trends)
+        overview = processor.create_market_overview(summary)
+
+        files = processor.save_gold_layer(daily, trends, summary, overview, date(2024, 1, 10))
+
+        consolidated = pq.ParquetFile(files['consolidated'])
+        column = consolidated.metadata.row_group(0).column(0)
+        assert column.path_in_schema == 'currency'
+        assert column.compression == 'ZSTD'
+        assert any('DICT' in encoding for encoding in column.encodings)
+        assert pq.ParquetFile(files['daily_metrics']).metadata.row_group(0).column(0).compression == 'ZSTD'
+
+    def test_all_outputs_written(self, processor, silver_df):
+        """
+        Testa que os 5 arquivos são gravados (Parquet em paralelo) e legíveis
+        """
+        daily = processor.calculate_daily_metrics(silver_df)
+        trends = processor.calculate_historical_trends(daily)
+        summary = processor.create_currency_summary(trends)
+        overview = processor.create_market_overview(summary)
+
+        files = processor.save_gold_layer(daily, trends, summary, overview, date(2024, 1, 10))
+
+        assert list(files) == ['daily_metrics', 'historical_trends', 'currency_summary',
+                               'market_overview', 'consolidated']
+        assert len(pd.read_parquet(files['historical_trends'])) == len(trends)
+        assert len(pd.read_parquet(files['consolidated'])) == len(summary)
+        assert json.loads(Path(files['market_overview']).read_text(encoding='utf-8'))['total_currencies'] == 4
+
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_overview_with_numpy_values(self, processor, silver_df, has_orjson):
+        """
+        Testa que o overview com escalares NumPy é gravado com orjson e com o json padrão
+        """
+        from src.utils import fast_json
+
+        if has_orjson and not fast_json.HAS_ORJSON:
+            pytest.skip("orjson não instalado")
+
+        daily = processor.calculate_daily_metrics(silver_df)
+        trends = processor.calculate_historical_trends(daily)
+        summary = processor.create_currency_summary(trends)
+        overview = {'total_currencies': np.int64(4), 'max_change': np.float32(1.5), 'período': 'janeiro'}
+
+        with patch.object(fast_json, 'HAS_ORJSON', has_orjson):
+            files = processor.save_gold_layer(daily, trends, summary, overview, date(2024, 1, 10))
+
+        saved = json.loads(Path(files['market_overview']).read_text(encoding='utf-8'))
+        assert saved == {'total_currencies': 4, 'max_change': 1.5, 'período': 'janeiro'}
@@ -4,13 +4,15 @@ Pipeline de Cotações Cambiais - MBA Data Engineering
 
 Este arquivo contém testes para validar:
 1. Funcionamento do DataTransformer
-2. Validação de dados com Pydantic
+2. Validação de dados (modelo Pydantic e validação vetorizada)
 3. Verificações de qualidade dos dados
 4. Conversão para formato Parquet
 """
 
 import pytest
 import pandas as pd
+import numpy as np
+import pyarrow.parquet as pq
 import json
 import tempfile
 from datetime import datetime, date
@@ -18,8 +20,10 @@ from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 
 # Imports do módulo a ser testado
-from src.transform.data_processor import DataTransformer, DataQualityChecker, ExchangeRateRecord
-from src.utils.data_validator import CurrencyValidator, ExchangeRateValidator, TimestampValidator
+from src.transform import data_processor
+from src.transform._quality_kernels import rate_stats_kernel
+from src.transform.data_processor import DataTransformer, DataQualityChecker, ExchangeRateRecord, SILVER_SCHEMA
+from src.utils.data_validator import CurrencyValidator, ExchangeRateValidator, TimestampValidator, generate_validation_summary
 
 
 class TestExchangeRateRecord:
@@ -211,6 +215,62 @@ class TestDataQualityChecker:
         assert 'rate_distribution' in report
         assert 'overall_quality_score' in report
         assert 0 <= report['overall_quality_score'] <= 1
+    
+    def test_generate_quality_report_from_arrow(self):
+        """
+        Testa que o relatório a partir da tabela Arrow é igual ao calculado pelo pandas
+        """
+        df = pd.DataFrame({
+            'base_currency': ['USD', 'USD', None],
+            'target_currency': ['BRL', 'EUR', 'GBP'],
+            'exchange_rate': np.array([5.1, np.nan, -1.0], dtype='float32'),
+            'collection_timestamp': pd.to_datetime(['2024-01-15 10:30:00', None, '2024-01-15 10:30:00']),
+            'collection_date': [date(2024, 1, 15)] * 3,
+            'last_update_timestamp': pd.to_datetime(['2024-01-15 10:00:00'] * 3),
+            'pipeline_version': ['1.0.0'] * 3
+        })
+        
+        expected = self.quality_checker.generate_quality_report(df)
+        report = self.quality_checker.generate_quality_report(df, table=DataTransformer.to_arrow_table(df))
+        
+        for key in ['completeness', 'currency_consistency', 'overall_quality_score', 'quality_issues']:
+            assert report[key] == expected[key]
+        assert report['rate_distribution'] == pytest.approx(expected['rate_distribution'])
+        assert report['completeness']['missing_values']['exchange_rate'] == 1
+
+
+class TestRateStatsKernel:
+    """
+    Testes para o kernel de estatísticas das taxas (executado em Python puro sem numba)
+    """
+    
+    @pytest.mark.parametrize('dtype', [np.float32, np.float64])
+    def test_matches_numpy_path(self, dtype):
+        """
+        Testa que o caminho do kernel reproduz as estatísticas do caminho NumPy
+        """
+        rng = np.random.default_rng(3)
+        rates = np.concatenate([rng.uniform(0.001, 1000, 500), [0.0, -1.0, np.nan, 2e6]]).astype(dtype)
+        
+        expected = data_processor._rate_stats(rates)
+        with patch.object(data_processor, 'HAS_NUMBA', True), \
+                patch.object(data_processor, 'NUMBA_MIN_ROWS', 0):
+            result = data_processor._rate_stats(rates)
+        
+        assert result == pytest.approx(expected, rel=1e-5)
+        assert (result['zero_rates'], result['negative_rates'], result['extreme_rates']) == (1, 1, 1)
+    
+    def test_empty_and_single_value(self):
+        """
+        Testa os casos sem valores e com um único valor (desvio indefinido)
+        """
+        count, low, high, mean, std, *counts = rate_stats_kernel(np.array([np.nan]))
+        assert count == 0 and np.isnan(low) and np.isnan(std)
+        assert counts == [0, 0, 0]
+        
+        count, low, high, mean, std, *counts = rate_stats_kernel(np.array([5.0]))
+        assert (count, low, high, mean) == (1, 5.0, 5.0, 5.0)
+        assert np.isnan(std)
 
 
 class TestDataTransformer:
@@ -281,6 +341,25 @@ class TestDataTransformer:
         assert 'pipeline_metadata' in loaded_data
         assert 'api_response' in loaded_data
     
+    def test_load_raw_data_mmap(self):
+        """
+        Testa a leitura via mmap (usada para arquivos grandes quando orjson está disponível)
+        """
+        from src.utils import fast_json
+        
+        if not fast_json.HAS_ORJSON:
+            pytest.skip("orjson não instalado")
+        
+        date_str = '2024-01-15'
+        expected_data = self.create_sample_raw_data(date_str)
+        
+        with patch.object(fast_json, 'MMAP_MIN_BYTES', 0), \
+                patch.object(fast_json.mmap, 'mmap', wraps=fast_json.mmap.mmap) as mock_mmap:
+            loaded_data = self.transformer.load_raw_data(date_str)
+        
+        assert loaded_data == expected_data
+        mock_mmap.assert_called_once()
+    
     def test_load_raw_data_file_not_found(self):
         """
         Testa comportamento quando arquivo não existe
@@ -310,14 +389,16 @@ class TestDataTransformer:
             }
         }
         
-        records = self.transformer.transform_to_tabular(raw_data)
+        columns = self.transformer.transform_to_tabular(raw_data)
         
-        assert len(records) == 2  # BRL e EUR
-        assert records[0]['base_currency'] == 'USD'
-        assert records[0]['target_currency'] == 'BRL'
-        assert records[0]['exchange_rate'] == 5.1234
-        assert records[1]['target_currency'] == 'EUR'
-        assert records[1]['exchange_rate'] == 0.8456
+        assert all(len(values) == 2 for values in columns.values())  # BRL e EUR
+        assert list(columns['base_currency']) == ['USD', 'USD']
+        assert list(columns['target_currency']) == ['BRL', 'EUR']
+        assert columns['exchange_rate'].dtype == np.float64
+        assert list(columns['exchange_rate']) == [5.1234, 0.8456]
+        assert list(columns['pipeline_version']) == ['1.0.0', '1.0.0']
+        assert columns['collection_timestamp'].dtype == 'datetime64[ns]'
+        assert columns['collection_timestamp'][0] == np.datetime64('2024-01-15T10:30:00.123456')
     
     def test_validate_records_success(self):
         """
@@ -344,12 +425,12 @@ class TestDataTransformer:
             }
         ]
         
-        validated_records = self.transformer.validate_records(records)
+        validated_df = self.transformer.validate_records(records)
         
-        assert len(validated_records) == 2
-        assert all(isinstance(record, ExchangeRateRecord) for record in validated_records)
-        assert validated_records[0].base_currency == 'USD'
-        assert validated_records[0].target_currency == 'BRL'
+        assert len(validated_df) == 2
+        assert list(validated_df.columns) == list(ExchangeRateRecord.model_fields)
+        assert validated_df.iloc[0]['base_currency'] == 'USD'
+        assert validated_df.iloc[0]['target_currency'] == 'BRL'
     
     def test_validate_records_with_invalid_data(self):
         """
@@ -376,29 +457,104 @@ class TestDataTransformer:
             }
         ]
         
-        validated_records = self.transformer.validate_records(records)
+        validated_df = self.transformer.validate_records(records)
         
         # Apenas o primeiro registro deve ser válido
-        assert len(validated_records) == 1
-        assert validated_records[0].target_currency == 'BRL'
+        assert len(validated_df) == 1
+        assert validated_df.iloc[0]['target_currency'] == 'BRL'
+    
+    def test_validate_records_matches_pydantic_rules(self):
+        """
+        Testa que a validação vetorizada aplica as mesmas regras e normalizações do modelo
+        """
+        base = {
+            'base_currency': 'usd',
+            'target_currency': 'BRL',
+            'exchange_rate': 5.123456789,
+            'collection_timestamp': datetime(2024, 1, 15, 10, 30, 0),
+            'collection_date': date(2024, 1, 15),
+            'last_update_timestamp': datetime(2024, 1, 15, 10, 0, 0),
+            'pipeline_version': '1.0.0'
+        }
+        records = [
+            base,
+            {**base, 'target_currency': 'B1L'},
+            {**base, 'target_currency': 'ÇÃO'},
+            {**base, 'target_currency': 'BR\n'},
+            {**base, 'exchange_rate': 2000000.0},
+            {**base, 'exchange_rate': float('inf')},
+            {**base, 'exchange_rate': 0.0},
+            {**base, 'collection_timestamp': datetime(1999, 1, 15)},
+            {**base, 'last_update_timestamp': datetime(2031, 1, 15)},
+            {key: value for key, value in base.items() if key != 'pipeline_version'}
+        ]
+        
+        validated_df = self.transformer.validate_records(records)
+        
+        assert len(validated_df) == 1
+        row = validated_df.iloc[0]
+        model = ExchangeRateRecord(**base)
+        assert row['base_currency'] == model.base_currency == 'USD'
+        assert row['exchange_rate'] == model.exchange_rate
+        for record in records[1:3]:
+            with pytest.raises(ValueError):
+                ExchangeRateRecord(**record)
+    
+    def test_validate_records_untrusted_uses_model(self):
+        """
+        Testa que o caminho não confiável valida com o modelo e chega ao mesmo resultado
+        """
+        base = {
+            'base_currency': 'usd',
+            'target_currency': 'BRL',
+            'exchange_rate': 5.123456789,
+            'collection_timestamp': datetime(2024, 1, 15, 10, 30, 0),
+            'collection_date': date(2024, 1, 15),
+            'last_update_timestamp': datetime(2024, 1, 15, 10, 0, 0),
+            'pipeline_version': '1.0.0'
+        }
+        records = [base, {**base, 'target_currency': 'B1L'},
+                   {key: value for key, value in base.items() if key != 'pipeline_version'}]
+        
+        with patch.object(ExchangeRateRecord, 'model_validate', wraps=ExchangeRateRecord.model_validate) as validate:
+            untrusted_df = self.transformer.validate_records(records, trusted=False)
+        
+        assert validate.call_count == 3
+        pd.testing.assert_frame_equal(untrusted_df, self.transformer.validate_records(records))
+    
+    def test_validate_records_accepts_columns(self):
+        """
+        Testa validação a partir de um dicionário de colunas
+        """
+        columns = {
+            'base_currency': ['USD', 'USD'],
+            'target_currency': ['BRL', 'XX'],
+            'exchange_rate': [5.1234, 0.8456],
+            'collection_timestamp': [datetime(2024, 1, 15, 10, 30, 0)] * 2,
+            'collection_date': [date(2024, 1, 15)] * 2,
+            'last_update_timestamp': [datetime(2024, 1, 15, 10, 0, 0)] * 2,
+            'pipeline_version': ['1.0.0'] * 2
+        }
+        
+        validated_df = self.transformer.validate_records(columns)
+        
+        assert list(validated_df['target_currency']) == ['BRL']
     
     def test_create_dataframe(self):
         """
         Testa criação de DataFrame
         """
-        validated_records = [
-            ExchangeRateRecord(
-                base_currency='USD',
-                target_currency='BRL',
-                exchange_rate=5.1234,
-                collection_timestamp=datetime(2024, 1, 15, 10, 30, 0),
-                collection_date=date(2024, 1, 15),
-                last_update_timestamp=datetime(2024, 1, 15, 10, 0, 0),
-                pipeline_version='1.0.0'
-            )
-        ]
+        validated_df = self.transformer.validate_records([{
+            'base_currency': 'USD',
+            'target_currency': 'BRL',
+            'exchange_rate': 5.1234,
+            'collection_timestamp': datetime(2024, 1, 15, 10, 30, 0),
+            'collection_date': date(2024, 1, 15),
+            'last_update_timestamp': datetime(2024, 1, 15, 10, 0, 0),
+            'pipeline_version': '1.0.0'
+        }])
         
-        df = self.transformer.create_dataframe(validated_records)
+        df = self.transformer.create_dataframe(validated_df)
         
         assert len(df) == 1
         assert 'base_currency' in df.columns
@@ -406,16 +562,23 @@ class TestDataTransformer:
         assert 'exchange_rate' in df.columns
         assert df.iloc[0]['base_currency'] == 'USD'
         assert df.iloc[0]['target_currency'] == 'BRL'
+        assert df['base_currency'].dtype == 'category'
+        assert df['pipeline_version'].dtype == 'category'
+        assert df['exchange_rate'].dtype == np.float32
     
-    @patch('pandas.DataFrame.to_parquet')
-    def test_save_to_parquet(self, mock_to_parquet):
+    @patch('src.transform.data_processor.pq.write_table')
+    def test_save_to_parquet(self, mock_write_table):
         """
         Testa salvamento em formato Parquet
         """
         df = pd.DataFrame({
             'base_currency': ['USD'],
             'target_currency': ['BRL'],
-            'exchange_rate': [5.1234]
+            'exchange_rate': np.array([5.1234], dtype='float32'),
+            'collection_timestamp': pd.to_datetime(['2024-01-15 10:30:00']),
+            'collection_date': [date(2024, 1, 15)],
+            'last_update_timestamp': pd.to_datetime(['2024-01-15 10:00:00']),
+            'pipeline_version': ['1.0.0']
         })
         
         # Mock do arquivo salvo
@@ -426,7 +589,37 @@ class TestDataTransformer:
             result_path = self.transformer.save_to_parquet(df, '2024-01-15')
         
         assert str(expected_path) in result_path
-        mock_to_parquet.assert_called_once()
+        mock_write_table.assert_called_once()
+        assert mock_write_table.call_args[0][0].schema == SILVER_SCHEMA
+    
+    def test_save_to_parquet_roundtrip(self):
+        """
+        Testa que o arquivo gravado com o schema Silver é lido de volta sem perdas
+        """
+        df = pd.DataFrame({
+            'base_currency': ['USD', 'USD'],
+            'target_currency': ['BRL', 'EUR'],
+            'exchange_rate': np.array([5.1234, 0.8456], dtype='float32'),
+            'collection_timestamp': pd.to_datetime(['2024-01-15 10:30:00.123456'] * 2),
+            'collection_date': [date(2024, 1, 15)] * 2,
+            'last_update_timestamp': pd.to_datetime(['2024-01-15 10:00:00'] * 2),
+            'pipeline_version': ['1.0.0', '1.0.0']
+        })
+        
+        result_path = self.transformer.save_to_parquet(df, '2024-01-15')
+        
+        pd.testing.assert_frame_equal(pd.read_parquet(result_path), df)
+        
+        # Dicionário nas moedas/versão e BYTE_STREAM_SPLIT na taxa
+        row_group = pq.ParquetFile(result_path).metadata.row_group(0)
+        encodings = {
+            row_group.column(i).path_in_schema: row_group.column(i).encodings
+            for i in range(row_group.num_columns)
+        }
+        for column in ['base_currency', 'target_currency', 'pipeline_version']:
+            assert 'RLE_DICTIONARY' in encodings[column]
+        assert 'BYTE_STREAM_SPLIT' in encodings['exchange_rate']
+        assert 'RLE_DICTIONARY' not in encodings['exchange_rate']
     
     def test_process_date_integration(self):
         """
@@ -435,7 +628,7 @@ class TestDataTransformer:
         date_str = '2024-01-15'
         self.create_sample_raw_data(date_str)
         
-        with patch('pandas.DataFrame.to_parquet') as mock_to_parquet:
+        with patch('src.transform.data_processor.pq.write_table') as mock_write_table:
             with patch('pathlib.Path.stat') as mock_stat:
                 mock_stat.return_value.st_size = 2048
                 
@@ -446,6 +639,24 @@ class TestDataTransformer:
         assert 'execution_time_seconds' in report
         assert report['processing']['validated_records'] > 0
         assert report['quality']['overall_quality_score'] > 0
+    
+    def test_process_dates_parallel(self):
+        """
+        Testa o processamento de várias datas em processos separados
+        """
+        for date_str in ['2024-01-15', '2024-01-16']:
+            self.create_sample_raw_data(date_str)
+        
+        reports = self.transformer.process_dates(
+            ['2024-01-15', date(2024, 1, 16), '2024-01-17'], max_workers=2
+        )
+        
+        # Relatórios na ordem de entrada; a data sem arquivo Raw falha isoladamente
+        assert [r['target_date'] for r in reports] == ['2024-01-15', '2024-01-16', '2024-01-17']
+        assert [r['status'] for r in reports] == ['success', 'success', 'error']
+        assert reports[2]['error_type'] == 'FileNotFoundError'
+        for report in reports[:2]:
+            assert Path(report['output']['silver_file']).exists()
 
 
 class TestCurrencyValidator:
@@ -472,6 +683,19 @@ class TestCurrencyValidator:
         for code in invalid_codes:
             assert not CurrencyValidator.is_valid_currency_code(code)
     
+    def test_is_valid_currency_code_vec_matches_scalar(self):
+        """
+        Testa se a versão vetorizada concorda com a validação por elemento
+        """
+        codes = ['USD', 'eur', 'US', 'USDX', '123', '', None, 'XYZ', ' brl ', 123, b'USD', float('nan')]
+        
+        result = CurrencyValidator.is_valid_currency_code_vec(codes)
+        
+        assert list(result) == [CurrencyValidator.is_valid_currency_code(code) for code in codes]
+        
+        # Sem nenhuma string, tudo inválido
+        assert not CurrencyValidator.is_valid_currency_code_vec([1, 2.5, None]).any()
+    
     def test_validate_currency_pair_success(self):
         """
         Testa validação bem-sucedida de par de moedas
@@ -514,6 +738,30 @@ class TestExchangeRateValidator:
         for rate in invalid_rates:
             assert not ExchangeRateValidator.is_valid_rate(rate)
     
+    def test_is_valid_rate_vec_matches_scalar(self):
+        """
+        Testa se a versão vetorizada concorda com a validação por elemento
+        """
+        rates = [0.1, 1.0, 999.99, -1.0, 0.0, float('inf'), float('nan'), 2000000.0, 'abc', None, '5.5']
+        
+        result = ExchangeRateValidator.is_valid_rate_vec(rates)
+        
+        assert list(result) == [ExchangeRateValidator.is_valid_rate(rate) for rate in rates]
+    
+    def test_validation_summary_with_non_numeric_rate(self):
+        """
+        Testa que uma taxa não numérica marca all_valid=False em vez de quebrar o resumo
+        """
+        df = pd.DataFrame({
+            'base_currency': ['USD', 'USD', 'USD'],
+            'target_currency': ['BRL', 'EUR', 'GBP'],
+            'exchange_rate': [5.1, 'abc', 0.79]
+        })
+        
+        summary = generate_validation_summary(df)
+        
+        assert summary['validation_results']['exchange_rates']['all_valid'] is False
+    
     def test_detect_outliers_iqr(self):
         """
         Testa detecção de outliers usando IQR